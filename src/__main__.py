@@ -1,9 +1,126 @@
 """Entry point for running the genetic algorithm with YAML configuration."""
 
+import argparse
+
+import numpy as np
+
+from src.classes.CellularRunner import CellularRunner
+from src.classes.DistributionRunner import ALGORITHMS, DistributionRunner
 from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.IslandRunner import IslandRunner
+from src.classes.ParameterlessRunner import ParameterlessRunner
+from src.classes.RandomKeyRunner import RandomKeyRunner
+from src.classes.SweepExecutor import SweepExecutor
+from src.methods.cellular import NEIGHBORHOODS
+from src.methods.migration import TOPOLOGIES
+from src.methods.replay import replay_population
 from src.methods.utils import load_yaml_config
 
 if __name__ == "__main__":
-    config = load_yaml_config("config.yaml")
-    runner = EvolutionRunner(config)
-    runner.evolve()
+    parser = argparse.ArgumentParser(description="Run the knapsack genetic algorithm.")
+    parser.add_argument(
+        "--config", default="config.yaml", help="Path to the YAML configuration."
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="CHECKPOINT",
+        help="Continue a run from a checkpoint manifest or run directory.",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="RUN",
+        help="Rebuild a generation of a run recorded with record_rng_states.",
+    )
+    parser.add_argument(
+        "--generation", type=int, help="Generation rebuilt by --replay."
+    )
+    parser.add_argument(
+        "--output",
+        help="Where --replay saves the population (.npy). "
+        "Defaults to replay_g<generation>.npy.",
+    )
+    parser.add_argument(
+        "--parameterless",
+        action="store_true",
+        help="Race populations of doubling size under budget.evaluation_budget.",
+    )
+    parser.add_argument(
+        "--eda",
+        choices=ALGORITHMS,
+        help="Evolve a probability vector (PBIL or compact GA) instead of a "
+        "population.",
+    )
+    parser.add_argument(
+        "--random-keys",
+        action="store_true",
+        help="Evolve priority key vectors decoded greedily into feasible solutions.",
+    )
+    parser.add_argument(
+        "--cellular",
+        choices=NEIGHBORHOODS,
+        help="Evolve a population on a torus grid, mating within the given "
+        "neighborhood.",
+    )
+    parser.add_argument(
+        "--sweep",
+        metavar="SWEEP",
+        help="Run a grid of configurations x seeds from a YAML file in parallel, "
+        "on top of --config.",
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        metavar="P",
+        help="Evolve P islands of population_size individuals in parallel "
+        "processes with migration.",
+    )
+    parser.add_argument(
+        "--migration-interval",
+        type=int,
+        default=10,
+        help="Generations between migrations in --islands mode.",
+    )
+    parser.add_argument(
+        "--migrants",
+        type=int,
+        default=1,
+        help="Individuals every island receives per migration.",
+    )
+    parser.add_argument(
+        "--topology",
+        choices=TOPOLOGIES,
+        default="ring",
+        help="Which island sends migrants to which in --islands mode.",
+    )
+    args = parser.parse_args()
+    if args.replay is not None:
+        if args.generation is None:
+            parser.error("--replay requires --generation")
+        population, _ = replay_population(args.replay, args.generation)
+        np.save(args.output or f"replay_g{args.generation}.npy", population)
+    elif args.sweep is not None:
+        SweepExecutor.from_yaml(load_yaml_config(args.config), args.sweep).run()
+    elif args.islands is not None:
+        IslandRunner(
+            load_yaml_config(args.config),
+            islands=args.islands,
+            migration_interval=args.migration_interval,
+            migrants=args.migrants,
+            topology=args.topology,
+        ).evolve()
+    elif args.eda is not None:
+        DistributionRunner(load_yaml_config(args.config), algorithm=args.eda).evolve()
+    elif args.cellular is not None:
+        CellularRunner(
+            load_yaml_config(args.config), neighborhood=args.cellular
+        ).evolve()
+    elif args.random_keys:
+        RandomKeyRunner(load_yaml_config(args.config)).evolve()
+    elif args.parameterless:
+        ParameterlessRunner(load_yaml_config(args.config)).evolve()
+    else:
+        if args.resume is not None:
+            runner = EvolutionRunner.resume(args.resume)
+        else:
+            runner = EvolutionRunner(load_yaml_config(args.config))
+        runner.evolve()
@@ -0,0 +1,238 @@
+"""Run a cellular genetic algorithm on a torus grid."""
+
+import os
+
+import numpy as np
+import src.methods.logging_library as log
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.GenerationStats import GenerationStats
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.PathResolver import PathResolver
+from src.classes.Timer import Timer
+from src.methods.cellular import (
+    NEIGHBORHOODS,
+    cellular_offspring,
+    fitness_ranks,
+    grid_shape,
+    neighborhood_tournament,
+)
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.fitness_score import fitness_calculation
+from src.methods.utils import load_data
+
+
+class CellularRunner:
+    """Evolves a population placed on a 2D torus, mating only neighbours.
+
+    Individuals are stored in row-major grid order in a memmap in the temp
+    directory; the grid is the most square one holding ``population_size``
+    cells. Every generation each cell picks a mate by a binary tournament in
+    its ``von_neumann`` or ``moore`` neighbourhood, produces one child with the
+    configured crossover and mutation, and is replaced by it unless the child
+    is worse. All cells are updated synchronously from the previous grid.
+
+    Cells are processed in stream batches of ``stream_batch_size`` rows into
+    a second memmap, which then replaces the population. ``selection_type`` is
+    not used. Stats are written to the usual CSV table with an extra
+    ``replaced`` column counting the cells taken over by their child.
+    """
+
+    def __init__(self, input_config: dict, neighborhood: str = "von_neumann") -> None:
+        """Prepare the environment and the grid.
+
+        Args:
+            input_config (dict): Raw configuration values from the user.
+            neighborhood (str): ``von_neumann`` or ``moore``.
+
+        Raises:
+            ValueError: If the neighbourhood is unknown or the grid has fewer
+                than 3 rows, so neighbour offsets would wrap onto the cell
+                itself or onto the same neighbour twice.
+        """
+        if neighborhood not in NEIGHBORHOODS:
+            raise ValueError(f"Invalid neighborhood: {neighborhood}")
+        self.config = ExperimentConfig(**input_config)
+        self.grid = grid_shape(self.config.population_size)
+        if self.grid[0] < 3:
+            raise ValueError(
+                f"Population size {self.config.population_size} gives a "
+                f"{self.grid[0]}x{self.grid[1]} grid; the cellular GA needs at "
+                "least 3 rows"
+            )
+        self.neighborhood = neighborhood
+        self.paths = PathResolver()
+        self.value_weight_array = load_data(
+            self.paths.get_dict_filepath(self.config.data_filename)
+        )
+        self.values = self.value_weight_array[:, 0]
+        self.weights = self.value_weight_array[:, 1]
+        assert self.config.rng is not None and self.config.stream_batch_size
+        self.rng = self.config.rng
+        self.batch = self.config.stream_batch_size
+        self.shape = (self.config.population_size, self.value_weight_array.shape[0])
+
+        filename_constant = create_unique_experiment_name(
+            config=self.config,
+            genome_length=self.value_weight_array.shape[0],
+        )
+        self.paths.initialize(filename_constant=f"{filename_constant}-cellular")
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self.timer = Timer(self.logger, self.config)
+        self.csv_logger = OutputGenerator(self.paths, self.config)
+        self.csv_logger.init_csv(
+            self.config,
+            extra_meta={
+                "neighborhood": neighborhood,
+                "grid": f"{self.grid[0]}x{self.grid[1]}",
+            },
+            extra_columns=("replaced",),
+        )
+
+        temp = self.paths.get_temp_path()
+        self.population_path = temp / f"grid_{self.paths.filename_constant}.dat"
+        self.next_path = temp / f"next_grid_{self.paths.filename_constant}.dat"
+        self.fitness = np.empty((self.shape[0], 2), dtype=np.int64)
+        self.best_fitness = -1
+        self.evaluations = 0
+
+    def evolve(self) -> GenerationStats:
+        """Run all generations.
+
+        Returns:
+            GenerationStats: Stats of the last generation.
+        """
+        try:
+            self.timer.start(0)
+            self._initialize_grid()
+            stats = self._log_generation(0, replaced=0)
+            self.timer.stop(0)
+            for iteration in range(1, self.config.generations + 1):
+                self.timer.start(iteration)
+                replaced = self._run_generation()
+                stats = self._log_generation(iteration, replaced)
+                self.timer.stop(iteration)
+        finally:
+            self.csv_logger.write_metadata("evaluations", self.evaluations)
+            self.csv_logger.write_metadata("best_fitness", self.best_fitness)
+            self.csv_logger.close()
+            self.paths.cleanup_temp_dir()
+        return stats
+
+    def _initialize_grid(self) -> None:
+        """Sample and score the initial grid like the initial GA population."""
+        probability = self.config.generate_probability_of_failure(self.weights.sum())
+        population = np.memmap(
+            self.population_path, dtype=np.uint8, mode="w+", shape=self.shape
+        )
+        for start in range(0, self.shape[0], self.batch):
+            stop = min(start + self.batch, self.shape[0])
+            draws = self.rng.random((stop - start, self.shape[1]), dtype=np.float32)
+            population[start:stop] = draws < probability
+            self.fitness[start:stop] = self._score(population[start:stop])
+        population.flush()
+        del population
+
+    def _run_generation(self) -> int:
+        """Replace every cell by its child unless the child is worse.
+
+        Returns:
+            int: Number of replaced cells.
+        """
+        mates = neighborhood_tournament(
+            self.fitness, self.grid, self.neighborhood, self.rng
+        )
+        population = np.memmap(
+            self.population_path, dtype=np.uint8, mode="r", shape=self.shape
+        )
+        next_population = np.memmap(
+            self.next_path, dtype=np.uint8, mode="w+", shape=self.shape
+        )
+        next_fitness = np.empty_like(self.fitness)
+        replaced = 0
+        for start in range(0, self.shape[0], self.batch):
+            stop = min(start + self.batch, self.shape[0])
+            cells = np.asarray(population[start:stop])
+            children = cellular_offspring(
+                cells,
+                population[mates[start:stop]],
+                self.config.crossover_type,
+                self.config.crossover_probability,
+                self.config.mutation_probability,
+                self.rng,
+            )
+            child_fitness = self._score(children)
+            parent_fitness = self.fitness[start:stop]
+            accepted = (child_fitness[:, 0] > parent_fitness[:, 0]) | (
+                (child_fitness[:, 0] == parent_fitness[:, 0])
+                & (child_fitness[:, 1] <= parent_fitness[:, 1])
+            )
+            next_population[start:stop] = np.where(accepted[:, None], children, cells)
+            next_fitness[start:stop] = np.where(
+                accepted[:, None], child_fitness, parent_fitness
+            )
+            replaced += int(accepted.sum())
+        next_population.flush()
+        del population, next_population
+        os.replace(self.next_path, self.population_path)
+        self.fitness = next_fitness
+        return replaced
+
+    def _score(self, genomes: np.ndarray) -> np.ndarray:
+        """Return the [fitness, weight] array of a batch of genomes."""
+        self.evaluations += len(genomes)
+        return fitness_calculation(
+            max_weight=self.config.max_weight,
+            penalty_factor=self.config.penalty,
+            population=genomes,  # type: ignore[arg-type]
+            batch=len(genomes),
+            value_arr=self.values,
+            weight_arr=self.weights,
+        )
+
+    def _log_generation(self, iteration: int, replaced: int) -> GenerationStats:
+        """Compute and log the stats of the current grid.
+
+        Args:
+            iteration (int): Number of the generation.
+            replaced (int): Number of cells replaced in this generation.
+
+        Returns:
+            GenerationStats: Stats of the grid.
+        """
+        ranks = fitness_ranks(self.fitness)
+        best_idx = int(np.argmin(ranks))
+        best = self.fitness[best_idx]
+        worst = self.fitness[int(np.argmax(ranks))]
+        population = np.memmap(
+            self.population_path, dtype=np.uint8, mode="r", shape=self.shape
+        )
+        genome = population[best_idx].tolist()
+        del population
+        self.best_fitness = max(self.best_fitness, int(best[0]))
+        stats = GenerationStats(
+            iteration=iteration,
+            best_idx=best_idx,
+            best_fitness=int(best[0]),
+            best_weight=int(best[1]),
+            avg_fitness=float(self.fitness[:, 0].mean()),
+            worst_fitness=int(worst[0]),
+            worst_weight=int(worst[1]),
+            identical_best_count=int(np.sum(np.all(self.fitness == best, axis=1))) - 1,
+            genome="".join(str(gene) for gene in genome),
+        )
+        self.logger.info(
+            f"Generation {iteration}: best fitness {stats.best_fitness}, "
+            f"replaced cells {replaced}"
+        )
+        self.csv_logger.write_iteration(
+            iteration=iteration,
+            best_fitness=stats.best_fitness,
+            best_weight=stats.best_weight,
+            avg_fitness=stats.avg_fitness,
+            worst_fitness=stats.worst_fitness,
+            worst_weight=stats.worst_weight,
+            identical_best_count=stats.identical_best_count,
+            genome=stats.genome,
+            extra=(replaced,),
+        )
+        return stats
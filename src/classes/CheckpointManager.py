@@ -0,0 +1,192 @@
+"""Module writing and restoring periodic checkpoints of a running experiment."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from time import perf_counter
+from typing import Any, BinaryIO, Callable
+
+import numpy as np
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.PathResolver import PathResolver
+from src.methods.memmap_operations import create_memmap_config_json
+
+MANIFEST_SUFFIX = ".checkpoint.json"
+
+
+class CheckpointManager:
+    """Writes atomic checkpoints every k generations or every T seconds.
+
+    A checkpoint consists of a copy of the population memmap, the fitness array
+    and a JSON manifest holding everything else needed to continue the run
+    (RNG state, CSV offset, counters and the raw configuration). Data files are
+    named after their generation and the manifest is replaced last, so a crash
+    at any moment leaves the previous checkpoint intact. Files of the previous
+    checkpoint are removed once the new manifest is in place.
+    """
+
+    def __init__(self, paths: PathResolver, config: ExperimentConfig) -> None:
+        """Stores the checkpoint schedule and target directory.
+
+        Args:
+            paths (PathResolver): Resolver bound to the run being checkpointed.
+            config (ExperimentConfig): Configuration with the checkpoint schedule.
+        """
+        self.paths = paths
+        self.interval = config.checkpoint_interval
+        self.seconds = config.checkpoint_seconds
+        self._last_save = perf_counter()
+        self._files: list[Path] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any checkpoint schedule is configured."""
+        return self.interval is not None or self.seconds is not None
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the manifest of the current run."""
+        return (
+            self.paths.get_checkpoint_path()
+            / f"{self.paths.filename_constant}{MANIFEST_SUFFIX}"
+        )
+
+    def due(self, iteration: int) -> bool:
+        """Whether a checkpoint should be written after this generation.
+
+        Args:
+            iteration (int): Number of the generation that just finished.
+
+        Returns:
+            bool: ``True`` if the generation or time schedule is met.
+        """
+        if self.interval is not None and iteration % self.interval == 0:
+            return True
+        return (
+            self.seconds is not None
+            and perf_counter() - self._last_save >= self.seconds
+        )
+
+    def save(self, iteration: int, fitness: np.ndarray, state: dict[str, Any]) -> Path:
+        """Atomically writes a checkpoint of the current population.
+
+        Args:
+            iteration (int): Number of the last finished generation.
+            fitness (np.ndarray): Fitness array of the current population.
+            state (dict[str, Any]): JSON-serializable run state stored in the
+                manifest.
+
+        Returns:
+            Path: Path of the written manifest.
+        """
+        directory = self.paths.get_checkpoint_path()
+        directory.mkdir(parents=True, exist_ok=True)
+        tag = f"{self.paths.filename_constant}_g{iteration:07d}"
+        population = directory / f"{tag}.dat"
+        fitness_path = directory / f"{tag}_fitness.npy"
+
+        source = self.paths.get_temp_path() / f"{self.paths.filename_constant}.dat"
+        _atomic_write(population, lambda file: _copy_into(source, file))
+        _atomic_write(fitness_path, lambda file: np.save(file, fitness))
+        manifest = {
+            **state,
+            "iteration": iteration,
+            "population": population.name,
+            "fitness": fitness_path.name,
+        }
+        _atomic_write(
+            self.manifest_path,
+            lambda file: file.write(json.dumps(manifest, indent=4).encode()),
+        )
+
+        for stale in self._files:
+            stale.unlink(missing_ok=True)
+        self._files = [population, fitness_path]
+        self._last_save = perf_counter()
+        return self.manifest_path
+
+    def restore(self, manifest: dict[str, Any]) -> np.ndarray:
+        """Copies the checkpointed population into the run's temp directory.
+
+        Args:
+            manifest (dict[str, Any]): Manifest returned by ``load``.
+
+        Checkpoint files are only replaced by later checkpoints if they belong
+        to this run's checkpoint directory.
+
+        Returns:
+            np.ndarray: The checkpointed fitness array.
+        """
+        directory = Path(manifest["directory"])
+        temp = self.paths.get_temp_path()
+        dat_path = temp / f"{self.paths.filename_constant}.dat"
+        shutil.copyfile(directory / manifest["population"], dat_path)
+        population_size, genome_length = manifest["population_shape"]
+        create_memmap_config_json(
+            temp / f"{self.paths.filename_constant}.json",
+            dat_path,
+            np.uint8,
+            population_size,
+            genome_length,
+        )
+        if directory == self.paths.get_checkpoint_path().resolve():
+            self._files = [
+                directory / manifest["population"],
+                directory / manifest["fitness"],
+            ]
+        return np.load(directory / manifest["fitness"])
+
+    @staticmethod
+    def load(path: str | Path) -> dict[str, Any]:
+        """Reads a checkpoint manifest.
+
+        Args:
+            path (str | Path): A manifest file, a checkpoint directory or a run
+                directory containing ``checkpoints``. If a directory holds
+                several manifests, the most recently written one is used.
+
+        Raises:
+            FileNotFoundError: If no manifest can be found.
+
+        Returns:
+            dict[str, Any]: The manifest, with ``directory`` set to the
+                directory holding the checkpoint files.
+        """
+        path = Path(path)
+        if path.is_dir():
+            if (path / "checkpoints").is_dir():
+                path = path / "checkpoints"
+            manifests = sorted(
+                path.glob(f"*{MANIFEST_SUFFIX}"), key=lambda p: p.stat().st_mtime
+            )
+            if not manifests:
+                raise FileNotFoundError(f"No checkpoint found in {path}")
+            path = manifests[-1]
+        if not path.exists():
+            raise FileNotFoundError(f"{path} does not exist")
+        with open(path, "r") as file:
+            manifest = json.load(file)
+        manifest["directory"] = str(path.parent.resolve())
+        return manifest
+
+
+def _copy_into(source: Path, file: BinaryIO) -> None:
+    """Streams ``source`` into an open binary file."""
+    with open(source, "rb") as src:
+        shutil.copyfileobj(src, file)
+
+
+def _atomic_write(path: Path, write: Callable[[BinaryIO], object]) -> None:
+    """Writes a file through a synced temporary file and ``os.replace``.
+
+    Args:
+        path (Path): Final destination.
+        write (Callable[[BinaryIO], object]): Writes the content to an open file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as file:
+        write(file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
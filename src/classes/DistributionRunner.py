@@ -0,0 +1,264 @@
+"""Run an estimation-of-distribution algorithm (PBIL or compact GA)."""
+
+import numpy as np
+import src.methods.logging_library as log
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.GenerationStats import GenerationStats
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.PathResolver import PathResolver
+from src.classes.Timer import Timer
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.fitness_score import fitness_calculation
+from src.methods.utils import load_data
+
+ALGORITHMS = ("pbil", "cga")
+CONVERGENCE_MARGIN = 1e-3
+CONVERGED = "converged"
+GENERATIONS_COMPLETED = "generations_completed"
+
+
+class DistributionRunner:
+    """Evolves a per-gene probability vector instead of a population.
+
+    Every generation ``population_size`` candidates are sampled from the
+    vector in stream batches of ``stream_batch_size`` rows and scored with
+    ``fitness_calculation``; nothing is stored on disk. The state is O(L):
+
+    * ``pbil``: the vector moves towards the best sample of the generation by
+      ``learning_rate``; each locus is then shifted towards a random bit with
+      ``mutation_probability``.
+    * ``cga``: samples are compared in pairs and every differing locus moves by
+      ``1 / virtual_population`` towards the winner, simulating a population of
+      that size.
+
+    Selection, crossover and the population memmap of ``EvolutionRunner`` are
+    not used. Stats are written to the usual CSV table.
+    """
+
+    def __init__(
+        self,
+        input_config: dict,
+        algorithm: str = "pbil",
+        learning_rate: float | None = None,
+        mutation_shift: float | None = None,
+        virtual_population: int | None = None,
+    ) -> None:
+        """Prepare the environment and the initial probability vector.
+
+        Args:
+            input_config (dict): Raw configuration values from the user.
+                ``population_size`` is the number of samples per generation.
+            algorithm (str): ``pbil`` or ``cga``.
+            learning_rate (float | None): PBIL step towards the best sample.
+                Overrides the configured ``learning_rate``.
+            mutation_shift (float | None): PBIL step of a mutated locus
+                towards a random bit. Overrides the configured
+                ``mutation_shift``.
+            virtual_population (int | None): Population size simulated by the
+                compact GA. Overrides the configured ``virtual_population``,
+                which defaults to ``population_size``.
+
+        Raises:
+            ValueError: If the algorithm or its parameters are invalid.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Invalid distribution algorithm: {algorithm}")
+        overrides = {
+            key: value
+            for key, value in (
+                ("learning_rate", learning_rate),
+                ("mutation_shift", mutation_shift),
+                ("virtual_population", virtual_population),
+            )
+            if value is not None
+        }
+        self.config = ExperimentConfig(**{**input_config, **overrides})
+        self.algorithm = algorithm
+        self.learning_rate = self.config.learning_rate
+        self.mutation_shift = self.config.mutation_shift
+        self.virtual_population = (
+            self.config.virtual_population or self.config.population_size
+        )
+        self.paths = PathResolver()
+        self.value_weight_array = load_data(
+            self.paths.get_dict_filepath(self.config.data_filename)
+        )
+        self.values = self.value_weight_array[:, 0]
+        self.weights = self.value_weight_array[:, 1]
+        assert self.config.rng is not None and self.config.stream_batch_size
+        self.rng = self.config.rng
+        self.batch = self.config.stream_batch_size
+
+        filename_constant = create_unique_experiment_name(
+            config=self.config,
+            genome_length=self.value_weight_array.shape[0],
+        )
+        self.paths.initialize(filename_constant=f"{filename_constant}-{algorithm}")
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self.timer = Timer(self.logger, self.config)
+        self.csv_logger = OutputGenerator(self.paths, self.config)
+        self.csv_logger.init_csv(
+            self.config,
+            extra_meta={
+                "algorithm": algorithm,
+                "learning_rate": self.learning_rate,
+                "mutation_shift": self.mutation_shift,
+                "virtual_population": self.virtual_population,
+            },
+            extra_columns=("converged_loci",),
+        )
+
+        # Start where the GA samples its initial population.
+        self.probabilities = np.full(
+            self.value_weight_array.shape[0],
+            self.config.generate_probability_of_failure(self.weights.sum()),
+        )
+        self.best_fitness = -1
+        self.best_weight = 0
+        self.best_genome = np.zeros(self.value_weight_array.shape[0], np.uint8)
+        self.evaluations = 0
+        self.stop_reason: str | None = None
+
+    @property
+    def converged_loci(self) -> float:
+        """Share of loci within ``CONVERGENCE_MARGIN`` of ``0`` or ``1``."""
+        distance = np.minimum(self.probabilities, 1 - self.probabilities)
+        return float(np.mean(distance <= CONVERGENCE_MARGIN))
+
+    def evolve(self) -> GenerationStats:
+        """Run until all generations are done or the vector has converged.
+
+        Returns:
+            GenerationStats: Stats of the last generation.
+        """
+        stats = None
+        try:
+            for iteration in range(1, self.config.generations + 1):
+                self.timer.start(iteration)
+                stats = self._run_generation(iteration)
+                self.timer.stop(iteration)
+                if self.converged_loci == 1:
+                    self.stop_reason = CONVERGED
+                    self.logger.info(f"Distribution converged at iteration {iteration}")
+                    break
+        finally:
+            self.csv_logger.write_metadata(
+                "stop_reason", self.stop_reason or GENERATIONS_COMPLETED
+            )
+            self.csv_logger.write_metadata("evaluations", self.evaluations)
+            self.csv_logger.write_metadata("best_fitness", self.best_fitness)
+            self.csv_logger.close()
+            self.paths.cleanup_temp_dir()
+        assert stats is not None
+        return stats
+
+    def _run_generation(self, iteration: int) -> GenerationStats:
+        """Sample, score and learn from one generation of candidates.
+
+        Args:
+            iteration (int): Number of the generation.
+
+        Returns:
+            GenerationStats: Stats over the sampled candidates.
+        """
+        size = self.config.population_size
+        best = (-1, 0, self.best_genome)
+        worst = (np.iinfo(np.int64).max, 0)
+        identical = 0
+        total = 0
+        cga_step = np.zeros_like(self.probabilities)
+        for start in range(0, size, self.batch):
+            samples = self._sample(min(self.batch, size - start))
+            fitness = fitness_calculation(
+                max_weight=self.config.max_weight,
+                penalty_factor=self.config.penalty,
+                population=samples,  # type: ignore[arg-type]
+                batch=len(samples),
+                value_arr=self.values,
+                weight_arr=self.weights,
+            )
+            total += int(fitness[:, 0].sum())
+            ranking = np.lexsort((fitness[:, 1], -fitness[:, 0]))
+            score, weight = fitness[ranking[0]]
+            if (score, -weight) > (best[0], -best[1]):
+                best = (int(score), int(weight), samples[ranking[0]].copy())
+                identical = 0
+            if (score, weight) == best[:2]:
+                identical += int(np.sum(np.all(fitness == best[:2], axis=1)))
+            score, weight = fitness[ranking[-1]]
+            if (score, -weight) < (worst[0], -worst[1]):
+                worst = (int(score), int(weight))
+            if self.algorithm == "cga":
+                cga_step += self._compete(samples, fitness)
+        self.evaluations += size
+        self._learn(best[2], cga_step)
+
+        if (best[0], -best[1]) > (self.best_fitness, -self.best_weight):
+            self.best_fitness, self.best_weight = best[0], best[1]
+            self.best_genome = best[2]
+        stats = GenerationStats(
+            iteration=iteration,
+            best_idx=0,
+            best_fitness=best[0],
+            best_weight=best[1],
+            avg_fitness=total / size,
+            worst_fitness=worst[0],
+            worst_weight=worst[1],
+            identical_best_count=identical - 1,
+            genome="".join(str(gene) for gene in best[2].tolist()),
+        )
+        converged_loci = self.converged_loci
+        self.logger.info(
+            f"Generation {iteration}: best fitness {stats.best_fitness}, "
+            f"converged loci {converged_loci:.3f}"
+        )
+        self.csv_logger.write_iteration(
+            iteration=iteration,
+            best_fitness=stats.best_fitness,
+            best_weight=stats.best_weight,
+            avg_fitness=stats.avg_fitness,
+            worst_fitness=stats.worst_fitness,
+            worst_weight=stats.worst_weight,
+            identical_best_count=stats.identical_best_count,
+            genome=stats.genome,
+            extra=(converged_loci,),
+        )
+        return stats
+
+    def _sample(self, count: int) -> np.ndarray:
+        """Draw ``count`` genomes from the probability vector."""
+        draws = self.rng.random(size=(count, len(self.probabilities)), dtype=np.float32)
+        return (draws < self.probabilities).astype(np.uint8)
+
+    def _compete(self, samples: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+        """Compact GA update of one batch of samples paired in order.
+
+        Returns:
+            np.ndarray: Summed probability change of all tournaments.
+        """
+        pairs = len(samples) // 2
+        first, second = samples[0 : 2 * pairs : 2], samples[1 : 2 * pairs : 2]
+        first_fit, second_fit = fitness[0 : 2 * pairs : 2], fitness[1 : 2 * pairs : 2]
+        first_wins = (first_fit[:, 0] > second_fit[:, 0]) | (
+            (first_fit[:, 0] == second_fit[:, 0])
+            & (first_fit[:, 1] <= second_fit[:, 1])
+        )
+        winner = np.where(first_wins[:, None], first, second).astype(np.int64)
+        loser = np.where(first_wins[:, None], second, first).astype(np.int64)
+        return (winner - loser).sum(axis=0) / self.virtual_population
+
+    def _learn(self, best_genome: np.ndarray, cga_step: np.ndarray) -> None:
+        """Move the probability vector after a generation."""
+        if self.algorithm == "cga":
+            self.probabilities = np.clip(self.probabilities + cga_step, 0, 1)
+            return
+        self.probabilities = (
+            1 - self.learning_rate
+        ) * self.probabilities + self.learning_rate * best_genome
+        mutated = self.rng.random(len(self.probabilities)) < (
+            self.config.mutation_probability
+        )
+        shift = self.rng.random(len(self.probabilities)) < 0.5
+        self.probabilities[mutated] = (1 - self.mutation_shift) * self.probabilities[
+            mutated
+        ] + self.mutation_shift * shift[mutated]
@@ -1,32 +1,64 @@
 """Drive the genetic algorithm evolution process."""
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import asdict, replace
+from logging import LoggerAdapter
+from pathlib import Path
+from types import TracebackType
 from typing import Any
 
 import numpy as np
 import src.methods.logging_library as log
 import src.methods.utils
+from src.classes.CheckpointManager import CheckpointManager
 from src.classes.ChildrenHandler import ChildrenHandler
 from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.GenerationStats import GenerationStats
+from src.classes.HallOfFame import HALL_OF_FAME_SUFFIX, HallOfFame
+from src.classes.LocusFreezer import LocusFreezer
 from src.classes.OutputGenerator import OutputGenerator
+from src.classes.ParetoFrontRecorder import ParetoFrontRecorder
 from src.classes.PathResolver import PathResolver
-from src.classes.Plotter import Plotter
 from src.classes.PopulationHandler import PopulationHandler as PopHandler
+from src.classes.PopulationSizer import PopulationSizer
+from src.classes.ProblemReduction import ProblemReduction
 from src.classes.Reproduction import Reproduction
+from src.classes.RngStateRecorder import RngStateRecorder
+from src.classes.StoppingCriteria import (
+    GENERATIONS_COMPLETED,
+    INTERRUPTED,
+    TIME_BUDGET,
+    StoppingCriteria,
+)
 from src.classes.Timer import Timer
 from src.methods.experiment_defining_tools import create_unique_experiment_name
-from src.methods.fitness_score import calc_fitness_score_batched
+from src.methods.fitness_score import calc_fitness_score_batched, raw_sums, rescore
+from src.methods.initialization import load_genomes
+from src.methods.local_search import hill_climb
+from src.methods.lp_relaxation import lp_relaxation
+from src.methods.pareto import non_dominated_ranks, pareto_front
+from src.methods.population_metrics import (
+    allele_frequencies,
+    duplicate_rows,
+    genotype_diversity,
+)
+from src.methods.problem_reduction import reduce_problem
 from src.methods.selection_methods import (
     linear_rank_selection,
+    pareto_selection,
     roulette_selection,
     tournament_selection,
 )
-from src.methods.utils import load_data
+from src.methods.utils import fill_random_rows, load_data, load_optimum
 
 SELECTION_METHODS = {
     "roulette": roulette_selection,
     "tournament": tournament_selection,
     "rank": linear_rank_selection,
+    "pareto": pareto_selection,
 }
+POPULATION_SUFFIX = "_population.npy"
 CROSSOVER_METHODS = {
     "one": Reproduction.single_crossover,
     "two": Reproduction.double_crossover,
@@ -36,68 +68,364 @@ CROSSOVER_METHODS = {
 class EvolutionRunner:
     """Coordinates selection, crossover, mutation, and logging."""
 
-    def __init__(self, input_config: dict) -> None:
-        """Initialize runner with config and prepare environment."""
-        self._load_configuration(input_config)
+    def __init__(
+        self,
+        input_config: dict,
+        value_weight_array: np.ndarray | None = None,
+        paths: PathResolver | None = None,
+        logger: LoggerAdapter | None = None,
+        filename_constant: str | None = None,
+        report: bool = True,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize runner with config and prepare environment.
+
+        The optional arguments let a caller (e.g. ``RunnerSession``) hand over
+        resources that were already prepared, so they are not rebuilt per run.
+        Use ``resume`` to continue a run from a checkpoint.
+
+        Args:
+            input_config (dict): Raw configuration values from the user.
+            value_weight_array (np.ndarray | None): Preloaded item data. Loaded
+                from the configured data file if ``None``.
+            paths (PathResolver | None): Resolver whose directories already
+                exist. The runner then only rebinds it to ``filename_constant``
+                and removes just its own temp files on teardown.
+            logger (LoggerAdapter | None): Preconfigured logger.
+            filename_constant (str | None): Run name whose directory is used
+                as is, e.g. one claimed by a sweep or a resumed run. Generated
+                and claimed if ``None``.
+            report (bool): Whether ``evolve`` ends by plotting the results and
+                printing the final screen.
+            checkpoint (dict[str, Any] | None): Manifest from
+                ``CheckpointManager.load`` to continue from instead of
+                creating a new population. A new CSV table is started if the
+                manifest has no ``csv_offset``.
+        """
+        self._owns_paths = paths is None
+        self._checkpoint = checkpoint
+        self.input_config = {k: v for k, v in input_config.items() if k != "rng"}
+        self.paths = PathResolver() if paths is None else paths
+        self.report = report
+        self._closed = False
+        self._next_iteration = 1
+        self._load_configuration(input_config, value_weight_array)
+
+        self._prepare_environment(filename_constant, logger)
 
-        self._prepare_environment()
+        self._prepare_stopping_criteria()
 
-        self._initialize_first_generation()
+        if checkpoint is None:
+            self._initialize_first_generation()
+        else:
+            self._restore_checkpoint(checkpoint)
 
         self._load_strategies()
 
-    def _load_configuration(self, input_config: dict) -> None:
-        """Load configuration, paths, and item value/weight data.
+    @classmethod
+    def resume(cls, checkpoint: str | Path, report: bool = True) -> "EvolutionRunner":
+        """Continue a run from its last checkpoint.
+
+        The configuration and run name are taken from the checkpoint, the CSV
+        table is cut back to the checkpointed generation and the RNG state is
+        restored, so the continued run is identical to an uninterrupted one.
+
+        Args:
+            checkpoint (str | Path): A checkpoint manifest, checkpoint directory
+                or run directory.
+            report (bool): Whether ``evolve`` ends by plotting the results.
+
+        Returns:
+            EvolutionRunner: Runner positioned after the checkpointed generation.
+        """
+        manifest = CheckpointManager.load(checkpoint)
+        return cls(
+            manifest["config"],
+            filename_constant=manifest["run"],
+            report=report,
+            checkpoint=manifest,
+        )
+
+    def _load_configuration(
+        self, input_config: dict, value_weight_array: np.ndarray | None
+    ) -> None:
+        """Load configuration and item value/weight data.
+
+        With ``reduce_problem`` or ``freeze_interval`` enabled,
+        ``value_weight_array`` holds only the items that are evolved, while
+        ``item_data`` keeps the full instance.
 
         Args:
             input_config (dict): Raw configuration values from the user.
+            value_weight_array (np.ndarray | None): Preloaded item data.
         """
         # Creates class instance handling config values
         self.config = ExperimentConfig(**input_config)
 
-        # Creates class instance handling filepaths
-        self.paths = PathResolver()
-
         # Gets dictionary of values and weights
-        self.value_weight_array = load_data(
-            self.paths.get_dict_filepath(self.config.data_filename)
-        )
+        if value_weight_array is None:
+            value_weight_array = load_data(
+                self.paths.get_dict_filepath(self.config.data_filename)
+            )
+        self.sums: np.ndarray | None = None
+        if self.config.dynamic_instance:
+            # Item updates must not leak into an array owned by the caller.
+            value_weight_array = np.array(value_weight_array, dtype=np.int64)
+        self.item_data = value_weight_array
+        self.reduction: ProblemReduction | None = None
+        if self.config.reduce_problem:
+            self.reduction = reduce_problem(
+                values=value_weight_array[:, 0],
+                weights=value_weight_array[:, 1],
+                capacity=self.config.max_weight,
+            )
+        self.freezer: LocusFreezer | None = None
+        if self.config.freeze_interval is not None:
+            self.freezer = LocusFreezer(value_weight_array, self.reduction)
+            self.reduction = self.freezer.reduction
+        if self.reduction is not None:
+            value_weight_array = value_weight_array[self.reduction.free]
+        self.value_weight_array = value_weight_array
 
         self.generations = self.config.generations
 
-    def _prepare_environment(self) -> None:
+    def _prepare_environment(
+        self, filename_constant: str | None, logger: LoggerAdapter | None
+    ) -> None:
         """Create identifiers, logging, and output helpers."""
-        filename_constant = create_unique_experiment_name(
-            config=self.config,
-            genome_length=self.value_weight_array.shape[0],
-        )
+        reserve = filename_constant is None
+        if filename_constant is None:
+            filename_constant = create_unique_experiment_name(
+                config=self.config,
+                genome_length=self.item_data.shape[0],
+            )
 
-        self.paths.initialize(filename_constant=filename_constant)
+        if self._owns_paths:
+            self.paths.initialize(filename_constant=filename_constant, reserve=reserve)
+        else:
+            self.paths.use_run(filename_constant=filename_constant)
 
-        self.logger = log.initialize(config=self.config, paths=self.paths)
+        if logger is None:
+            logger = log.initialize(config=self.config, paths=self.paths)
+        self.logger = logger
 
         self.csv_logger = OutputGenerator(self.paths, self.config)
-        self.csv_logger.init_csv(self.config)
+        if self._checkpoint is None or "csv_offset" not in self._checkpoint:
+            extra_meta = {}
+            if self.config.reduce_problem and self.reduction is not None:
+                extra_meta["free_items"] = len(self.reduction.free)
+            self.csv_logger.init_csv(
+                self.config,
+                extra_meta=extra_meta,
+                extra_columns=self._extra_columns(),
+            )
+        else:
+            self.csv_logger.reopen(self._checkpoint["csv_offset"])
 
         # define timer
         self.timer = Timer(self.logger, self.config)
+        self.checkpoints = CheckpointManager(self.paths, self.config)
+        self.sizer = PopulationSizer(self.config)
+        self.hall_of_fame: HallOfFame | None = None
+        if self.config.hall_of_fame_size is not None:
+            self.hall_of_fame = HallOfFame(
+                self.config.hall_of_fame_size, self.item_data.shape[0]
+            )
+        self.rng_recorder: RngStateRecorder | None = None
+        if self.config.record_rng_states:
+            self.rng_recorder = RngStateRecorder(
+                self.paths,
+                header={
+                    "run": self.paths.filename_constant,
+                    "config": self.input_config,
+                },
+            )
+            self.rng_recorder.open(
+                None if self._checkpoint is None else self._checkpoint["iteration"]
+            )
+        self.front_recorder: ParetoFrontRecorder | None = None
+        if self.config.selection_type == "pareto":
+            self.front_recorder = ParetoFrontRecorder(
+                self.paths, self.item_data.shape[0]
+            )
+            self.front_recorder.open(
+                None if self._checkpoint is None else self._checkpoint["iteration"]
+            )
+        if self.config.reduce_problem and self.reduction is not None:
+            self.logger.info(
+                f"Problem reduction fixed {len(self.reduction.fixed_one)} items to 1 "
+                f"and {len(self.reduction.fixed_zero)} to 0, "
+                f"{len(self.reduction.free)} items are evolved"
+            )
+
+    def _prepare_stopping_criteria(self) -> None:
+        """Load the optimum and LP bound needed by enabled stopping criteria."""
+        optimum = None
+        if self.config.stop_at_optimum:
+            try:
+                optimum = load_optimum(
+                    self.paths.get_optimum_filepath(self.config.data_filename)
+                )
+            except (FileNotFoundError, ValueError) as err:
+                self.logger.warning(f"Optimum unavailable, criterion disabled: {err}")
+        lp_bound = None
+        if self.config.lp_bound_tolerance is not None:
+            _, lp_bound = lp_relaxation(
+                values=self.item_data[:, 0],
+                weights=self.item_data[:, 1],
+                capacity=self.config.max_weight,
+            )
+            self.logger.info(f"LP relaxation upper bound: {lp_bound:.3f}")
+        self.stopping = StoppingCriteria(
+            config=self.config,
+            logger=self.logger,
+            optimum=optimum,
+            lp_bound=lp_bound,
+        )
+        self.stop_reason: str | None = None
+        self.evaluations = 0
 
     def _initialize_first_generation(self) -> None:
         """Create initial population and log generation zero."""
+        self._record_rng_state(0)
+        initial_genomes = None
+        if self.config.initial_population is not None:
+            initial_genomes = load_genomes(
+                self.paths.get_project_path(self.config.initial_population),
+                self.item_data.shape[0],
+            )
+            self.logger.info(
+                f"Warm start from {len(initial_genomes)} genomes "
+                f"of {self.config.initial_population}"
+            )
         self.population_manager = PopHandler(
-            config=self.config,
+            config=self._population_config(),
             paths=self.paths,
             genome_length=self.value_weight_array.shape[0],
             filename_constant=self.paths.filename_constant,
             weight_sum=self.value_weight_array[:, 1].sum(),
+            value_weight_array=self.value_weight_array,
+            initial_genomes=initial_genomes,
+            genome_columns=None if self.reduction is None else self.reduction.free,
         )
-        self.fitness = calc_fitness_score_batched(
-            value_weight_arr=self.value_weight_array,
-            config=self.config,
-            pop_manager=self.population_manager,
-        )
+        self.fitness = self._evaluate()
+        self.evaluations = self.config.population_size
+        self._update_hall_of_fame()
         self.logger.info("Population created successfully as iteration 0")
-        self._log_and_save(iteration=0)
+        self.last_stats = self._log_and_save(
+            iteration=0, front_size=self._record_front(0)
+        )
+        self.stop_reason = self._check_stopping(self.last_stats)
+
+    def _restore_checkpoint(self, manifest: dict[str, Any]) -> None:
+        """Restore population, fitness, RNG and counters from a checkpoint.
+
+        Args:
+            manifest (dict[str, Any]): Manifest from ``CheckpointManager.load``.
+        """
+        self.fitness = self.checkpoints.restore(manifest)
+        population_size = manifest["population_shape"][0]
+        if population_size != self.config.population_size:
+            self.config = replace(self.config, population_size=population_size)
+        if self.freezer is not None and "locus_freezing" in manifest:
+            self.freezer.load_state(manifest["locus_freezing"])
+            self.reduction = self.freezer.reduction
+            self.value_weight_array = self.item_data[self.reduction.free]
+        self.population_manager = PopHandler(
+            config=self._population_config(),
+            paths=self.paths,
+            genome_length=self.value_weight_array.shape[0],
+            filename_constant=self.paths.filename_constant,
+            weight_sum=self.value_weight_array[:, 1].sum(),
+            create_file=False,
+        )
+        assert self.config.rng is not None
+        self.config.rng.bit_generator.state = manifest["rng_state"]
+        self.evaluations = manifest["evaluations"]
+        self._next_iteration = manifest["iteration"] + 1
+        self.last_stats = GenerationStats(**manifest["last_stats"])
+        if self.config.dynamic_instance:
+            self._restore_instance(manifest.get("dynamic_instance"))
+        self.stopping.load_state(manifest["stopping"])
+        if self.hall_of_fame is not None and "hall_of_fame" in manifest:
+            self.hall_of_fame.load_state(manifest["hall_of_fame"])
+        self.timer.set_elapsed(manifest["elapsed"])
+        self.logger.info(
+            f"Resumed from checkpoint at iteration {manifest['iteration']}"
+        )
+
+    def _restore_instance(self, state: dict[str, Any] | None) -> None:
+        """Reapply instance changes saved in a checkpoint and cache the sums.
+
+        Args:
+            state (dict[str, Any] | None): Capacity, penalty and items at the
+                time of the checkpoint, if saved.
+        """
+        self.sums = self._population_sums()
+        if state is None:
+            return
+        items = np.asarray(state["items"], dtype=np.int64)
+        if (
+            state["max_weight"] == self.config.max_weight
+            and state["penalty"] == self.config.penalty
+            and np.array_equal(items, self.item_data)
+        ):
+            return
+        self.config = replace(
+            self.config, max_weight=state["max_weight"], penalty=state["penalty"]
+        )
+        self.item_data[:] = items
+        self.sums = self._population_sums()
+        self._instance_changed("Restored instance changes")
+
+    def _save_checkpoint(self, iteration: int) -> None:
+        """Write a checkpoint of the state after a finished generation.
+
+        Args:
+            iteration (int): Number of the generation that just finished.
+        """
+        assert self.config.rng is not None
+        extra_state: dict[str, Any] = {}
+        if self.hall_of_fame is not None:
+            extra_state["hall_of_fame"] = self.hall_of_fame.state()
+        if self.freezer is not None:
+            extra_state["locus_freezing"] = self.freezer.state()
+        if self.config.dynamic_instance:
+            extra_state["dynamic_instance"] = {
+                "max_weight": self.config.max_weight,
+                "penalty": self.config.penalty,
+                "items": self.item_data.tolist(),
+            }
+        path = self.checkpoints.save(
+            iteration=iteration,
+            fitness=self.fitness,
+            state={
+                "run": self.paths.filename_constant,
+                "config": self.input_config,
+                "population_shape": [
+                    self.config.population_size,
+                    self.population_manager.genome_length,
+                ],
+                "rng_state": self.config.rng.bit_generator.state,
+                "csv_offset": self.csv_logger.tell(),
+                "evaluations": self.evaluations,
+                "elapsed": self.timer.total_elapsed(),
+                "last_stats": asdict(self.last_stats),
+                "stopping": self.stopping.state(),
+                **extra_state,
+            },
+        )
+        self.logger.info(f"Checkpoint of iteration {iteration} saved to {path}")
+
+    def _record_rng_state(self, iteration: int) -> None:
+        """Append the RNG state at the start of a generation, if enabled.
+
+        Args:
+            iteration (int): Generation about to be produced.
+        """
+        if self.rng_recorder is not None:
+            assert self.config.rng is not None
+            self.rng_recorder.record(iteration, self.config.rng)
 
     def _load_strategies(self) -> None:
         """Select selection and crossover methods based on config."""
@@ -117,37 +445,593 @@ class EvolutionRunner:
     def evolve(self) -> None:
         """Run all generations: selection, crossover, evaluation, and logging."""
         try:
-            for iteration in range(1, self.generations + 1):
-                self.timer.start(iteration)
-                parent_pool = self.selection_function(
-                    fitness_arr=self.fitness, config=self.config
-                )
-                children_manager = ChildrenHandler(
-                    config=self.config,
-                    paths=self.paths,
-                    genome_length=self.population_manager.genome_length,
-                )
-                crossover = Reproduction(parent_pool, self.config, self.paths)
-                method_name = self.crossover_function.__name__
-                getattr(crossover, method_name)(
-                    self.population_manager, children_manager
-                )
-                self._clean_children(children_manager)
-                self.population_manager.open_pop()
-                self.fitness = calc_fitness_score_batched(
-                    value_weight_arr=self.value_weight_array,
-                    config=self.config,
-                    pop_manager=self.population_manager,
-                )
-                self._log_and_save(iteration)
-                self.timer.stop(iteration)
+            for _ in self.steps():
+                pass
         finally:
-            self.csv_logger.close()
-            self.population_manager.close()
+            self.close()
+            if self.report:
+                from src.classes.Plotter import Plotter
+
+                plotter = Plotter(self.paths, self.config)
+                plotter.performance_and_correctness()
+                src.methods.utils.final_screen()
+
+    def steps(self) -> Iterator[GenerationStats]:
+        """Run the remaining generations lazily, one per iteration step.
+
+        Breaking out of the loop leaves all resources open, so iteration can be
+        resumed by calling ``steps()`` again. Call ``close()`` (or use the runner
+        as a context manager) to release them; no plot is produced that way.
+
+        Yields:
+            GenerationStats: Stats of each finished generation.
+        """
+        while self._should_continue():
+            stats = self._run_generation(self._next_iteration)
+            if stats is not None:
+                yield stats
+
+    async def asteps(self, offload: bool = False) -> AsyncIterator[GenerationStats]:
+        """Asynchronous variant of ``steps()`` for asyncio services.
+
+        Control is handed back to the event loop after every generation, so many
+        runners can be interleaved cooperatively in one loop.
+
+        Args:
+            offload (bool): Compute each generation in a worker thread via
+                ``asyncio.to_thread`` instead of on the event loop.
+
+        Yields:
+            GenerationStats: Stats of each finished generation.
+        """
+        while self._should_continue():
+            if offload:
+                stats = await asyncio.to_thread(
+                    self._run_generation, self._next_iteration
+                )
+            else:
+                stats = self._run_generation(self._next_iteration)
+                await asyncio.sleep(0)
+            if stats is not None:
+                yield stats
+
+    def full_population(self) -> np.ndarray:
+        """Return the current population with one gene per item of the instance.
+
+        Items fixed by problem reduction or frozen loci are filled in, so the
+        width is the full instance length even if fewer loci are evolved.
+
+        Returns:
+            np.ndarray: Genomes of shape (population_size, genome_length).
+        """
+        population = self.population_manager.get_pop_handle()
+        assert population is not None
+        return self._full_genomes(np.array(population), np.arange(len(population)))
+
+    def update_constraints(
+        self, max_weight: int | None = None, penalty: float | None = None
+    ) -> None:
+        """Change the capacity or the penalty between generations.
+
+        The population is re-scored from the cached value and weight sums in
+        O(N); genomes are not read.
+
+        Args:
+            max_weight (int | None): New maximum allowed total weight.
+            penalty (float | None): New penalty factor.
+
+        Raises:
+            RuntimeError: If the run was not configured with ``dynamic_instance``.
+        """
+        changes: dict[str, Any] = {}
+        if max_weight is not None:
+            changes["max_weight"] = max_weight
+        if penalty is not None:
+            changes["penalty"] = penalty
+        self._require_sums()
+        self.config = replace(self.config, **changes)
+        self._instance_changed(f"Constraints changed to {changes}")
+
+    def update_item(
+        self, index: int, value: int | None = None, weight: int | None = None
+    ) -> None:
+        """Change the value or weight of one item between generations.
+
+        Only the gene column of the item is read: the cached sums of the
+        individuals packing it move by the change, then the population is
+        re-scored.
+
+        Args:
+            index (int): Index of the item.
+            value (int | None): New value of the item.
+            weight (int | None): New weight of the item.
+
+        Raises:
+            RuntimeError: If the run was not configured with ``dynamic_instance``.
+            ValueError: If the item index is out of range.
+        """
+        sums = self._require_sums()
+        if not 0 <= index < self.item_data.shape[0]:
+            raise ValueError(f"Item index {index} out of range")
+        delta = np.zeros(2, dtype=np.int64)
+        for column, new in enumerate((value, weight)):
+            if new is not None:
+                delta[column] = new - self.item_data[index, column]
+                self.item_data[index, column] = new
+        population = self.population_manager.get_pop_handle()
+        assert population is not None
+        packed = np.asarray(population[:, index], dtype=np.int64)
+        sums += packed[:, None] * delta
+        self._instance_changed(f"Item {index} changed to {self.item_data[index]}")
+
+    def _require_sums(self) -> np.ndarray:
+        """Return the cached value and weight sums of the population."""
+        if self.sums is None:
+            raise RuntimeError("Instance changes require dynamic_instance")
+        return self.sums
+
+    def _instance_changed(self, message: str) -> None:
+        """Re-score the population and rebase stopping criteria after a change.
+
+        Args:
+            message (str): Description of the change for the log.
+        """
+        sums = self._require_sums()
+        self.fitness = rescore(sums, self.config.max_weight, self.config.penalty)
+        lp_bound = None
+        if self.config.lp_bound_tolerance is not None:
+            _, lp_bound = lp_relaxation(
+                values=self.item_data[:, 0],
+                weights=self.item_data[:, 1],
+                capacity=self.config.max_weight,
+            )
+        self.stopping.rebase(lp_bound)
+        self.logger.info(f"{message}; population re-scored")
+
+    def _should_continue(self) -> bool:
+        """Whether another generation should be produced.
+
+        Time and evaluation budgets are checked here, so an exhausted budget
+        sets the stop reason before a new generation is started.
+        """
+        if (
+            self._closed
+            or self.stop_reason is not None
+            or self._next_iteration > self.generations
+        ):
+            return False
+        self.stop_reason = self.stopping.check_budget(
+            elapsed=self.timer.total_elapsed(),
+            evaluations=self.evaluations,
+            next_evaluations=self.config.population_size,
+        )
+        return self.stop_reason is None
+
+    def _out_of_time(self) -> bool:
+        """Whether the wall-clock budget ran out; polled between stream batches."""
+        return self.stopping.out_of_time(self.timer.total_elapsed())
+
+    def close(self) -> None:
+        """Release file handles and temporary files. Safe to call repeatedly.
+
+        The reason the run ended is appended to the CSV metadata first.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self.stop_reason is None:
+            if self._next_iteration > self.generations:
+                self.stop_reason = GENERATIONS_COMPLETED
+            else:
+                self.stop_reason = INTERRUPTED
+        self.timer.log_runtime()
+        self.csv_logger.write_metadata("stop_reason", self.stop_reason)
+        self.csv_logger.write_metadata("last_iteration", self._next_iteration - 1)
+        self.csv_logger.write_metadata("evaluations", self.evaluations)
+        self.csv_logger.close()
+        if self.hall_of_fame is not None:
+            path = self.hall_of_fame.save(
+                self.paths.get_output_path()
+                / f"{self.paths.filename_constant}{HALL_OF_FAME_SUFFIX}"
+            )
+            self.logger.info(
+                f"Hall of fame of {len(self.hall_of_fame)} saved to {path}"
+            )
+        if self.config.save_population:
+            self._save_population()
+        if self.rng_recorder is not None:
+            self.rng_recorder.close()
+        if self.front_recorder is not None:
+            self.front_recorder.close()
+        self.population_manager.close()
+        if self._owns_paths:
             self.paths.cleanup_temp_dir()
-            plotter = Plotter(self.paths, self.config)
-            plotter.performance_and_correctness()
-            src.methods.utils.final_screen()
+        else:
+            self.paths.cleanup_run_files()
+
+    def _save_population(self) -> None:
+        """Write the current population as full-length genomes to ``output``."""
+        population = self.population_manager.get_pop_handle()
+        assert population is not None and self.config.stream_batch_size
+        path = (
+            self.paths.get_output_path()
+            / f"{self.paths.filename_constant}{POPULATION_SUFFIX}"
+        )
+        saved = np.lib.format.open_memmap(
+            path,
+            mode="w+",
+            dtype=np.uint8,
+            shape=(len(population), self.item_data.shape[0]),
+        )
+        for start in range(0, len(population), self.config.stream_batch_size):
+            stop = start + self.config.stream_batch_size
+            rows = np.arange(start, min(stop, len(population)))
+            saved[start:stop] = self._full_genomes(population[start:stop], rows)
+        saved.flush()
+        del saved
+        self.logger.info(f"Population saved to {path}")
+
+    def __enter__(self) -> "EvolutionRunner":
+        """Return the runner itself for use in a ``with`` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release resources when leaving a ``with`` block."""
+        self.close()
+
+    def _run_generation(self, iteration: int) -> GenerationStats | None:
+        """Breed, evaluate and record one generation.
+
+        If the time budget runs out while children are being produced, the
+        partial children file is discarded and the current population is kept.
+
+        Args:
+            iteration (int): Number of the generation to produce.
+
+        Returns:
+            GenerationStats | None: Stats of the produced generation, or
+                ``None`` if the generation was aborted.
+        """
+        self._record_rng_state(iteration)
+        self.timer.start(iteration)
+        current = self.config.population_size
+        target = self.sizer.next_size(
+            current, self.last_stats, self.stopping.generations_without_improvement
+        )
+        bred = min(current, target)
+        breeding_config, children_config = self.config, self.config
+        if target != current:
+            breeding_config = replace(self.config, population_size=bred)
+            children_config = replace(self.config, population_size=target)
+        parent_pool = self.selection_function(
+            fitness_arr=self.fitness, config=breeding_config
+        )
+        children_manager = ChildrenHandler(
+            config=children_config,
+            paths=self.paths,
+            genome_length=self.population_manager.genome_length,
+        )
+        crossover = Reproduction(parent_pool, self.config, self.paths)
+        method_name = self.crossover_function.__name__
+        completed = getattr(crossover, method_name)(
+            self.population_manager, children_manager, self._out_of_time
+        )
+        if not completed:
+            children_manager.close()
+            self.paths.discard_children()
+            self.logger.info(f"Generation {iteration} aborted: time budget exhausted")
+            self.stop_reason = TIME_BUDGET
+            return None
+        if target > bred:
+            self._add_immigrants(children_manager, bred, target)
+        if target != current:
+            self.logger.info(f"Population size changed from {current} to {target}")
+            self.config = children_config
+        self._clean_children(children_manager)
+        self.population_manager.open_pop()
+        if self.freezer is not None:
+            self._mutate_frozen_loci(crossover.child_parents())
+        replaced = None
+        if self.config.replace_duplicates:
+            replaced = self._replace_duplicates()
+        self.fitness = self._evaluate()
+        self.evaluations += self.config.population_size
+        if (
+            self.config.local_search_interval is not None
+            and iteration % self.config.local_search_interval == 0
+        ):
+            self._refine_elites()
+        self._update_hall_of_fame()
+        self.last_stats = self._log_and_save(
+            iteration, replaced, self._record_front(iteration)
+        )
+        if self.freezer is not None:
+            assert self.config.freeze_interval is not None
+            if iteration % self.config.freeze_interval == 0:
+                self._freeze_loci()
+        self._next_iteration = iteration + 1
+        self.timer.stop(iteration)
+        self.stop_reason = self._check_stopping(self.last_stats)
+        if self.stop_reason is None and self.checkpoints.due(iteration):
+            self._save_checkpoint(iteration)
+        return self.last_stats
+
+    def _refine_elites(self) -> None:
+        """Hill-climb the best individuals and write improvements back.
+
+        Every hill-climbing step scans the neighbourhood of each refined
+        individual at about the cost of one evaluation, so steps are added to
+        the evaluation count.
+        """
+        elites = min(self.config.local_search_elites, self.config.population_size)
+        ranking = np.lexsort((self.fitness[:, 1], -self.fitness[:, 0]))
+        rows = np.sort(ranking[:elites])
+        population = self.population_manager.get_pop_handle()
+        assert population is not None
+        value_offset, weight_offset = 0, 0
+        if self.reduction is not None:
+            value_offset = self.reduction.value_offset
+            weight_offset = self.reduction.weight_offset
+        if self.freezer is not None:
+            corrections = self.freezer.corrections(self.config.population_size)
+            value_offset += corrections[rows, 0]
+            weight_offset += corrections[rows, 1]
+        genomes, fitness, steps = hill_climb(
+            genomes=population[rows],
+            values=self.value_weight_array[:, 0],
+            weights=self.value_weight_array[:, 1],
+            max_weight=self.config.max_weight,
+            penalty_factor=self.config.penalty,
+            max_steps=self.config.local_search_steps,
+            value_offset=value_offset,
+            weight_offset=weight_offset,
+        )
+        self.evaluations += steps * elites
+        improved = fitness[:, 0] > self.fitness[rows, 0]
+        if not improved.any():
+            return
+        self.population_manager.update_individuals(rows[improved], genomes[improved])
+        self.fitness[rows[improved]] = fitness[improved]
+        if self.sums is not None:
+            self.sums[rows[improved]] = genomes[improved] @ self.value_weight_array
+        self.logger.info(
+            f"Local search improved {int(improved.sum())} of {elites} elites"
+        )
+
+    def _freeze_loci(self) -> None:
+        """Drop converged loci from the genome and thaw spread frozen ones.
+
+        Frozen items only move into the offsets and thawed ones take their
+        exception cells along, so the fitness array stays valid and nothing is
+        re-evaluated. The population file is rewritten only if a locus changed.
+        """
+        assert self.freezer is not None and self.config.stream_batch_size
+        population = self.population_manager.get_pop_handle()
+        assert population is not None
+        previous = self.reduction
+        frozen = self.freezer.freeze(
+            allele_frequencies(population, self.config.stream_batch_size)
+        )
+        rows, loci = self.freezer.thaw_spread(self.config.population_size)
+        if frozen or len(loci):
+            self._remap_population(previous, rows, loci)
+            self.logger.info(
+                f"Froze {frozen} and thawed {len(np.unique(loci))} loci, "
+                f"{len(self.value_weight_array)} are evolved"
+            )
+
+    def _mutate_frozen_loci(self, parents: np.ndarray) -> None:
+        """Carry frozen-locus flips over to the children and mutate them.
+
+        Children inherit the exception cells of the parent they start as;
+        mutation of frozen loci then toggles cells as sparse flips. The working
+        genome is not touched.
+
+        Args:
+            parents (np.ndarray): Parent of every bred child, see
+                ``Reproduction.child_parents``.
+        """
+        assert self.freezer is not None and self.config.rng is not None
+        self.freezer.inherit(parents)
+        self.freezer.mutate(
+            self.config.population_size,
+            self.config.mutation_probability,
+            self.config.rng,
+        )
+
+    def _remap_population(
+        self,
+        previous: ProblemReduction | None,
+        rows: np.ndarray,
+        loci: np.ndarray,
+    ) -> None:
+        """Rewrite the population for the current loci of the freezer.
+
+        Args:
+            previous (ProblemReduction | None): Layout the population is stored
+                in.
+            rows (np.ndarray): Individuals of exception cells of thawed loci.
+            loci (np.ndarray): Full-genome loci of these cells.
+        """
+        assert self.freezer is not None and previous is not None
+        current = self.freezer.reduction
+
+        def transform(genomes: np.ndarray, start: int) -> np.ndarray:
+            full = previous.expand(genomes)
+            batch = (rows >= start) & (rows < start + len(genomes))
+            full[rows[batch] - start, loci[batch]] ^= 1
+            return full[:, current.free]
+
+        self.population_manager.remap(len(current.free), transform)
+        self.reduction = current
+        self.value_weight_array = self.item_data[current.free]
+
+    def _full_genomes(self, genomes: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Map working genomes to full-length genomes.
+
+        Args:
+            genomes (np.ndarray): Working genomes (individuals, genes).
+            rows (np.ndarray): Row of every genome in the population; locus
+                freezing fills in the exception cells of these rows.
+
+        Returns:
+            np.ndarray: Genomes with one gene per item of the instance.
+        """
+        if self.freezer is not None:
+            return self.freezer.expand(genomes, rows)
+        if self.reduction is not None:
+            return self.reduction.expand(genomes)
+        return np.asarray(genomes)
+
+    def _population_config(self) -> ExperimentConfig:
+        """Config for the population handler.
+
+        Under problem reduction, the initial population is sampled for the
+        capacity left to the free items.
+        """
+        if self.reduction is None:
+            return self.config
+        return replace(
+            self.config,
+            max_weight=self.reduction.free_capacity(self.config.max_weight),
+        )
+
+    def _evaluate(self) -> np.ndarray:
+        """Evaluate the current population, counting items fixed by reduction.
+
+        With ``dynamic_instance``, the value and weight sums are kept in
+        ``sums`` for later re-scoring. Under locus freezing, the exception
+        cells are added to the sums before the penalty is applied.
+
+        Returns:
+            np.ndarray: Array of shape (individuals, 2) with [fitness, weight]
+                of the full-length genomes.
+        """
+        if self.config.dynamic_instance:
+            self.sums = self._population_sums()
+            return rescore(self.sums, self.config.max_weight, self.config.penalty)
+        offsets = {}
+        if self.reduction is not None:
+            offsets = {
+                "value_offset": self.reduction.value_offset,
+                "weight_offset": self.reduction.weight_offset,
+            }
+        if self.freezer is not None:
+            sums = self._population_sums(**offsets)
+            sums += self.freezer.corrections(len(sums))
+            return rescore(sums, self.config.max_weight, self.config.penalty)
+        return calc_fitness_score_batched(
+            value_weight_arr=self.value_weight_array,
+            config=self.config,
+            pop_manager=self.population_manager,
+            **offsets,
+        )
+
+    def _population_sums(
+        self, value_offset: int = 0, weight_offset: int = 0
+    ) -> np.ndarray:
+        """Value and weight sums of the current population."""
+        population = self.population_manager.get_pop_handle()
+        assert population is not None and self.config.stream_batch_size
+        return raw_sums(
+            population=population,
+            batch=self.config.stream_batch_size,
+            value_arr=self.value_weight_array[:, 0],
+            weight_arr=self.value_weight_array[:, 1],
+            value_offset=value_offset,
+            weight_offset=weight_offset,
+        )
+
+    def _update_hall_of_fame(self) -> None:
+        """Offer the evaluated population to the hall of fame, if enabled."""
+        if self.hall_of_fame is not None:
+            population = self.population_manager.get_pop_handle()
+            assert population is not None
+            self.hall_of_fame.update(
+                population,
+                self.fitness,
+                expand=self._full_genomes,
+            )
+
+    def _record_front(self, iteration: int) -> int | None:
+        """Export the non-dominated front of the evaluated population.
+
+        Only done in Pareto mode. Individuals sharing a point of the front are
+        exported once.
+
+        Args:
+            iteration (int): Number of the generation.
+
+        Returns:
+            int | None: Number of exported points, or ``None`` outside Pareto
+                mode.
+        """
+        if self.front_recorder is None:
+            return None
+        rows = pareto_front(self.fitness, non_dominated_ranks(self.fitness))
+        population = self.population_manager.get_pop_handle()
+        assert population is not None
+        genomes = self._full_genomes(np.asarray(population[rows]), rows)
+        self.front_recorder.record(iteration, self.fitness[rows], genomes)
+        return len(rows)
+
+    def _replace_duplicates(self) -> int:
+        """Replace repeated genomes with immigrants before evaluation.
+
+        The first copy of every genome is kept. Each further copy becomes a
+        random individual or, with ``immigrant_type`` ``perturbed``, a copy with
+        every gene flipped with ``perturbation_probability``. Immigrants are
+        built and written in stream batches.
+
+        Returns:
+            int: Number of replaced individuals.
+        """
+        population = self.population_manager.get_pop_handle()
+        assert population is not None and self.config.rng is not None
+        assert self.config.stream_batch_size is not None
+        duplicates, _ = duplicate_rows(population, self.config.stream_batch_size)
+        if len(duplicates) == 0:
+            return 0
+        for start in range(0, len(duplicates), self.config.stream_batch_size):
+            rows = duplicates[start : start + self.config.stream_batch_size]
+            shape = (len(rows), population.shape[1])
+            if self.config.immigrant_type == "perturbed":
+                flips = (
+                    self.config.rng.random(shape) < self.config.perturbation_probability
+                )
+                immigrants = population[rows] ^ flips.astype(np.uint8)
+            else:
+                immigrants = (
+                    self.config.rng.random(shape) < self.population_manager.q
+                ).astype(np.uint8)
+            self.population_manager.update_individuals(rows, immigrants)
+            if self.freezer is not None:
+                self.freezer.discard(rows)
+        self.logger.info(f"Replaced {len(duplicates)} duplicates with immigrants")
+        return len(duplicates)
+
+    def _check_stopping(self, stats: GenerationStats) -> str | None:
+        """Feed a finished generation to the stopping criteria.
+
+        Args:
+            stats (GenerationStats): Stats of the finished generation.
+
+        Returns:
+            str | None: The stop reason, or ``None`` to continue.
+        """
+        diversity = None
+        if self.stopping.needs_diversity:
+            population = self.population_manager.get_pop_handle()
+            assert population is not None and self.config.stream_batch_size
+            diversity = genotype_diversity(
+                allele_frequencies(population, self.config.stream_batch_size)
+            )
+        return self.stopping.check(stats, diversity)
 
     def _analyze_generation(self) -> tuple[Any, Any, Any, Any, Any, Any]:
         """Compute best/worst individuals and repetition counts.
@@ -173,16 +1057,72 @@ class EvolutionRunner:
             number_of_identical_best,
         )
 
+    def _add_immigrants(
+        self, children_manager: ChildrenHandler, start: int, stop: int
+    ) -> None:
+        """Fill the extra rows of a grown population with random individuals.
+
+        Args:
+            children_manager (ChildrenHandler): Children memmap handler.
+            start (int): First row not produced by reproduction.
+            stop (int): New population size.
+        """
+        children = children_manager.get_children_handle()
+        assert children is not None and self.config.rng is not None
+        assert self.config.stream_batch_size is not None
+        fill_random_rows(
+            children,
+            start,
+            stop,
+            self.config.stream_batch_size,
+            self.config.rng,
+            self.population_manager.q,
+        )
+
+    def _extra_columns(self) -> tuple[str, ...]:
+        """CSV columns added on top of the standard ones.
+
+        Every column is named after the ``GenerationStats`` field it holds.
+        """
+        columns = []
+        if self.config.adaptive_population:
+            columns.append("population_size")
+        if self.config.replace_duplicates:
+            columns.append("duplicates_replaced")
+        if self.config.selection_type == "pareto":
+            columns.append("front_size")
+        if self.config.freeze_interval is not None:
+            columns.append("working_loci")
+        return tuple(columns)
+
     def _clean_children(self, children_manager: ChildrenHandler) -> None:
         """Close child memmap, swap it into population, and commit."""
         children_manager.close()
         self.population_manager.close()
+        if self.population_manager.population_size != self.config.population_size:
+            self.population_manager.resize(self.config.population_size)
         pop_config = self.population_manager.get_pop_config()
         filesize = pop_config["filesize"]
         self.paths.commit_children(expected_size=filesize)
 
-    def _log_and_save(self, iteration: int) -> None:
-        """Log current generation stats and write CSV output."""
+    def _log_and_save(
+        self,
+        iteration: int,
+        duplicates_replaced: int | None = None,
+        front_size: int | None = None,
+    ) -> GenerationStats:
+        """Log current generation stats and write CSV output.
+
+        Args:
+            iteration (int): Number of the generation.
+            duplicates_replaced (int | None): Duplicates replaced before the
+                generation was evaluated, if replacement is enabled.
+            front_size (int | None): Points of the exported Pareto front, in
+                Pareto mode.
+
+        Returns:
+            GenerationStats: The stats that were logged and written.
+        """
         (
             best_idx,
             best_score,
@@ -201,15 +1141,37 @@ class EvolutionRunner:
         )
         population = self.population_manager.get_pop_handle()
         assert population is not None
-        best_item = "".join(str(char) for char in population[best_idx].tolist())
+        best_genome = self._full_genomes(population[[best_idx]], np.array([best_idx]))[
+            0
+        ]
+        best_item = "".join(str(char) for char in best_genome.tolist())
+        stats = GenerationStats(
+            iteration=iteration,
+            best_idx=int(best_idx),
+            best_fitness=int(best_score),
+            best_weight=int(best_weight),
+            avg_fitness=float(np.mean(self.fitness[:, 0])),
+            worst_fitness=int(worst_score),
+            worst_weight=int(worst_weight),
+            identical_best_count=int(number_of_identical_best),
+            genome=best_item,
+            population_size=self.config.population_size,
+            duplicates_replaced=duplicates_replaced,
+            front_size=front_size,
+            working_loci=(
+                None if self.freezer is None else self.population_manager.genome_length
+            ),
+        )
 
         self.csv_logger.write_iteration(
             iteration=iteration,
-            best_fitness=best_score,
-            best_weight=best_weight,
-            avg_fitness=np.mean(self.fitness[:, 0]),
-            worst_fitness=worst_score,
-            worst_weight=worst_weight,
-            identical_best_count=number_of_identical_best,
-            genome=best_item,
+            best_fitness=stats.best_fitness,
+            best_weight=stats.best_weight,
+            avg_fitness=stats.avg_fitness,
+            worst_fitness=stats.worst_fitness,
+            worst_weight=stats.worst_weight,
+            identical_best_count=stats.identical_best_count,
+            genome=stats.genome,
+            extra=tuple(getattr(stats, column) for column in self._extra_columns()),
         )
+        return stats
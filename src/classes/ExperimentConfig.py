@@ -19,7 +19,7 @@ class ExperimentConfig:
         max_weight (int): The maximum allowed weight.
         seed (int | None): Seed for the random number generator.
         selection_type (str): Type of selection method (`roulette`,
-                              `tournament`, `rank`).
+                              `tournament`, `rank`, `pareto`).
         crossover_type (str): Type of crossover (`one`, `two`).
         crossover_probability (float): Probability of performing crossover (0 to 1).
         mutation_probability (float): Probability of mutation per gene (0 to 1).
@@ -32,6 +32,82 @@ class ExperimentConfig:
                                           Initialized if `None`.
         selection_pressure (float | None): Selection pressure (1.0 to 2.0) used
                                            in `rank` selection. Defaults to `1.0`.
+        stop_at_optimum (bool): Stop once the best fitness reaches the value from
+                                the instance's optimum file.
+        lp_bound_tolerance (float | None): Stop once the best fitness is within
+                                           this relative distance of the LP
+                                           relaxation upper bound.
+        stagnation_window (int | None): Stop after this many generations without
+                                        improvement of the best fitness.
+        diversity_floor (float | None): Stop once population diversity (0 to 1)
+                                        drops below this value.
+        time_budget (float | None): Wall-clock budget of the run in seconds.
+                                    Checked between stream batches.
+        evaluation_budget (int | None): Maximum number of fitness evaluations.
+                                        The initial population is always
+                                        evaluated.
+        checkpoint_interval (int | None): Write a checkpoint every this many
+                                          generations.
+        checkpoint_seconds (float | None): Write a checkpoint once this many
+                                           seconds passed since the last one.
+        record_rng_states (bool): Record the RNG state at the start of every
+                                  generation so any generation can be replayed.
+        adaptive_population (bool): Shrink a converged population and grow it
+                                    with random individuals when progress
+                                    stalls.
+        min_population_size (int | None): Lower bound of the adaptive size.
+                                          Defaults to a quarter of
+                                          ``population_size``.
+        max_population_size (int | None): Upper bound of the adaptive size.
+                                          Defaults to ``population_size``.
+        convergence_threshold (float): Share of individuals identical to the
+                                       best one above which the population
+                                       shrinks.
+        growth_window (int): Generations without improvement after which the
+                             population grows.
+        local_search_interval (int | None): Refine the elite individuals by
+                                            hill climbing every this many
+                                            generations.
+        local_search_elites (int): Number of best individuals refined.
+        local_search_steps (int): Maximum hill-climbing moves per individual.
+        greedy_init_share (float): Share of the initial population built by a
+                                   randomized greedy-by-efficiency heuristic.
+        lp_init_share (float): Share of the initial population built by
+                               rounding the LP-relaxation optimum.
+        replace_duplicates (bool): Replace repeated genomes with immigrants
+                                   before each generation is evaluated.
+        immigrant_type (str): Kind of immigrant (`random`, `perturbed`).
+        perturbation_probability (float): Per-gene flip probability of
+                                          perturbed immigrants.
+        hall_of_fame_size (int | None): Keep the best this many unique
+                                        genomes of the whole run and save them
+                                        at the end.
+        reduce_problem (bool): Fix items decided by dominance and LP reduced
+                               costs and evolve only the remaining ones.
+        freeze_interval (int | None): Every this many generations, drop loci
+                                      fixed across the whole population from
+                                      the evolved genome.
+        initial_population (str | None): Genomes of a previous run to start
+                                         from: a ``.npy`` genome matrix or
+                                         hall of fame, or a checkpoint.
+                                         Relative paths start at the
+                                         project root.
+        save_population (bool): Save the final population as a ``.npy``
+                                genome matrix when the run ends.
+        dynamic_instance (bool): Keep the value and weight sums of every
+                                 individual so the capacity, penalty and
+                                 items can be changed during the run.
+        counter_base (int): Parameter-less mode: generations of a population
+                            per generation of the next larger one.
+        max_populations (int): Parameter-less mode: maximum number of
+                               populations ever started.
+        learning_rate (float): PBIL step of the probability vector towards
+                               the best sample.
+        mutation_shift (float): PBIL step of a mutated locus towards a random
+                                bit.
+        virtual_population (int | None): Population size simulated by the
+                                         compact GA. Defaults to
+                                         ``population_size``.
     """
 
     data_filename: str
@@ -49,6 +125,39 @@ class ExperimentConfig:
     stream_batch_size: int | None = None
     rng: np.random.Generator | None = None
     selection_pressure: float | None = None
+    stop_at_optimum: bool = False
+    lp_bound_tolerance: float | None = None
+    stagnation_window: int | None = None
+    diversity_floor: float | None = None
+    time_budget: float | None = None
+    evaluation_budget: int | None = None
+    checkpoint_interval: int | None = None
+    checkpoint_seconds: float | None = None
+    record_rng_states: bool = False
+    adaptive_population: bool = False
+    min_population_size: int | None = None
+    max_population_size: int | None = None
+    convergence_threshold: float = 0.5
+    growth_window: int = 20
+    local_search_interval: int | None = None
+    local_search_elites: int = 1
+    local_search_steps: int = 50
+    greedy_init_share: float = 0.0
+    lp_init_share: float = 0.0
+    replace_duplicates: bool = False
+    immigrant_type: str = "random"
+    perturbation_probability: float = 0.05
+    hall_of_fame_size: int | None = None
+    reduce_problem: bool = False
+    freeze_interval: int | None = None
+    initial_population: str | None = None
+    save_population: bool = False
+    dynamic_instance: bool = False
+    counter_base: int = 4
+    max_populations: int = 12
+    learning_rate: float = 0.1
+    mutation_shift: float = 0.05
+    virtual_population: int | None = None
 
     def __post_init__(self) -> None:
         """Performs validation checks.
@@ -84,6 +193,88 @@ class ExperimentConfig:
                     "Selection pressure must be float in range from 1 to 2"
                 )
 
+        if self.lp_bound_tolerance is not None and self.lp_bound_tolerance < 0:
+            raise ValueError("LP bound tolerance must be non-negative")
+        if self.stagnation_window is not None and self.stagnation_window < 1:
+            raise ValueError("Stagnation window must be greater than 0")
+        if self.diversity_floor is not None and not 0 <= self.diversity_floor <= 1:
+            raise ValueError("Diversity floor must be between 0 and 1")
+        if self.time_budget is not None and self.time_budget <= 0:
+            raise ValueError("Time budget must be greater than 0")
+        if self.evaluation_budget is not None and self.evaluation_budget < 1:
+            raise ValueError("Evaluation budget must be greater than 0")
+        if self.checkpoint_interval is not None and self.checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval must be greater than 0")
+        if self.checkpoint_seconds is not None and self.checkpoint_seconds <= 0:
+            raise ValueError("Checkpoint seconds must be greater than 0")
+        if self.adaptive_population:
+            self._validate_population_bounds()
+        if self.local_search_interval is not None and self.local_search_interval < 1:
+            raise ValueError("Local search interval must be greater than 0")
+        if self.local_search_elites < 1:
+            raise ValueError("Local search elites must be greater than 0")
+        if self.local_search_steps < 1:
+            raise ValueError("Local search steps must be greater than 0")
+        if not 0 <= self.greedy_init_share <= 1 or not 0 <= self.lp_init_share <= 1:
+            raise ValueError("Initialization shares must be between 0 and 1")
+        if self.greedy_init_share + self.lp_init_share > 1:
+            raise ValueError("Initialization shares must not exceed 1 in total")
+        if self.immigrant_type not in ("random", "perturbed"):
+            raise ValueError(f"Invalid immigrant type: {self.immigrant_type}")
+        if not 0 < self.perturbation_probability <= 1:
+            raise ValueError("Perturbation probability must be between 0 and 1")
+        if self.hall_of_fame_size is not None and self.hall_of_fame_size < 1:
+            raise ValueError("Hall of fame size must be greater than 0")
+        if self.freeze_interval is not None and self.freeze_interval < 1:
+            raise ValueError("Freeze interval must be greater than 0")
+        if self.dynamic_instance and (
+            self.reduce_problem or self.freeze_interval is not None
+        ):
+            raise ValueError(
+                "Dynamic instance cannot be combined with problem reduction "
+                "or locus freezing"
+            )
+        if self.counter_base < 2:
+            raise ValueError("Counter base must be at least 2")
+        if self.max_populations < 1:
+            raise ValueError("At least one population is required")
+        if not 0 < self.learning_rate <= 1 or not 0 <= self.mutation_shift <= 1:
+            raise ValueError("Learning rate and mutation shift must be in (0, 1]")
+        if self.virtual_population is not None and self.virtual_population < 2:
+            raise ValueError("Virtual population must be at least 2")
+
+    def _validate_population_bounds(self) -> None:
+        """Fills default adaptive size bounds and validates them.
+
+        Raises:
+            ValueError: If the bounds are odd, unordered or too small.
+        """
+        smallest = 6 if self.selection_type == "tournament" else 2
+        if self.min_population_size is None:
+            default = max(smallest, self.population_size // 4 // 2 * 2)
+            object.__setattr__(
+                self, "min_population_size", min(default, self.population_size)
+            )
+        if self.max_population_size is None:
+            object.__setattr__(self, "max_population_size", self.population_size)
+        assert self.min_population_size is not None
+        assert self.max_population_size is not None
+        if self.min_population_size % 2 or self.max_population_size % 2:
+            raise ValueError("Population size bounds have to be even!")
+        if not (
+            self.min_population_size <= self.population_size <= self.max_population_size
+        ):
+            raise ValueError("Population size must lie within its adaptive bounds")
+        if self.min_population_size < smallest:
+            raise ValueError(
+                f"Minimum population size must be at least {smallest} "
+                f"for {self.selection_type} selection"
+            )
+        if not 0 < self.convergence_threshold <= 1:
+            raise ValueError("Convergence threshold must be between 0 and 1")
+        if self.growth_window < 1:
+            raise ValueError("Growth window must be greater than 0")
+
     def generate_probability_of_failure(self, weight_sum: int) -> float:
         """Calculates the maximum probability of failure (1 - P(Success)).
 
@@ -0,0 +1,44 @@
+"""Module defining the per-generation summary produced by the runners."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationStats:
+    """Summary of one generation, mirroring a row of the output CSV.
+
+    Attributes:
+        iteration (int): Generation number (``0`` is the initial population).
+        best_idx (int): Index of the best individual in the population.
+        best_fitness (int): Fitness of the best individual.
+        best_weight (int): Weight of the best individual's knapsack.
+        avg_fitness (float): Average fitness of the population.
+        worst_fitness (int): Fitness of the worst individual.
+        worst_weight (int): Weight of the worst individual's knapsack.
+        identical_best_count (int): Number of other individuals identical in
+                                    fitness and weight to the best one.
+        genome (str): Genome string of the best individual.
+        population_size (int | None): Number of individuals in the generation,
+                                      if the producer tracks it.
+        duplicates_replaced (int | None): Duplicate genomes replaced by
+                                          immigrants before evaluation, if
+                                          duplicate replacement is enabled.
+        front_size (int | None): Number of distinct points on the
+                                 non-dominated front, in Pareto mode.
+        working_loci (int | None): Number of loci still evolved, if locus
+                                   freezing is enabled.
+    """
+
+    iteration: int
+    best_idx: int
+    best_fitness: int
+    best_weight: int
+    avg_fitness: float
+    worst_fitness: int
+    worst_weight: int
+    identical_best_count: int
+    genome: str
+    population_size: int | None = None
+    duplicates_replaced: int | None = None
+    front_size: int | None = None
+    working_loci: int | None = None
@@ -0,0 +1,163 @@
+"""Module keeping the best unique solutions found during a run."""
+
+import heapq
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+HALL_OF_FAME_SUFFIX = "_hall_of_fame.npy"
+
+
+class HallOfFame:
+    """Bounded archive of the top-K unique genomes of a run.
+
+    Entries are ranked like the best individual of a generation: higher
+    fitness first, lower weight on ties. A min-heap keeps the K-th entry on
+    top and a set of bit-packed genomes guards uniqueness, so admitting a
+    candidate costs ``O(log K)``. Only candidates beating the K-th entry are
+    packed and looked up at all.
+    """
+
+    def __init__(self, size: int, genome_length: int) -> None:
+        """Creates an empty archive.
+
+        Args:
+            size (int): Maximum number of entries (K).
+            genome_length (int): Number of genes of every archived genome.
+
+        Raises:
+            ValueError: If ``size`` is smaller than 1.
+        """
+        if size < 1:
+            raise ValueError("Hall of fame size must be greater than 0")
+        self.size = size
+        self.genome_length = genome_length
+        self._heap: list[tuple[int, int, bytes]] = []
+        self._keys: set[bytes] = set()
+
+    def __len__(self) -> int:
+        """Number of archived genomes."""
+        return len(self._heap)
+
+    def update(
+        self,
+        population: np.ndarray,
+        fitness: np.ndarray,
+        expand: Callable[[np.ndarray, np.ndarray], np.ndarray] | None = None,
+    ) -> int:
+        """Offer a population to the archive.
+
+        Args:
+            population (np.ndarray): Binary population matrix (individuals x
+                genes); a memmap is read only at the candidate rows.
+            fitness (np.ndarray): Array of shape (individuals, 2) with
+                [fitness, weight].
+            expand (Callable | None): Maps rows of ``population`` and their
+                indices to archived genomes, e.g. full-length genomes of a
+                reduced run. Defaults to no mapping.
+
+        Returns:
+            int: Number of genomes admitted.
+        """
+        scores, weights = fitness[:, 0], fitness[:, 1]
+        eligible = np.ones(len(fitness), dtype=bool)
+        if len(self._heap) == self.size:
+            kth_score, negated_weight, _ = self._heap[0]
+            eligible = (scores > kth_score) | (
+                (scores == kth_score) & (weights < -negated_weight)
+            )
+        candidates = np.flatnonzero(eligible)
+        ranking = np.lexsort((weights[candidates], -scores[candidates]))
+        candidates = candidates[ranking]
+        admitted = 0
+        # Candidates are visited best first, in chunks of K rows, so usually a
+        # single chunk is read; later ones only replace skipped duplicates.
+        for start in range(0, len(candidates), self.size):
+            rows = candidates[start : start + self.size]
+            genomes = population[np.sort(rows)]
+            if expand is not None:
+                genomes = expand(genomes, np.sort(rows))
+            packed = np.packbits(genomes, axis=1)
+            keys = dict(zip(np.sort(rows).tolist(), packed))
+            for row in rows.tolist():
+                entry = (int(scores[row]), -int(weights[row]), keys[row].tobytes())
+                full = len(self._heap) == self.size
+                if full and entry[:2] <= self._heap[0][:2]:
+                    return admitted
+                if entry[2] in self._keys:
+                    continue
+                if full:
+                    self._keys.discard(heapq.heapreplace(self._heap, entry)[2])
+                else:
+                    heapq.heappush(self._heap, entry)
+                self._keys.add(entry[2])
+                admitted += 1
+        return admitted
+
+    def entries(self) -> np.ndarray:
+        """Return the archive, best entry first.
+
+        Returns:
+            np.ndarray: Structured array with fields ``fitness``, ``weight``
+                and ``genome``; genomes are bit-packed, unpack them with
+                ``np.unpackbits(entry["genome"], axis=-1, count=genome_length)``.
+        """
+        genomes = self.genomes()
+        dtype = np.dtype(
+            [
+                ("fitness", np.int64),
+                ("weight", np.int64),
+                ("genome", np.uint8, (-(-genomes.shape[1] // 8),)),
+            ]
+        )
+        entries = np.zeros(len(self), dtype=dtype)
+        ranked = sorted(self._heap, reverse=True)
+        entries["fitness"] = [score for score, _, _ in ranked]
+        entries["weight"] = [-negated_weight for _, negated_weight, _ in ranked]
+        entries["genome"] = np.packbits(genomes, axis=1)
+        return entries
+
+    def genomes(self) -> np.ndarray:
+        """Return the archived genomes unpacked, best first.
+
+        Returns:
+            np.ndarray: Binary matrix with one row per entry.
+        """
+        ranked = sorted(self._heap, reverse=True)
+        packed = np.array(
+            [np.frombuffer(key, dtype=np.uint8) for _, _, key in ranked],
+            dtype=np.uint8,
+        ).reshape(len(ranked), -(-self.genome_length // 8))
+        return np.unpackbits(packed, axis=1, count=self.genome_length)
+
+    def save(self, path: str | Path) -> Path:
+        """Write the archive as a ``.npy`` file of ``entries()``.
+
+        Args:
+            path (str | Path): Destination file.
+
+        Returns:
+            Path: Path of the written file.
+        """
+        path = Path(path)
+        np.save(path, self.entries())
+        return path
+
+    def state(self) -> list[list[Any]]:
+        """Return the archive in JSON-serializable form, e.g. for checkpoints."""
+        return [[score, weight, key.hex()] for score, weight, key in self._heap]
+
+    def load_state(self, state: list[list[Any]]) -> None:
+        """Restore an archive saved by ``state``.
+
+        Args:
+            state (list[list[Any]]): Previously saved archive.
+        """
+        self._heap = [
+            (int(score), int(weight), bytes.fromhex(key))
+            for score, weight, key in state
+        ]
+        heapq.heapify(self._heap)
+        self._keys = {key for _, _, key in self._heap}
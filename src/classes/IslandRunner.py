@@ -0,0 +1,388 @@
+"""Run the island-model genetic algorithm in parallel worker processes."""
+
+import logging
+import multiprocessing
+from dataclasses import dataclass, replace
+from logging import LoggerAdapter
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from multiprocessing.synchronize import Barrier
+
+import numpy as np
+import src.methods.logging_library as log
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.GenerationStats import GenerationStats
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.PathResolver import PathResolver
+from src.classes.StackedEvolution import StackedEvolution
+from src.classes.Timer import Timer
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.migration import (
+    TOPOLOGIES,
+    migrate,
+    migration_rows,
+    migration_sources,
+)
+from src.methods.utils import load_data
+
+
+@dataclass(frozen=True, slots=True)
+class IslandSetup:
+    """Everything a worker needs to evolve one island."""
+
+    configs: tuple[ExperimentConfig, ...]
+    items: np.ndarray
+    paths: PathResolver
+    population_names: tuple[str, ...]
+    board_name: str
+    log_level: int
+    migration_interval: int
+    migrants: int
+    topology: str
+    topology_seed: np.random.SeedSequence
+
+
+def _segments(setup: IslandSetup, memory: shared_memory.SharedMemory) -> np.ndarray:
+    """Map the two population segments of one island."""
+    shape = (2, setup.configs[0].population_size, setup.items.shape[0])
+    return np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+
+
+def _board(
+    setup: IslandSetup, memory: shared_memory.SharedMemory
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map the fitness of every island and the rows each one sends."""
+    islands = len(setup.configs)
+    size = setup.configs[0].population_size
+    fitness: np.ndarray = np.ndarray(
+        (islands, size, 2), dtype=np.int64, buffer=memory.buf
+    )
+    emigrants: np.ndarray = np.ndarray(
+        (islands, setup.migrants),
+        dtype=np.int64,
+        buffer=memory.buf,
+        offset=fitness.nbytes,
+    )
+    return fitness, emigrants
+
+
+def _island_logger(setup: IslandSetup, queue: multiprocessing.Queue) -> LoggerAdapter:
+    """Send the records of a worker to the run logger of the main process."""
+    logger = logging.getLogger("GA experiment run")
+    # Handlers inherited from the main process would write the same files
+    # concurrently, so the worker only forwards its records.
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(queue))
+    logger.setLevel(setup.log_level)
+    return LoggerAdapter(logger, {"exp_id": setup.configs[0].experiment_identifier})
+
+
+def _run_island(
+    island: int, setup: IslandSetup, barrier: Barrier, queue: multiprocessing.Queue
+) -> None:
+    """Attach the shared buffers and evolve one island."""
+    logger = _island_logger(setup, queue)
+    memories = [shared_memory.SharedMemory(name=n) for n in setup.population_names]
+    board = shared_memory.SharedMemory(name=setup.board_name)
+    _evolve_island(island, setup, barrier, memories, board, logger)
+    # On failure the mappings are released when the worker exits instead.
+    for memory in [*memories, board]:
+        memory.close()
+
+
+def _evolve_island(
+    island: int,
+    setup: IslandSetup,
+    barrier: Barrier,
+    memories: list[shared_memory.SharedMemory],
+    board: shared_memory.SharedMemory,
+    logger: LoggerAdapter,
+) -> None:
+    """Evolve one island; the buffer views only live in this frame."""
+    config = setup.configs[island]
+    engine = StackedEvolution(
+        [config], setup.items[None, :, 0], setup.items[None, :, 1]
+    )
+    segments = [_segments(setup, memory) for memory in memories]
+    # Generation ``g`` lives in segment ``g % 2`` of every island, and each
+    # step breeds the next generation straight into the other segment.
+    segments[island][0] = engine.population[0]
+    engine.population = segments[island][:1]
+    fitness, emigrants = _board(setup, board)
+    topology_rng = np.random.default_rng(setup.topology_seed)
+    csv_logger = OutputGenerator(setup.paths, config, suffix=f"_island{island + 1}")
+    csv_logger.init_csv(
+        config,
+        extra_meta={
+            "island": f"{island + 1} of {len(setup.configs)}",
+            "topology": setup.topology,
+            "migration_interval": setup.migration_interval,
+            "migrants": setup.migrants,
+        },
+        extra_columns=("immigrants",),
+    )
+    best_fitness = -1
+    try:
+        for iteration in range(config.generations + 1):
+            immigrants = 0
+            if iteration:
+                current = iteration % 2
+                engine.step(out=segments[island][current : current + 1])
+                if (
+                    iteration % setup.migration_interval == 0
+                    and iteration < config.generations
+                ):
+                    sources = migration_sources(
+                        setup.topology, len(setup.configs), topology_rng
+                    )
+                    fitness[island] = engine.fitness[0]
+                    best, worst = migration_rows(fitness[island], setup.migrants)
+                    emigrants[island] = best
+                    barrier.wait()
+                    # Best and worst rows never overlap, so an island can take
+                    # its immigrants while others still read its emigrants.
+                    source = int(sources[island])
+                    populations = [segment[current] for segment in segments]
+                    migrate(
+                        populations, fitness, island, source, emigrants[source], worst
+                    )
+                    # Nobody may breed into a segment another island still reads.
+                    barrier.wait()
+                    engine.fitness[0, worst] = fitness[island, worst]
+                    immigrants = setup.migrants
+            (
+                best_idx,
+                best_score,
+                best_weight,
+                avg_fitness,
+                worst_score,
+                worst_weight,
+                number_of_identical_best,
+            ) = engine.statistics()
+            best_fitness = max(best_fitness, int(best_score[0]))
+            csv_logger.write_iteration(
+                iteration=iteration,
+                best_fitness=best_score[0],
+                best_weight=best_weight[0],
+                avg_fitness=avg_fitness[0],
+                worst_fitness=worst_score[0],
+                worst_weight=worst_weight[0],
+                identical_best_count=number_of_identical_best[0],
+                genome="".join(
+                    str(gene) for gene in engine.genomes(best_idx)[0].tolist()
+                ),
+                extra=(immigrants,),
+            )
+            logger.info(
+                f"Island {island + 1} generation {iteration}: best fitness "
+                f"{best_score[0]}, immigrants {immigrants}"
+            )
+        fitness[island] = engine.fitness[0]
+        csv_logger.write_metadata(
+            "evaluations", config.population_size * (config.generations + 1)
+        )
+        csv_logger.write_metadata("best_fitness", best_fitness)
+    finally:
+        csv_logger.close()
+
+
+class IslandRunner:
+    """Evolves several subpopulations in parallel processes with migration.
+
+    Every island is a ``StackedEvolution`` engine of ``population_size``
+    individuals running in its own worker process, with an RNG stream
+    spawned from the configured seed. Each island owns two population
+    segments in ``multiprocessing`` shared memory and breeds every generation
+    from one into the other, so its population always lives in shared memory;
+    the fitness of all islands and the rows they send sit in one more shared
+    block. Every ``migration_interval`` generations the islands publish their
+    fitness, meet at a barrier, and each copies the ``migrants`` best rows of
+    its source island (see ``migration_sources``) over its own worst rows,
+    straight from segment to segment without pickling.
+
+    Every island writes its own stats table, ``<run>_island<i>.csv``, with an
+    extra ``immigrants`` column, and logs every generation through the run
+    logger of the main process. The main process only sets up the buffers,
+    waits for the workers and reports the best individual of all islands.
+    """
+
+    def __init__(
+        self,
+        input_config: dict,
+        islands: int,
+        migration_interval: int = 10,
+        migrants: int = 1,
+        topology: str = "ring",
+    ) -> None:
+        """Prepare the environment and the island configurations.
+
+        Args:
+            input_config (dict): Raw configuration values from the user;
+                ``population_size`` is the size of a single island.
+            islands (int): Number of islands, one worker process each.
+            migration_interval (int): Generations between migrations.
+            migrants (int): Individuals every island receives per migration.
+            topology (str): ``ring`` or ``random``.
+
+        Raises:
+            ValueError: If a migration parameter is invalid or the selection
+                method has no stacked variant.
+        """
+        if islands < 2:
+            raise ValueError("Island model needs at least two islands")
+        if migration_interval < 1:
+            raise ValueError("Migration interval must be at least 1")
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Invalid migration topology: {topology}")
+        self.config = ExperimentConfig(**input_config)
+        StackedEvolution.check_selection(self.config.selection_type)
+        if not 1 <= migrants <= self.config.population_size // 2:
+            raise ValueError("Migrants must be between 1 and half the island size")
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.paths = PathResolver()
+        self.value_weight_array = load_data(
+            self.paths.get_dict_filepath(self.config.data_filename)
+        )
+        *streams, self.topology_seed = np.random.SeedSequence(self.config.seed).spawn(
+            islands + 1
+        )
+        self.island_configs = tuple(
+            replace(self.config, rng=np.random.default_rng(stream))
+            for stream in streams
+        )
+
+        filename_constant = create_unique_experiment_name(
+            config=self.config,
+            genome_length=self.value_weight_array.shape[0],
+        )
+        self.paths.initialize(filename_constant=f"{filename_constant}-P{islands}")
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self.timer = Timer(self.logger, self.config)
+        self.shape = (self.config.population_size, self.value_weight_array.shape[0])
+
+    def evolve(self) -> GenerationStats:
+        """Run all islands to the last generation.
+
+        Raises:
+            RuntimeError: If a worker process fails.
+
+        Returns:
+            GenerationStats: Stats of all islands together in the last
+                generation; ``best_idx`` counts rows across the islands in
+                order.
+        """
+        populations = [
+            shared_memory.SharedMemory(
+                create=True, size=max(1, 2 * int(np.prod(self.shape)))
+            )
+            for _ in range(self.islands)
+        ]
+        board = shared_memory.SharedMemory(
+            create=True,
+            size=8 * self.islands * (2 * self.shape[0] + self.migrants),
+        )
+        try:
+            setup = IslandSetup(
+                configs=self.island_configs,
+                items=self.value_weight_array,
+                paths=self.paths,
+                population_names=tuple(memory.name for memory in populations),
+                board_name=board.name,
+                log_level=self.logger.logger.level,
+                migration_interval=self.migration_interval,
+                migrants=self.migrants,
+                topology=self.topology,
+                topology_seed=self.topology_seed,
+            )
+            self.logger.info(
+                f"Starting {self.islands} islands of {self.shape[0]} individuals, "
+                f"{self.topology} migration every {self.migration_interval} "
+                "generations"
+            )
+            self._run_workers(setup)
+            stats = self._collect(setup, populations, board)
+            self.logger.info(
+                f"Islands finished: best fitness {stats.best_fitness} on island "
+                f"{stats.best_idx // self.shape[0] + 1}"
+            )
+            self.logger.info("Program worked for %.3f s", self.timer.total_elapsed())
+        finally:
+            for memory in [*populations, board]:
+                memory.close()
+                memory.unlink()
+            self.paths.cleanup_temp_dir()
+        return stats
+
+    def _run_workers(self, setup: IslandSetup) -> None:
+        """Start one process per island and wait for all of them.
+
+        If a worker fails, the barrier is broken so that the others stop at
+        the next migration instead of waiting forever. Log records of the
+        workers come back over a queue and go to the handlers of the run
+        logger.
+        """
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(self.islands)
+        queue = context.Queue()
+        listener = QueueListener(
+            queue, *self.logger.logger.handlers, respect_handler_level=True
+        )
+        workers = [
+            context.Process(target=_run_island, args=(island, setup, barrier, queue))
+            for island in range(self.islands)
+        ]
+        listener.start()
+        try:
+            for worker in workers:
+                worker.start()
+            running = list(workers)
+            failures = []
+            while running:
+                finished = wait([worker.sentinel for worker in running])
+                for worker in [w for w in running if w.sentinel in finished]:
+                    running.remove(worker)
+                    # The sentinel fires before the process is reaped.
+                    worker.join()
+                    if worker.exitcode:
+                        failures.append(worker)
+                        barrier.abort()
+        finally:
+            listener.stop()
+        if failures:
+            raise RuntimeError(
+                f"Island {workers.index(failures[0]) + 1} failed with exit code "
+                f"{failures[0].exitcode}"
+            )
+
+    def _collect(
+        self,
+        setup: IslandSetup,
+        populations: list[shared_memory.SharedMemory],
+        board: shared_memory.SharedMemory,
+    ) -> GenerationStats:
+        """Compute the stats of the final populations left in the buffers."""
+        fitness = _board(setup, board)[0].reshape(-1, 2).copy()
+        ranking = np.lexsort((fitness[:, 1], -fitness[:, 0]))
+        best_idx = int(ranking[0])
+        best = fitness[best_idx]
+        worst = fitness[ranking[-1]]
+        island, row = divmod(best_idx, self.shape[0])
+        segments = _segments(setup, populations[island])
+        best_genome = segments[self.config.generations % 2, row].tolist()
+        del segments
+        return GenerationStats(
+            iteration=self.config.generations,
+            best_idx=best_idx,
+            best_fitness=int(best[0]),
+            best_weight=int(best[1]),
+            avg_fitness=float(fitness[:, 0].mean()),
+            worst_fitness=int(worst[0]),
+            worst_weight=int(worst[1]),
+            identical_best_count=int(np.sum(np.all(fitness == best, axis=1))) - 1,
+            genome="".join(str(gene) for gene in best_genome),
+        )
@@ -0,0 +1,278 @@
+"""Module tracking converged loci that are dropped from the evolved genome."""
+
+from typing import Any
+
+import numpy as np
+from src.classes.ProblemReduction import ProblemReduction
+
+MIN_WORKING_LOCI = 3
+THAW_FREQUENCY = 0.05
+
+
+class LocusFreezer:
+    """Freezes loci fixed across the whole population and thaws spread ones.
+
+    A frozen locus holds the same allele in every individual, so it is removed
+    from the working genome and its item contributes a constant to value and
+    weight, exactly like an item fixed by ``ProblemReduction``. Mutation of
+    frozen loci is applied as sparse flips: the number of flipped individuals
+    of every frozen locus is drawn from a binomial distribution and only those
+    individuals are picked, so the result matches flipping every gene
+    independently.
+
+    A flip does not touch the working genome. It is kept as an exception cell,
+    an individual whose gene at a frozen locus differs from the frozen allele,
+    and enters its fitness as a value and weight correction. Children inherit
+    the exception cells of the parent they are copied from. A locus is thawed
+    back into the working genome only when its minority allele has spread to
+    more than ``thaw_frequency`` of the population.
+
+    Items fixed by problem reduction are never thawed or mutated.
+    """
+
+    def __init__(
+        self,
+        item_data: np.ndarray,
+        base: ProblemReduction | None = None,
+        thaw_frequency: float = THAW_FREQUENCY,
+    ) -> None:
+        """Starts with no frozen loci.
+
+        Args:
+            item_data (np.ndarray): Array with columns [value, weight] of the
+                full instance.
+            base (ProblemReduction | None): Reduction applied before evolution,
+                if any.
+            thaw_frequency (float): Share of the population above which the
+                minority allele of a frozen locus thaws it.
+        """
+        self.item_data = item_data
+        self.base = base
+        self.thaw_frequency = thaw_frequency
+        self.frozen_one = np.empty(0, dtype=np.int64)
+        self.frozen_zero = np.empty(0, dtype=np.int64)
+        self.exceptions = np.empty(0, dtype=np.int64)
+        self.reduction = self._build()
+
+    @property
+    def frozen(self) -> np.ndarray:
+        """Indices of all frozen loci, in ascending order."""
+        return np.union1d(self.frozen_one, self.frozen_zero)
+
+    def exception_cells(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the rows and full-genome loci of the exception cells.
+
+        Cells are ordered by row, then by locus.
+        """
+        return np.divmod(self.exceptions, self.item_data.shape[0])
+
+    def freeze(self, frequencies: np.ndarray) -> int:
+        """Freeze working loci whose allele frequency is exactly ``0`` or ``1``.
+
+        At least ``MIN_WORKING_LOCI`` loci are kept so crossover still has cut
+        points.
+
+        Args:
+            frequencies (np.ndarray): Allele ``1`` frequency of every working
+                locus, in the order of ``reduction.free``.
+
+        Returns:
+            int: Number of newly frozen loci.
+        """
+        fixed = np.flatnonzero((frequencies == 0) | (frequencies == 1))
+        spare = len(frequencies) - MIN_WORKING_LOCI
+        fixed = fixed[: max(0, spare)]
+        if len(fixed) == 0:
+            return 0
+        loci = self.reduction.free[fixed]
+        ones = frequencies[fixed] == 1
+        self.frozen_one = np.union1d(self.frozen_one, loci[ones])
+        self.frozen_zero = np.union1d(self.frozen_zero, loci[~ones])
+        self.reduction = self._build()
+        return len(fixed)
+
+    def sample_flips(
+        self, individuals: int, probability: float, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Draw the mutations falling on frozen loci in one generation.
+
+        Args:
+            individuals (int): Number of mutated individuals.
+            probability (float): Per-gene mutation probability.
+            rng (np.random.Generator): Random number generator of the experiment.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Rows and full-genome loci of the
+                flipped cells.
+        """
+        frozen = self.frozen
+        counts = rng.binomial(individuals, probability, size=len(frozen))
+        hit = np.flatnonzero(counts)
+        rows = [rng.choice(individuals, size=counts[i], replace=False) for i in hit]
+        if not rows:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(rows), np.repeat(frozen[hit], counts[hit])
+
+    def mutate(
+        self, individuals: int, probability: float, rng: np.random.Generator
+    ) -> int:
+        """Flip frozen genes of the population as exception cells.
+
+        A flipped exception cell returns to the frozen allele and is dropped.
+
+        Args:
+            individuals (int): Number of mutated individuals.
+            probability (float): Per-gene mutation probability.
+            rng (np.random.Generator): Random number generator of the experiment.
+
+        Returns:
+            int: Number of flipped cells.
+        """
+        rows, loci = self.sample_flips(individuals, probability, rng)
+        if len(rows):
+            flips = rows * self.item_data.shape[0] + loci
+            self.exceptions = np.setxor1d(self.exceptions, flips)
+        return len(rows)
+
+    def inherit(self, parents: np.ndarray) -> None:
+        """Pass exception cells from parents to the next population.
+
+        Args:
+            parents (np.ndarray): Row of the parent every new individual is
+                copied from; individuals beyond its length get no cells.
+        """
+        if len(self.exceptions) == 0:
+            return
+        rows, loci = self.exception_cells()
+        counts = np.bincount(rows, minlength=int(parents.max()) + 1)
+        starts = np.cumsum(counts) - counts
+        inherited = counts[parents]
+        total = int(inherited.sum())
+        child_starts = np.cumsum(inherited) - inherited
+        within = np.arange(total) - np.repeat(child_starts, inherited)
+        source = np.repeat(starts[parents], inherited) + within
+        children = np.repeat(np.arange(len(parents)), inherited)
+        self.exceptions = children * self.item_data.shape[0] + loci[source]
+
+    def discard(self, rows: np.ndarray) -> None:
+        """Drop the exception cells of individuals replaced from outside.
+
+        Args:
+            rows (np.ndarray): Rows of the replaced individuals.
+        """
+        if len(self.exceptions):
+            cell_rows, _ = self.exception_cells()
+            self.exceptions = self.exceptions[~np.isin(cell_rows, rows)]
+
+    def corrections(self, individuals: int) -> np.ndarray:
+        """Value and weight the exception cells add to every individual.
+
+        Args:
+            individuals (int): Number of individuals.
+
+        Returns:
+            np.ndarray: Array of shape (individuals, 2) with [value, weight]
+                to add to the sums of the working genome and the offsets.
+        """
+        result = np.zeros((individuals, 2), dtype=np.int64)
+        rows, loci = self.exception_cells()
+        sign = np.where(np.isin(loci, self.frozen_one), -1, 1)
+        np.add.at(result, rows, sign[:, None] * self.item_data[loci])
+        return result
+
+    def expand(self, genomes: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Map working genomes back to full length with their exception cells.
+
+        Args:
+            genomes (np.ndarray): Working genomes (individuals, free).
+            rows (np.ndarray): Row of every genome in the population, unique.
+
+        Returns:
+            np.ndarray: Full genomes with fixed and frozen items filled in.
+        """
+        full = self.reduction.expand(genomes)
+        if len(self.exceptions) == 0 or len(rows) == 0:
+            return full
+        cell_rows, loci = self.exception_cells()
+        order = np.argsort(rows)
+        position = np.searchsorted(rows[order], cell_rows)
+        position = np.minimum(position, len(rows) - 1)
+        found = rows[order][position] == cell_rows
+        full[order[position[found]], loci[found]] ^= 1
+        return full
+
+    def thaw_spread(self, individuals: int) -> tuple[np.ndarray, np.ndarray]:
+        """Thaw frozen loci whose minority allele spread in the population.
+
+        Args:
+            individuals (int): Number of individuals.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Rows and full-genome loci of the
+                exception cells of thawed loci, see ``thaw``.
+        """
+        _, loci = self.exception_cells()
+        counts = np.bincount(loci, minlength=self.item_data.shape[0])
+        spread = np.flatnonzero(counts > self.thaw_frequency * individuals)
+        if len(spread) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        return self.thaw(spread)
+
+    def thaw(self, loci: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Move frozen loci back into the working genome.
+
+        Args:
+            loci (np.ndarray): Full-genome indices of frozen loci.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Rows and full-genome loci of the
+                exception cells of these loci. They leave the freezer, so the
+                caller writes them into the rebuilt working genomes.
+        """
+        cell_rows, cell_loci = self.exception_cells()
+        thawed = np.isin(cell_loci, loci)
+        self.exceptions = self.exceptions[~thawed]
+        self.frozen_one = np.setdiff1d(self.frozen_one, loci)
+        self.frozen_zero = np.setdiff1d(self.frozen_zero, loci)
+        self.reduction = self._build()
+        return cell_rows[thawed], cell_loci[thawed]
+
+    def state(self) -> dict[str, list[int]]:
+        """Return the frozen loci in JSON-serializable form, e.g. for checkpoints."""
+        return {
+            "frozen_one": self.frozen_one.tolist(),
+            "frozen_zero": self.frozen_zero.tolist(),
+            "exceptions": self.exceptions.tolist(),
+        }
+
+    def load_state(self, state: dict[str, Any]) -> None:
+        """Restore frozen loci saved by ``state``.
+
+        Args:
+            state (dict[str, Any]): Previously saved frozen loci.
+        """
+        self.frozen_one = np.asarray(state["frozen_one"], dtype=np.int64)
+        self.frozen_zero = np.asarray(state["frozen_zero"], dtype=np.int64)
+        self.exceptions = np.asarray(state.get("exceptions", []), dtype=np.int64)
+        self.reduction = self._build()
+
+    def _build(self) -> ProblemReduction:
+        """Combine the base reduction with the frozen loci."""
+        genome_length = self.item_data.shape[0]
+        free = np.arange(genome_length)
+        fixed_one = self.frozen_one
+        fixed_zero = self.frozen_zero
+        if self.base is not None:
+            free = self.base.free
+            fixed_one = np.union1d(fixed_one, self.base.fixed_one)
+            fixed_zero = np.union1d(fixed_zero, self.base.fixed_zero)
+        return ProblemReduction(
+            genome_length=genome_length,
+            free=np.setdiff1d(free, self.frozen),
+            fixed_one=fixed_one,
+            fixed_zero=fixed_zero,
+            value_offset=int(self.item_data[fixed_one, 0].sum()),
+            weight_offset=int(self.item_data[fixed_one, 1].sum()),
+        )
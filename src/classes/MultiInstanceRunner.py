@@ -0,0 +1,221 @@
+"""Run one configuration over many dataset instances in stacked batches."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import replace
+
+import numpy as np
+import src.methods.logging_library as log
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.PathResolver import PathResolver
+from src.classes.StackedEvolution import StackedEvolution
+from src.classes.Timer import Timer
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.utils import load_capacity, load_data
+
+
+def group_by_genome_length(
+    lengths: Sequence[int], max_padding: float
+) -> list[list[int]]:
+    """Group instance indices so that each group can be padded cheaply.
+
+    Instances are sorted by genome length and a group is closed as soon as the
+    next instance would be more than ``max_padding`` times longer than the
+    shortest one in the group.
+
+    Args:
+        lengths (Sequence[int]): Genome length of every instance.
+        max_padding (float): Largest allowed ratio between the longest and the
+            shortest genome in one group (``1.0`` groups equal lengths only).
+
+    Returns:
+        list[list[int]]: Instance indices of every group, shortest group first.
+    """
+    groups: list[list[int]] = []
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        if groups and lengths[index] <= max_padding * lengths[groups[-1][0]]:
+            groups[-1].append(index)
+        else:
+            groups.append([index])
+    return groups
+
+
+class MultiInstanceRunner:
+    """Evolves one configuration on many instances inside a single process.
+
+    Instances are grouped by genome length into zero-padded stacks evaluated
+    by ``StackedEvolution``, so every group needs one matmul per generation.
+    Padded genes have zero value and weight and are masked out of mutation.
+    Each instance gets its own RNG stream and its own stats table.
+    """
+
+    def __init__(
+        self,
+        input_config: dict,
+        instances: Sequence[str] | None = None,
+        capacities: Mapping[str, int] | None = None,
+        max_padding: float = 1.25,
+    ) -> None:
+        """Load all instances, build padded groups and write generation zero.
+
+        Args:
+            input_config (dict): Raw configuration values from the user. Its
+                ``data_filename`` is only used to validate the config.
+            instances (Sequence[str] | None): Instance file names. Defaults to
+                every instance found in the dataset.
+            capacities (Mapping[str, int] | None): Weight limit per instance.
+                Low-dimensional instances default to the capacity encoded at
+                the end of their name, others to the capacity in the header
+                line of their file.
+            max_padding (float): See ``group_by_genome_length``.
+
+        Raises:
+            ValueError: If no instance is selected, ``max_padding`` < 1, the
+                selection method has no stacked variant or an instance has
+                no capacity.
+        """
+        if max_padding < 1:
+            raise ValueError("Max padding must be at least 1")
+        self.config = ExperimentConfig(**input_config)
+        StackedEvolution.check_selection(self.config.selection_type)
+        self.paths = PathResolver()
+        self.instances = list(instances or self.paths.list_instances())
+        if not self.instances:
+            raise ValueError("No instances selected")
+        self.capacities = dict(capacities or {})
+        self.generations = self.config.generations
+        self.item_arrays = [
+            load_data(self.paths.get_dict_filepath(name)) for name in self.instances
+        ]
+        lengths = [int(items.shape[0]) for items in self.item_arrays]
+        self.groups = group_by_genome_length(lengths, max_padding)
+
+        streams = np.random.SeedSequence(self.config.seed).spawn(len(self.instances))
+        self.instance_configs = [
+            replace(
+                self.config,
+                data_filename=name,
+                max_weight=self._capacity(name),
+                rng=np.random.default_rng(stream),
+            )
+            for name, stream in zip(self.instances, streams)
+        ]
+
+        filename_constant = create_unique_experiment_name(
+            config=replace(self.config, data_filename="multi_instance"),
+            genome_length=max(lengths),
+        )
+        self.paths.initialize(
+            filename_constant=f"{filename_constant}-I{len(self.instances)}"
+        )
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self.timer = Timer(self.logger, self.config)
+
+        self.csv_loggers = []
+        for name, config in zip(self.instances, self.instance_configs):
+            csv_logger = OutputGenerator(self.paths, config, suffix=f"_{name}")
+            csv_logger.init_csv(config)
+            self.csv_loggers.append(csv_logger)
+
+        self.engines = [self._build_group(group) for group in self.groups]
+        self.logger.info(
+            f"{len(self.instances)} instances grouped into {len(self.groups)} "
+            "stacks created successfully as iteration 0"
+        )
+        self._log_and_save(iteration=0)
+
+    def _capacity(self, name: str) -> int:
+        """Resolve the weight limit used for one instance.
+
+        Raises:
+            ValueError: If the instance has no ``capacities`` entry, no
+                capacity in its name and no header line.
+        """
+        if name in self.capacities:
+            return int(self.capacities[name])
+        tail = name.rsplit("_", 1)[-1]
+        if name.startswith("f") and tail.isdigit():
+            return int(tail)
+        try:
+            return load_capacity(self.paths.get_dict_filepath(name))
+        except ValueError:
+            raise ValueError(
+                f"No capacity for instance {name}: pass it in 'capacities'"
+            )
+
+    def _build_group(self, group: list[int]) -> StackedEvolution:
+        """Zero-pad the instances of one group and stack them."""
+        lengths = [int(self.item_arrays[i].shape[0]) for i in group]
+        padded = np.zeros(shape=(len(group), max(lengths), 2), dtype=np.int64)
+        for row, (index, length) in enumerate(zip(group, lengths)):
+            padded[row, :length] = self.item_arrays[index]
+        return StackedEvolution(
+            configs=[self.instance_configs[i] for i in group],
+            values=padded[:, :, 0],
+            weights=padded[:, :, 1],
+            genome_lengths=lengths,
+        )
+
+    def evolve(self) -> None:
+        """Run all generations for every group and write the stats tables."""
+        try:
+            for iteration in range(1, self.generations + 1):
+                self.timer.start(iteration)
+                for engine in self.engines:
+                    engine.step()
+                self._log_and_save(iteration)
+                self.timer.stop(iteration)
+        finally:
+            for csv_logger in self.csv_loggers:
+                csv_logger.close()
+            self.paths.cleanup_temp_dir()
+
+    def results(self) -> dict[str, tuple[int, int, str]]:
+        """Return the current best individual of every instance.
+
+        Returns:
+            dict[str, tuple[int, int, str]]: Instance name mapped to best
+                fitness, its weight and its genome string.
+        """
+        summary = {}
+        for group, engine in zip(self.groups, self.engines):
+            best_idx, best_score, best_weight, *_ = engine.statistics()
+            genomes = engine.genomes(best_idx)
+            for row, index in enumerate(group):
+                length = int(engine.genome_lengths[row])
+                genome = "".join(str(gene) for gene in genomes[row, :length].tolist())
+                summary[self.instances[index]] = (
+                    int(best_score[row]),
+                    int(best_weight[row]),
+                    genome,
+                )
+        return summary
+
+    def _log_and_save(self, iteration: int) -> None:
+        """Write one CSV row per instance for the current generation."""
+        for group, engine in zip(self.groups, self.engines):
+            (
+                best_idx,
+                best_score,
+                best_weight,
+                avg_fitness,
+                worst_score,
+                worst_weight,
+                number_of_identical_best,
+            ) = engine.statistics()
+            genomes = engine.genomes(best_idx)
+            for row, index in enumerate(group):
+                length = int(engine.genome_lengths[row])
+                self.csv_loggers[index].write_iteration(
+                    iteration=iteration,
+                    best_fitness=best_score[row],
+                    best_weight=best_weight[row],
+                    avg_fitness=avg_fitness[row],
+                    worst_fitness=worst_score[row],
+                    worst_weight=worst_weight[row],
+                    identical_best_count=number_of_identical_best[row],
+                    genome="".join(
+                        str(gene) for gene in genomes[row, :length].tolist()
+                    ),
+                )
+        self.logger.info(f"Generation {iteration} finished for all instances")
@@ -1,8 +1,9 @@
 """Module for managing CSV file output for experiment results."""
 
 import csv
+import os
 from pathlib import Path
-from typing import Any, Optional, TextIO
+from typing import Any, Optional, Sequence, TextIO
 
 from src.classes.ExperimentConfig import ExperimentConfig
 from src.classes.PathResolver import PathResolver
@@ -15,18 +16,22 @@ class OutputGenerator:
     appending iteration results, and ensuring safe closure of the file handle.
     """
 
-    def __init__(self, pr: PathResolver, config: ExperimentConfig) -> None:
+    def __init__(
+        self, pr: PathResolver, config: ExperimentConfig, suffix: str = ""
+    ) -> None:
         """Initializes the generator and determines the output file path.
 
         Args:
             pr (PathResolver): PathResolver instance providing output directory.
             config (ExperimentConfig): Configuration object with experiment details.
+            suffix (str, optional): Appended to the file name so several tables
+                can share one output directory. Defaults to no suffix.
         """
         self.config = config
         self.pr = pr
         self.plot_path = pr.get_plot_path()
         self.input_path = pr.get_output_path()
-        self.filename = Path(self.input_path / f"{pr.filename_constant}.csv")
+        self.filename = Path(self.input_path / f"{pr.filename_constant}{suffix}.csv")
         self.file: Optional[TextIO] = None
         self.writer: Optional[Any] = None
 
@@ -36,6 +41,36 @@ class OutputGenerator:
             self.file = open(self.filename, "w", newline="")
             self.writer = csv.writer(self.file)
 
+    def tell(self) -> int:
+        """Flushes written rows to disk and returns the file's byte offset.
+
+        Raises:
+            RuntimeError: If the file has not been opened.
+
+        Returns:
+            int: Size of the table written so far.
+        """
+        if self.file is None:
+            raise RuntimeError("Plotter not opened. Call .open() or .init_csv() first.")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def reopen(self, offset: int) -> None:
+        """Reopens an existing table for appending after cutting it at ``offset``.
+
+        Rows written after the offset was taken (e.g. before a crash) are dropped,
+        so writing can continue from a checkpoint.
+
+        Args:
+            offset (int): Byte offset returned earlier by ``tell``.
+        """
+        self.close()
+        with open(self.filename, "r+b") as file:
+            file.truncate(offset)
+        self.file = open(self.filename, "a", newline="")
+        self.writer = csv.writer(self.file)
+
     def close(self) -> None:
         """Opens the CSV file for writing and initializes the CSV writer object."""
         if self.file is not None:
@@ -53,6 +88,7 @@ class OutputGenerator:
         worst_weight: int,
         identical_best_count: int,
         genome: str,
+        extra: Sequence[Any] = (),
     ) -> None:
         """Appends a single row of metrics from one generation to the CSV file.
 
@@ -65,6 +101,8 @@ class OutputGenerator:
             worst_weight (int): Weight of the worst individual's knapsack.
             identical_best_count (int): Number of individuals with the best fitness.
             genome (str): Genome string of the best individual.
+            extra (Sequence[Any]): Values of the extra columns declared in
+                                   ``init_csv``.
 
         Raises:
             RuntimeError: If the file has not been opened (i.e., `_open()`
@@ -82,10 +120,30 @@ class OutputGenerator:
                 worst_weight,
                 identical_best_count,
                 genome,
+                *extra,
             ]
         )
 
-    def init_csv(self, config: ExperimentConfig) -> None:
+    def write_metadata(self, key: str, value: Any) -> None:
+        """Appends a `#`-prefixed metadata row, e.g. facts known only at the end.
+
+        Args:
+            key (str): Metadata field name.
+            value (Any): Metadata value.
+
+        Raises:
+            RuntimeError: If the file has not been opened.
+        """
+        if self.writer is None:
+            raise RuntimeError("Plotter not opened. Call .open() or .init_csv() first.")
+        self.writer.writerow([f"# {key}", value])
+
+    def init_csv(
+        self,
+        config: ExperimentConfig,
+        extra_meta: Optional[dict] = None,
+        extra_columns: Sequence[str] = (),
+    ) -> None:
         """Initializes the CSV file by writing configuration metadata and header row.
 
         The metadata lines are prefixed with `#` so they can be ignored during
@@ -94,6 +152,10 @@ class OutputGenerator:
         Args:
             config (ExperimentConfig): The configuration object used to extract
                                        metadata fields.
+            extra_meta (Optional[dict]): Additional metadata written after the
+                                         configuration fields.
+            extra_columns (Sequence[str]): Columns appended to the header, e.g.
+                                           ``population_size`` in adaptive mode.
         """
         if self.file is None or self.writer is None:
             self._open()
@@ -113,8 +175,35 @@ class OutputGenerator:
             ["# log_level", config.log_level],
             ["# stream_batch_size", config.stream_batch_size],
             ["# selection_pressure", config.selection_pressure],
-            [],
+            ["# stop_at_optimum", config.stop_at_optimum],
+            ["# lp_bound_tolerance", config.lp_bound_tolerance],
+            ["# stagnation_window", config.stagnation_window],
+            ["# diversity_floor", config.diversity_floor],
+            ["# time_budget", config.time_budget],
+            ["# evaluation_budget", config.evaluation_budget],
+            ["# checkpoint_interval", config.checkpoint_interval],
+            ["# checkpoint_seconds", config.checkpoint_seconds],
+            ["# record_rng_states", config.record_rng_states],
+            ["# adaptive_population", config.adaptive_population],
+            ["# min_population_size", config.min_population_size],
+            ["# max_population_size", config.max_population_size],
+            ["# local_search_interval", config.local_search_interval],
+            ["# local_search_elites", config.local_search_elites],
+            ["# local_search_steps", config.local_search_steps],
+            ["# greedy_init_share", config.greedy_init_share],
+            ["# lp_init_share", config.lp_init_share],
+            ["# replace_duplicates", config.replace_duplicates],
+            ["# immigrant_type", config.immigrant_type],
+            ["# hall_of_fame_size", config.hall_of_fame_size],
+            ["# reduce_problem", config.reduce_problem],
+            ["# freeze_interval", config.freeze_interval],
+            ["# initial_population", config.initial_population],
+            ["# save_population", config.save_population],
+            ["# dynamic_instance", config.dynamic_instance],
         ]
+        for key, value in (extra_meta or {}).items():
+            meta_rows.append([f"# {key}", value])
+        meta_rows.append([])
 
         header = [
             "iteration",
@@ -125,6 +214,7 @@ class OutputGenerator:
             "worst_weight",
             "identical_best_individuals_repetitions",
             "genome_of_best_individual",
+            *extra_columns,
         ]
 
         self.writer.writerows(meta_rows)
@@ -0,0 +1,238 @@
+"""Parameter-less GA racing populations of doubling size (Harik & Lobo)."""
+
+from dataclasses import replace
+
+import numpy as np
+import src.methods.logging_library as log
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.PathResolver import PathResolver
+from src.classes.RacingPopulation import (
+    ACTIVE,
+    CONVERGED,
+    FINISHED,
+    OVERTAKEN,
+    SUPERSEDED,
+    RacingPopulation,
+)
+from src.classes.StackedEvolution import StackedEvolution
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.utils import load_data
+
+
+class ParameterlessRunner:
+    """Races populations of size N, 2N, 4N... under one evaluation budget.
+
+    Following Harik & Lobo's parameter-less GA, a base-``counter_base`` counter
+    interleaves the populations: each population performs one generation for
+    every ``counter_base`` generations of the next smaller one, and a new,
+    twice larger population is started whenever the counter reaches a level
+    with no population yet. A population is discarded when a larger one has a
+    higher average fitness (it was overtaken), when all its individuals share
+    the same fitness and weight (it converged), or when a larger population
+    converged (it was superseded). The run ends when the next
+    generation would exceed ``evaluation_budget``; the population holding the
+    best individual wins, the smaller one on ties.
+    """
+
+    def __init__(
+        self,
+        input_config: dict,
+        counter_base: int | None = None,
+        max_populations: int | None = None,
+    ) -> None:
+        """Prepare the environment and start the smallest population.
+
+        Args:
+            input_config (dict): Raw configuration values. ``population_size``
+                is the size of the first population; ``evaluation_budget`` is
+                required and ``generations`` caps each population.
+            counter_base (int | None): Generations of a population per
+                generation of the next larger one. Overrides the configured
+                ``counter_base``.
+            max_populations (int | None): Maximum number of populations ever
+                started, bounding the largest size to
+                ``N * 2 ** (max_populations - 1)``. Overrides the configured
+                ``max_populations``.
+
+        Raises:
+            ValueError: If no sufficient evaluation budget is configured, the
+                race parameters are invalid or the selection method has no
+                stacked variant.
+        """
+        overrides = {
+            key: value
+            for key, value in (
+                ("counter_base", counter_base),
+                ("max_populations", max_populations),
+            )
+            if value is not None
+        }
+        self.config = ExperimentConfig(**{**input_config, **overrides})
+        StackedEvolution.check_selection(self.config.selection_type)
+        if self.config.evaluation_budget is None:
+            raise ValueError("Parameter-less mode requires an evaluation budget")
+        if self.config.evaluation_budget < self.config.population_size:
+            raise ValueError("Evaluation budget must cover the first population")
+        self.counter_base = self.config.counter_base
+        self.max_populations = self.config.max_populations
+        self.budget = self.config.evaluation_budget
+        self.paths = PathResolver()
+        self.value_weight_array = load_data(
+            self.paths.get_dict_filepath(self.config.data_filename)
+        )
+        filename_constant = create_unique_experiment_name(
+            config=self.config,
+            genome_length=self.value_weight_array.shape[0],
+        )
+        self.paths.initialize(filename_constant=f"{filename_constant}-PL")
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self._seeds = np.random.SeedSequence(self.config.seed)
+
+        self.populations: list[RacingPopulation] = []
+        self.evaluations = 0
+        self.counter = 0
+        self._spawn()
+
+    @property
+    def live(self) -> list[RacingPopulation]:
+        """Populations still racing, smallest first."""
+        return [p for p in self.populations if p.status == ACTIVE]
+
+    @property
+    def winner(self) -> RacingPopulation:
+        """Population holding the best individual (the smaller one on ties)."""
+        return max(self.populations, key=lambda p: (p.best_fitness, -p.size))
+
+    def evolve(self) -> RacingPopulation:
+        """Run the race until the evaluation budget is spent.
+
+        Returns:
+            RacingPopulation: The winning population.
+        """
+        try:
+            while self._tick():
+                pass
+        finally:
+            self._close()
+        winner = self.winner
+        self.logger.info(
+            f"Population size {winner.size} won with fitness {winner.best_fitness} "
+            f"after {self.evaluations} evaluations"
+        )
+        return winner
+
+    def _tick(self) -> bool:
+        """Advance the counter and run one generation of the selected population.
+
+        Returns:
+            bool: ``False`` once the race is over.
+        """
+        if not self.live:
+            return self._spawn()
+        self.counter += 1
+        level = 0
+        while self.counter % self.counter_base ** (level + 1) == 0:
+            level += 1
+        live = self.live
+        if level >= len(live):
+            return self._spawn()
+        population = live[level]
+        if population.engine.iteration >= self.config.generations:
+            population.status = FINISHED
+            return True
+        if self.evaluations + population.size > self.budget:
+            return False
+        population.engine.step()
+        self.evaluations += population.size
+        self._record(population)
+        self._eliminate(population)
+        return True
+
+    def _spawn(self) -> bool:
+        """Start a population twice as large as the last one, if affordable.
+
+        Returns:
+            bool: Whether a population was started.
+        """
+        index = len(self.populations)
+        size = self.config.population_size * 2**index
+        if index >= self.max_populations or self.evaluations + size > self.budget:
+            return bool(self.live)
+        config = replace(
+            self.config,
+            population_size=size,
+            rng=np.random.default_rng(self._seeds.spawn(1)[0]),
+        )
+        csv_logger = OutputGenerator(self.paths, config, suffix=f"_pop{size}")
+        csv_logger.init_csv(config, extra_meta={"race_index": index})
+        population = RacingPopulation(
+            size=size,
+            engine=StackedEvolution(
+                configs=[config],
+                values=self.value_weight_array[None, :, 0],
+                weights=self.value_weight_array[None, :, 1],
+            ),
+            csv_logger=csv_logger,
+        )
+        self.populations.append(population)
+        self.evaluations += size
+        self.logger.info(f"Started population of size {size}")
+        self._record(population)
+        return True
+
+    def _record(self, population: RacingPopulation) -> None:
+        """Write the stats of a population's newest generation."""
+        (
+            best_idx,
+            best_score,
+            best_weight,
+            avg_fitness,
+            worst_score,
+            worst_weight,
+            identical,
+        ) = population.engine.statistics()
+        genome = population.engine.genomes(best_idx)[0]
+        if best_score[0] > population.best_fitness:
+            population.best_fitness = int(best_score[0])
+            population.best_genome = genome.copy()
+        population.avg_fitness = float(avg_fitness[0])
+        population.csv_logger.write_iteration(
+            iteration=population.engine.iteration,
+            best_fitness=best_score[0],
+            best_weight=best_weight[0],
+            avg_fitness=avg_fitness[0],
+            worst_fitness=worst_score[0],
+            worst_weight=worst_weight[0],
+            identical_best_count=identical[0],
+            genome="".join(str(gene) for gene in genome.tolist()),
+        )
+        if identical[0] + 1 == population.size:
+            population.status = CONVERGED
+            self.logger.info(f"Population of size {population.size} converged")
+
+    def _eliminate(self, population: RacingPopulation) -> None:
+        """Discard smaller populations overtaken or outlived by ``population``."""
+        for smaller in self.live:
+            if smaller.size >= population.size:
+                break
+            if (
+                population.status == CONVERGED
+                or population.avg_fitness > smaller.avg_fitness
+            ):
+                smaller.status = (
+                    SUPERSEDED if population.status == CONVERGED else OVERTAKEN
+                )
+                self.logger.info(
+                    f"Population of size {smaller.size} discarded: {smaller.status}"
+                )
+
+    def _close(self) -> None:
+        """Write the outcome to every table and release the environment."""
+        winner = self.winner
+        for population in self.populations:
+            population.csv_logger.write_metadata("status", population.status)
+            population.csv_logger.write_metadata("winner", population is winner)
+            population.csv_logger.write_metadata("evaluations", self.evaluations)
+            population.csv_logger.close()
+        self.paths.cleanup_temp_dir()
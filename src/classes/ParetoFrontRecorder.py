@@ -0,0 +1,135 @@
+"""Module exporting the non-dominated front of every generation."""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+import numpy as np
+from src.classes.PathResolver import PathResolver
+
+RECORD_HEADER = struct.Struct("<II")
+PARETO_SUFFIX = "_pareto.bin"
+
+
+def front_dtype(genome_length: int) -> np.dtype:
+    """Return the dtype of one front member of a genome of given length."""
+    return np.dtype(
+        [
+            ("fitness", "<i8"),
+            ("weight", "<i8"),
+            ("genome", np.uint8, (-(-genome_length // 8),)),
+        ]
+    )
+
+
+class ParetoFrontRecorder:
+    """Appends the Pareto front of every generation to a per-run binary file.
+
+    The file starts with one JSON line (run name and genome length). Each
+    generation then adds a record: a ``RECORD_HEADER`` with the generation
+    number and the number of members, followed by that many ``front_dtype``
+    entries holding fitness, weight and the bit-packed genome, best fitness
+    first.
+    """
+
+    def __init__(self, paths: PathResolver, genome_length: int) -> None:
+        """Stores the file location and the record layout.
+
+        Args:
+            paths (PathResolver): Resolver bound to the recorded run.
+            genome_length (int): Number of genes of the exported genomes.
+        """
+        self.path = (
+            paths.get_output_path() / f"{paths.filename_constant}{PARETO_SUFFIX}"
+        )
+        self.genome_length = genome_length
+        self.dtype = front_dtype(genome_length)
+        self.file: Optional[BinaryIO] = None
+
+    def open(self, resume_iteration: int | None = None) -> None:
+        """Creates the file, or reopens it when continuing a run.
+
+        Args:
+            resume_iteration (int | None): Last generation restored from a
+                checkpoint. Records after it are dropped before appending.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume_iteration is None or not self.path.exists():
+            self.file = open(self.path, "wb")
+            header = {"run": self.path.name, "genome_length": self.genome_length}
+            self.file.write(json.dumps(header).encode() + b"\n")
+            return
+        self.file = open(self.path, "r+b")
+        offset = len(self.file.readline())
+        while True:
+            chunk = self.file.read(RECORD_HEADER.size)
+            if len(chunk) < RECORD_HEADER.size:
+                break
+            iteration, count = RECORD_HEADER.unpack(chunk)
+            if iteration > resume_iteration:
+                break
+            offset += RECORD_HEADER.size + count * self.dtype.itemsize
+            self.file.seek(offset)
+        self.file.truncate(offset)
+        self.file.seek(offset)
+
+    def record(self, iteration: int, fitness: np.ndarray, genomes: np.ndarray) -> None:
+        """Appends the front of one generation.
+
+        Args:
+            iteration (int): Generation the front belongs to.
+            fitness (np.ndarray): Array of shape (members, 2) with
+                [fitness, weight].
+            genomes (np.ndarray): Binary genomes of the members.
+
+        Raises:
+            RuntimeError: If the file is not open.
+        """
+        if self.file is None:
+            raise RuntimeError("Recorder not opened. Call .open() first.")
+        entries = np.zeros(len(fitness), dtype=self.dtype)
+        entries["fitness"] = fitness[:, 0]
+        entries["weight"] = fitness[:, 1]
+        entries["genome"] = np.packbits(genomes, axis=1)
+        self.file.write(RECORD_HEADER.pack(iteration, len(entries)))
+        self.file.write(entries.tobytes())
+        self.file.flush()
+
+    def close(self) -> None:
+        """Closes the file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    @staticmethod
+    def load(path: str | Path) -> tuple[dict[str, Any], dict[int, np.ndarray]]:
+        """Reads a file written by the recorder.
+
+        Args:
+            path (str | Path): Path of the ``_pareto.bin`` file.
+
+        Raises:
+            ValueError: If the file is truncated mid-record.
+
+        Returns:
+            tuple[dict, dict]: The header and the fronts keyed by generation,
+                as structured arrays of ``front_dtype``.
+        """
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+            payload = file.read()
+        dtype = front_dtype(header["genome_length"])
+        fronts = {}
+        offset = 0
+        while offset < len(payload):
+            if offset + RECORD_HEADER.size > len(payload):
+                raise ValueError(f"{path} is corrupted")
+            iteration, count = RECORD_HEADER.unpack_from(payload, offset)
+            offset += RECORD_HEADER.size
+            end = offset + count * dtype.itemsize
+            if end > len(payload):
+                raise ValueError(f"{path} is corrupted")
+            fronts[iteration] = np.frombuffer(payload[offset:end], dtype=dtype)
+            offset = end
+        return header, fronts
@@ -22,6 +22,7 @@ class PathResolver:
         self.output_dir: Path | None = None
         self.logging_dir: Path | None = None
         self.plot_dir: Path | None = None
+        self.checkpoint_dir: Path | None = None
 
         self.small_scale_path = (
             Path(self.PROJECT_ROOT) / "dane AG 2" / "low-dimensional"
@@ -36,12 +37,20 @@ class PathResolver:
 
         self.data_path: Path | None = None
 
-    def initialize(self, filename_constant: str) -> None:
+    def initialize(self, filename_constant: str, reserve: bool = True) -> None:
         """Sets the experiment identifier & creates the run_output directory structure.
 
+        By default the run directory is claimed with `reserve_run()` first, so
+        runs started at the same time never share a directory; the identifier
+        may then get a numeric suffix.
+
         Args:
             filename_constant (str): Unique identifier for the current experiment run.
+            reserve (bool): Claim a free run directory. Pass False to reuse a
+                            directory claimed before, e.g. when resuming a run.
         """
+        if reserve:
+            filename_constant = self.reserve_run(filename_constant)
         self.temp_dir = (
             Path(self.PROJECT_ROOT) / "run_output" / f"{filename_constant}" / "temp"
         )
@@ -54,12 +63,60 @@ class PathResolver:
         self.plot_dir = (
             Path(self.PROJECT_ROOT) / "run_output" / f"{filename_constant}" / "plots"
         )
+        self.checkpoint_dir = (
+            Path(self.PROJECT_ROOT)
+            / "run_output"
+            / f"{filename_constant}"
+            / "checkpoints"
+        )
         self.filename_constant = filename_constant
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logging_dir.mkdir(parents=True, exist_ok=True)
         self.plot_dir.mkdir(parents=True, exist_ok=True)
 
+    def reserve_run(self, filename_constant: str) -> str:
+        """Atomically claims a run directory that no other run uses.
+
+        Names generated from the configuration only carry a minute-second
+        timestamp, so runs started in parallel may get the same one. The
+        directory is created exclusively; if it already exists, ``-2``, ``-3``
+        and so on are appended until a free name is found.
+
+        Args:
+            filename_constant (str): Preferred identifier of the run.
+
+        Returns:
+            str: The identifier whose directory was claimed.
+        """
+        run_output = Path(self.PROJECT_ROOT) / "run_output"
+        run_output.mkdir(parents=True, exist_ok=True)
+        candidate = filename_constant
+        counter = 1
+        while True:
+            try:
+                (run_output / candidate).mkdir()
+                return candidate
+            except FileExistsError:
+                counter += 1
+                candidate = f"{filename_constant}-{counter}"
+
+    def use_run(self, filename_constant: str) -> None:
+        """Rebinds the resolver to a new run inside the existing directories.
+
+        Several consecutive runs can share one directory structure this way;
+        only file names derived from `filename_constant` change.
+
+        Args:
+            filename_constant (str): Unique identifier of the new run.
+
+        Raises:
+            RuntimeError: If the directories were not initialized via `initialize()`.
+        """
+        temp_directory = self.get_temp_path()
+        self.filename_constant = filename_constant
+        temp_directory.mkdir(parents=True, exist_ok=True)
+
     def get_temp_path(self) -> Path:
         """Returns the absolute path to the temporary files directory.
 
@@ -99,11 +156,38 @@ class PathResolver:
             raise RuntimeError("Directories were not initialized")
         return self.logging_dir
 
+    def get_checkpoint_path(self) -> Path:
+        """Returns the absolute path to the checkpoint directory.
+
+        The directory lives outside ``temp`` so checkpoints survive cleanup. It is
+        only created when the first checkpoint is written.
+
+        Raises:
+            RuntimeError: If the directories were not initialized via `initialize()`.
+
+        Returns:
+            Path: The path to the checkpoint directory.
+        """
+        if self.checkpoint_dir is None:
+            raise RuntimeError("Directories were not initialized")
+        return self.checkpoint_dir
+
     def cleanup_temp_dir(self) -> None:
         """Safely removes the temporary directory and all its contents."""
         if isinstance(self.temp_dir, Path) and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
 
+    def cleanup_run_files(self) -> None:
+        """Removes the temporary files of the current run, keeping the directory."""
+        if not isinstance(self.temp_dir, Path):
+            return
+        for name in (
+            f"{self.filename_constant}.dat",
+            f"{self.filename_constant}.json",
+            f"child_{self.filename_constant}.dat",
+        ):
+            (self.temp_dir / name).unlink(missing_ok=True)
+
     def get_dict_filepath(self, file_name: str) -> Path:
         """Resolves the absolute path to the input data file based on its name prefix.
 
@@ -128,6 +212,38 @@ class PathResolver:
         self.data_path = path
         return self.data_path
 
+    def get_project_path(self, path: str | Path) -> Path:
+        """Resolves a user-supplied path against the project root.
+
+        Absolute paths are returned unchanged, so results do not depend on the
+        current working directory.
+
+        Args:
+            path (str | Path): Path from the configuration, e.g.
+                ``run_output/<run>/checkpoints``.
+
+        Returns:
+            Path: The absolute path.
+        """
+        return Path(self.PROJECT_ROOT) / path
+
+    def list_instances(self) -> list[str]:
+        """Lists the names of all instances available in the dataset.
+
+        Returns:
+            list[str]: Sorted file names from the large-scale and low-dimensional
+                       directories, usable with `get_dict_filepath()`.
+        """
+        names: list[str] = []
+        for directory in (self.large_scale_path, self.small_scale_path):
+            if directory.exists():
+                names.extend(
+                    path.name
+                    for path in directory.iterdir()
+                    if path.is_file() and not path.name.startswith(".")
+                )
+        return sorted(names)
+
     def get_children_filepath(self) -> Path:
         """Returns the absolute path for the temporary children memmap file.
 
@@ -138,6 +254,10 @@ class PathResolver:
         temp_directory = self.get_temp_path()
         return temp_directory / f"child_{self.filename_constant}.dat"
 
+    def discard_children(self) -> None:
+        """Removes the temporary children file of an aborted generation."""
+        self.get_children_filepath().unlink(missing_ok=True)
+
     def commit_children(self, expected_size: int, retries: int = 3) -> None:
         """Replaces the old population memmap file with the new children file.
 
@@ -191,6 +311,26 @@ class PathResolver:
             raise RuntimeError("Directories were not initialized")
         return self.plot_dir
 
+    def get_optimum_filepath(self, file_name: str) -> Path:
+        """Resolves the absolute path to the optimum file of a data file.
+
+        Args:
+            file_name (str): The name of the data file
+                             (e.g., 'knapPI_1_100_1000_1' or 'f6_l-d_kp_10_60').
+
+        Raises:
+            Exception: If the file name prefix is invalid (not 'knap' or 'f').
+
+        Returns:
+            Path: The absolute path to the optimum file.
+        """
+        if file_name.startswith("knap"):
+            return self.large_scale_optimum / file_name
+        elif file_name.startswith("f"):
+            return self.small_scale_optimum / file_name
+        else:
+            raise Exception("Invalid file name")
+
     def get_optimum_path(self) -> Path:
         """Returns the base directory path for the optimum solution files.
 
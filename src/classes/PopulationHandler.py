@@ -5,12 +5,19 @@ accessing, and safely closing the NumPy memmap file used to temporarily store
 the population during the reproduction cycle.
 """
 
+import os
+from collections.abc import Callable
 from typing import Literal, Optional
 
 import numpy as np
 from src.classes.ExperimentConfig import ExperimentConfig
 from src.classes.PathResolver import PathResolver
-from src.methods.utils import create_population_file, load_memmap
+from src.methods.initialization import initial_seeders
+from src.methods.utils import (
+    create_memmap_config_json,
+    create_population_file,
+    load_memmap,
+)
 
 
 class PopulationHandler:
@@ -27,6 +34,10 @@ class PopulationHandler:
         genome_length: int,
         filename_constant: str,
         weight_sum: int,
+        create_file: bool = True,
+        value_weight_array: np.ndarray | None = None,
+        initial_genomes: np.ndarray | None = None,
+        genome_columns: np.ndarray | None = None,
     ) -> None:
         """Initializes the handler, creates initial population, and loads memmap.
 
@@ -40,10 +51,24 @@ class PopulationHandler:
             filename_constant (str): Unique identifier for the experiment files.
             weight_sum (int): Total weight sum of all items, used for probability
                               calculation.
+            create_file (bool): Whether to generate a new population. If
+                                ``False``, an existing population file (e.g.
+                                restored from a checkpoint) is loaded.
+            value_weight_array (np.ndarray | None): Item data used to seed part
+                                of the population heuristically. Required if
+                                ``greedy_init_share`` or ``lp_init_share``
+                                is set or ``initial_genomes`` is given.
+            initial_genomes (np.ndarray | None): Full-length genomes of a
+                                previous run placed first in the population
+                                and repaired to fit the capacity; the rest
+                                is sampled as usual.
+            genome_columns (np.ndarray | None): Items of ``initial_genomes``
+                                that are evolved, when the genome covers only
+                                part of the instance.
 
         Raises:
             ValueError: If required config fields (stream_batch_size or rng)
-                        are None.
+                        are None, or item data needed for seeding is missing.
         """
         self.population_size = config.population_size
         self.genome_length = genome_length
@@ -55,15 +80,28 @@ class PopulationHandler:
         self.filename_constant = filename_constant
         self.temp_path = paths.get_temp_path()
 
-        create_population_file(
-            temp=self.temp_path,
-            population_size=self.population_size,
-            genome_length=self.genome_length,
-            stream_batch=self.stream_batch,
-            rng=self.rng,
-            probability_of_failure=self.q,
-            filename_constant=self.filename_constant,
-        )
+        if create_file:
+            seeders = []
+            if (
+                config.greedy_init_share
+                or config.lp_init_share
+                or initial_genomes is not None
+            ):
+                if value_weight_array is None:
+                    raise ValueError("Heuristic initialization requires item data")
+                seeders = initial_seeders(
+                    config, value_weight_array, initial_genomes, genome_columns
+                )
+            create_population_file(
+                temp=self.temp_path,
+                population_size=self.population_size,
+                genome_length=self.genome_length,
+                stream_batch=self.stream_batch,
+                rng=self.rng,
+                probability_of_failure=self.q,
+                filename_constant=self.filename_constant,
+                seeders=seeders,
+            )
         self.pop_handle: Optional[np.memmap[tuple[int, int], np.dtype[np.uint8]]]
         self.pop_handle, self.pop_config = load_memmap(
             filename_constant=self.filename_constant,
@@ -110,6 +148,99 @@ class PopulationHandler:
                 temp=self.temp_path,
             )
 
+    def update_individuals(self, rows: np.ndarray, genomes: np.ndarray) -> None:
+        """Overwrites individuals of the population file in place.
+
+        The memmap is reopened for writing, flushed, and handed back in
+        read-only mode.
+
+        Args:
+            rows (np.ndarray): Indices of the individuals to overwrite.
+            genomes (np.ndarray): New genomes, one row per index in ``rows``.
+        """
+        self.close()
+        self.open_pop("r+")
+        assert self.pop_handle is not None
+        self.pop_handle[rows] = genomes
+        self.close()
+        self.open_pop()
+
+    def remap(
+        self,
+        genome_length: int,
+        transform: Callable[[np.ndarray, int], np.ndarray],
+    ) -> None:
+        """Rewrites every individual with a different number of genes.
+
+        Rows are streamed in batches through ``transform`` into a new file that
+        then replaces the population file. The memmap is handed back in
+        read-only mode.
+
+        Args:
+            genome_length (int): Number of genes after the rewrite.
+            transform (Callable[[np.ndarray, int], np.ndarray]): Maps a batch
+                of genomes and the index of its first row to the new genomes.
+        """
+        self.open_pop()
+        assert self.pop_handle is not None
+        population_dat = self.temp_path / f"{self.filename_constant}.dat"
+        remapped_dat = self.temp_path / f"remap_{self.filename_constant}.dat"
+        remapped = np.memmap(
+            filename=remapped_dat,
+            dtype=np.uint8,
+            mode="w+",
+            shape=(self.population_size, genome_length),
+        )
+        for start in range(0, self.population_size, self.stream_batch):
+            stop = min(start + self.stream_batch, self.population_size)
+            remapped[start:stop] = transform(self.pop_handle[start:stop], start)
+        remapped.flush()
+        del remapped
+        self.close()
+        os.replace(remapped_dat, population_dat)
+        self.genome_length = genome_length
+        create_memmap_config_json(
+            self.temp_path / f"{self.filename_constant}.json",
+            population_dat,
+            np.uint8,
+            self.population_size,
+            genome_length,
+        )
+        self.pop_config = {
+            **self.pop_config,
+            "genome_length": genome_length,
+            "filesize": self.population_size * genome_length,
+        }
+        self.open_pop()
+
+    def resize(self, population_size: int) -> None:
+        """Updates the memmap metadata to a new number of individuals.
+
+        Called while the handle is closed, right before a children file of the
+        new size replaces the population file.
+
+        Args:
+            population_size (int): New number of rows of the population file.
+
+        Raises:
+            RuntimeError: If the memmap is still open.
+        """
+        if self.pop_handle is not None:
+            raise RuntimeError("Close the population before resizing it")
+        self.population_size = population_size
+        create_memmap_config_json(
+            self.temp_path / f"{self.filename_constant}.json",
+            self.temp_path / f"{self.filename_constant}.dat",
+            np.uint8,
+            population_size,
+            self.genome_length,
+        )
+        self.pop_config = {
+            **self.pop_config,
+            "population_size": population_size,
+            "filesize": population_size * self.genome_length,
+        }
+
     def close(self) -> None:
         """Safely closes the memmap resource.
 
@@ -0,0 +1,66 @@
+"""Module deciding the population size of the next generation."""
+
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.GenerationStats import GenerationStats
+
+SHRINK_FACTOR = 0.75
+GROWTH_FACTOR = 2.0
+
+
+class PopulationSizer:
+    """Adapts the population size between generations.
+
+    A converged population, where many individuals equal the best one, is
+    shrunk by ``SHRINK_FACTOR`` to save evaluations and I/O. After every
+    ``growth_window`` generations without improvement the population grows by
+    ``GROWTH_FACTOR``; the new slots are filled with random individuals. Sizes
+    stay even and within the configured bounds. Stalling takes precedence over
+    convergence, because fresh individuals are what a stalled run needs.
+    """
+
+    def __init__(self, config: ExperimentConfig) -> None:
+        """Stores bounds and thresholds from the configuration.
+
+        Args:
+            config (ExperimentConfig): Configuration of the adaptive mode.
+        """
+        self.enabled = config.adaptive_population
+        self.min_size = config.min_population_size or config.population_size
+        self.max_size = config.max_population_size or config.population_size
+        self.convergence_threshold = config.convergence_threshold
+        self.growth_window = config.growth_window
+
+    def next_size(
+        self, current: int, stats: GenerationStats, stalled_generations: int
+    ) -> int:
+        """Return the size of the next generation.
+
+        Args:
+            current (int): Size of the current population.
+            stats (GenerationStats): Stats of the current population.
+            stalled_generations (int): Generations since the best fitness last
+                improved.
+
+        Returns:
+            int: Even population size within the bounds.
+        """
+        if not self.enabled:
+            return current
+        if (
+            stalled_generations > 0
+            and stalled_generations % self.growth_window == 0
+            and current < self.max_size
+        ):
+            return min(self.max_size, _even(current * GROWTH_FACTOR))
+        converged = stats.identical_best_count + 1
+        if (
+            converged >= self.convergence_threshold * current
+            and current > self.min_size
+        ):
+            return max(self.min_size, _even(current * SHRINK_FACTOR))
+        return current
+
+
+def _even(size: float) -> int:
+    """Round a size down to an even number."""
+    return int(size) // 2 * 2
@@ -0,0 +1,57 @@
+"""Module describing a knapsack instance with some items fixed in advance."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ProblemReduction:
+    """Items fixed before evolution and the free core that is evolved.
+
+    A reduced genome holds one gene per free item. It stands for the full
+    genome whose fixed items take their fixed values, so its value and weight
+    are the reduced sums plus ``value_offset`` and ``weight_offset``.
+
+    Attributes:
+        genome_length (int): Number of items of the full instance.
+        free (np.ndarray): Indices of the items left to evolution.
+        fixed_one (np.ndarray): Indices of the items fixed to ``1``.
+        fixed_zero (np.ndarray): Indices of the items fixed to ``0``.
+        value_offset (int): Total value of the items fixed to ``1``.
+        weight_offset (int): Total weight of the items fixed to ``1``.
+    """
+
+    genome_length: int
+    free: np.ndarray
+    fixed_one: np.ndarray
+    fixed_zero: np.ndarray
+    value_offset: int
+    weight_offset: int
+
+    def free_capacity(self, max_weight: int) -> int:
+        """Capacity left for the free items.
+
+        Args:
+            max_weight (int): Capacity of the full instance.
+
+        Returns:
+            int: ``max_weight`` minus the weight of the items fixed to ``1``.
+        """
+        return max_weight - self.weight_offset
+
+    def expand(self, genomes: np.ndarray) -> np.ndarray:
+        """Map reduced genomes back to full length.
+
+        Args:
+            genomes (np.ndarray): Reduced genome (free,) or genomes
+                (individuals, free).
+
+        Returns:
+            np.ndarray: Full genomes with the fixed items filled in.
+        """
+        genomes = np.asarray(genomes)
+        full = np.zeros((*genomes.shape[:-1], self.genome_length), dtype=genomes.dtype)
+        full[..., self.free] = genomes
+        full[..., self.fixed_one] = 1
+        return full
@@ -0,0 +1,38 @@
+"""Module defining one population of the parameter-less race."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.StackedEvolution import StackedEvolution
+
+ACTIVE = "active"
+OVERTAKEN = "overtaken"
+CONVERGED = "converged"
+SUPERSEDED = "superseded"
+FINISHED = "finished"
+
+
+@dataclass(slots=True)
+class RacingPopulation:
+    """One population of the race together with its bookkeeping.
+
+    Attributes:
+        size (int): Number of individuals.
+        engine (StackedEvolution): Single-member stack holding the population.
+        csv_logger (OutputGenerator): Stats table of this population.
+        status (str): ``active``, ``overtaken``, ``converged``,
+            ``superseded`` (a larger population converged first) or
+            ``finished`` (reached the generation limit).
+        best_fitness (int): Best fitness found by this population so far.
+        best_genome (np.ndarray): Genome of that individual.
+        avg_fitness (float): Average fitness of the current generation.
+    """
+
+    size: int
+    engine: StackedEvolution
+    csv_logger: OutputGenerator
+    status: str = ACTIVE
+    best_fitness: int = -1
+    best_genome: np.ndarray = field(default_factory=lambda: np.empty(0, np.uint8))
+    avg_fitness: float = 0.0
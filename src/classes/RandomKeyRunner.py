@@ -0,0 +1,204 @@
+"""Run the genetic algorithm on random-key individuals."""
+
+import os
+
+import numpy as np
+import src.methods.logging_library as log
+from src.classes.EvolutionRunner import SELECTION_METHODS
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.GenerationStats import GenerationStats
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.PathResolver import PathResolver
+from src.classes.Timer import Timer
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.fitness_score import fitness_calculation
+from src.methods.random_keys import decode_keys, key_crossover, key_mutation
+from src.methods.utils import load_data
+
+
+class RandomKeyRunner:
+    """Evolves priority key vectors decoded greedily into feasible knapsacks.
+
+    The population is a float32 memmap of keys (individuals x genes) in the
+    temp directory. Every generation the keys are read in stream batches of
+    ``stream_batch_size`` rows, decoded with ``decode_keys`` and scored with
+    ``fitness_calculation``; decoded genomes are never stored. Parents are
+    picked by the configured selection method, crossed with ``key_crossover``
+    and mutated with ``key_mutation`` batch by batch into a children memmap,
+    which then replaces the population.
+
+    Since every decoded solution fits, ``penalty`` has no effect. Stats are
+    written to the usual CSV table.
+    """
+
+    def __init__(self, input_config: dict) -> None:
+        """Prepare the environment and the key memmaps.
+
+        Args:
+            input_config (dict): Raw configuration values from the user.
+
+        Raises:
+            ValueError: If the selection method is unknown.
+        """
+        self.config = ExperimentConfig(**input_config)
+        if self.config.selection_type not in SELECTION_METHODS:
+            raise ValueError(f"Invalid selection method: {self.config.selection_type}")
+        self.selection_function = SELECTION_METHODS[self.config.selection_type]
+        self.paths = PathResolver()
+        self.value_weight_array = load_data(
+            self.paths.get_dict_filepath(self.config.data_filename)
+        )
+        self.values = self.value_weight_array[:, 0]
+        self.weights = self.value_weight_array[:, 1]
+        assert self.config.rng is not None and self.config.stream_batch_size
+        self.rng = self.config.rng
+        self.batch = self.config.stream_batch_size
+
+        filename_constant = create_unique_experiment_name(
+            config=self.config,
+            genome_length=self.value_weight_array.shape[0],
+        )
+        self.paths.initialize(filename_constant=f"{filename_constant}-keys")
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self.timer = Timer(self.logger, self.config)
+        self.csv_logger = OutputGenerator(self.paths, self.config)
+        self.csv_logger.init_csv(
+            self.config, extra_meta={"representation": "random_keys"}
+        )
+
+        temp = self.paths.get_temp_path()
+        self.keys_path = temp / f"keys_{self.paths.filename_constant}.dat"
+        self.children_path = temp / f"child_keys_{self.paths.filename_constant}.dat"
+        self.shape = (self.config.population_size, self.value_weight_array.shape[0])
+        self.best_fitness = -1
+        self.best_weight = 0
+        self.evaluations = 0
+
+    def evolve(self) -> GenerationStats:
+        """Run all generations.
+
+        Returns:
+            GenerationStats: Stats of the last generation.
+        """
+        try:
+            self.timer.start(0)
+            keys = np.memmap(
+                self.keys_path, dtype=np.float32, mode="w+", shape=self.shape
+            )
+            for start in range(0, self.shape[0], self.batch):
+                stop = min(start + self.batch, self.shape[0])
+                keys[start:stop] = self.rng.random(
+                    (stop - start, self.shape[1]), dtype=np.float32
+                )
+            keys.flush()
+            del keys
+            fitness, stats = self._evaluate(0)
+            self.timer.stop(0)
+            for iteration in range(1, self.config.generations + 1):
+                self.timer.start(iteration)
+                self._reproduce(fitness)
+                fitness, stats = self._evaluate(iteration)
+                self.timer.stop(iteration)
+        finally:
+            self.csv_logger.write_metadata("evaluations", self.evaluations)
+            self.csv_logger.write_metadata("best_fitness", self.best_fitness)
+            self.csv_logger.close()
+            self.paths.cleanup_temp_dir()
+        return stats
+
+    def _evaluate(self, iteration: int) -> tuple[np.ndarray, GenerationStats]:
+        """Decode and score the population, then log the generation.
+
+        Args:
+            iteration (int): Number of the generation.
+
+        Returns:
+            tuple[np.ndarray, GenerationStats]: The [fitness, weight] array of
+                the population and its stats.
+        """
+        keys = np.memmap(self.keys_path, dtype=np.float32, mode="r", shape=self.shape)
+        fitness = np.empty((self.shape[0], 2), dtype=np.int64)
+        best = (-1, 0)
+        best_genome = np.zeros(self.shape[1], dtype=np.uint8)
+        for start in range(0, self.shape[0], self.batch):
+            genomes = decode_keys(
+                keys[start : start + self.batch], self.weights, self.config.max_weight
+            )
+            batch_fitness = fitness_calculation(
+                max_weight=self.config.max_weight,
+                penalty_factor=self.config.penalty,
+                population=genomes,  # type: ignore[arg-type]
+                batch=len(genomes),
+                value_arr=self.values,
+                weight_arr=self.weights,
+            )
+            fitness[start : start + len(genomes)] = batch_fitness
+            ranking = np.lexsort((batch_fitness[:, 1], -batch_fitness[:, 0]))
+            score, weight = batch_fitness[ranking[0]]
+            if (score, -weight) > (best[0], -best[1]):
+                best = (int(score), int(weight))
+                best_genome = genomes[ranking[0]].copy()
+        del keys
+        self.evaluations += self.shape[0]
+        if (best[0], -best[1]) > (self.best_fitness, -self.best_weight):
+            self.best_fitness, self.best_weight = best
+
+        ranking = np.lexsort((fitness[:, 1], -fitness[:, 0]))
+        worst = fitness[ranking[-1]]
+        stats = GenerationStats(
+            iteration=iteration,
+            best_idx=int(ranking[0]),
+            best_fitness=best[0],
+            best_weight=best[1],
+            avg_fitness=float(fitness[:, 0].mean()),
+            worst_fitness=int(worst[0]),
+            worst_weight=int(worst[1]),
+            identical_best_count=int(np.sum(np.all(fitness == best, axis=1))) - 1,
+            genome="".join(str(gene) for gene in best_genome.tolist()),
+        )
+        self.logger.info(
+            f"Generation {iteration}: best fitness {stats.best_fitness}, "
+            f"average fitness {stats.avg_fitness:.2f}"
+        )
+        self.csv_logger.write_iteration(
+            iteration=iteration,
+            best_fitness=stats.best_fitness,
+            best_weight=stats.best_weight,
+            avg_fitness=stats.avg_fitness,
+            worst_fitness=stats.worst_fitness,
+            worst_weight=stats.worst_weight,
+            identical_best_count=stats.identical_best_count,
+            genome=stats.genome,
+        )
+        return fitness, stats
+
+    def _reproduce(self, fitness: np.ndarray) -> None:
+        """Replace the population with the children of selected parents.
+
+        Args:
+            fitness (np.ndarray): The [fitness, weight] array of the population.
+        """
+        parents = np.asarray(self.selection_function(fitness, self.config))
+        pairs = parents.reshape(-1, 2)
+        keys = np.memmap(self.keys_path, dtype=np.float32, mode="r", shape=self.shape)
+        children = np.memmap(
+            self.children_path, dtype=np.float32, mode="w+", shape=self.shape
+        )
+        step = max(1, self.batch // 2)
+        for start in range(0, len(pairs), step):
+            batch_pairs = pairs[start : start + step]
+            c1, c2 = key_crossover(
+                keys[batch_pairs[:, 0]],
+                keys[batch_pairs[:, 1]],
+                self.config.crossover_type,
+                self.config.crossover_probability,
+                self.rng,
+            )
+            offspring = np.empty((2 * len(batch_pairs), self.shape[1]), np.float32)
+            offspring[0::2], offspring[1::2] = c1, c2
+            children[2 * start : 2 * start + len(offspring)] = key_mutation(
+                offspring, self.config.mutation_probability, self.rng
+            )
+        children.flush()
+        del keys, children
+        os.replace(self.children_path, self.keys_path)
@@ -0,0 +1,158 @@
+"""Run many seeds of one configuration as a single stacked population."""
+
+from collections.abc import Sequence
+from dataclasses import replace
+
+import numpy as np
+import src.methods.logging_library as log
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.OutputGenerator import OutputGenerator
+from src.classes.PathResolver import PathResolver
+from src.classes.StackedEvolution import StackedEvolution
+from src.classes.Timer import Timer
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.utils import load_data
+
+
+class ReplicaRunner:
+    """Evolves R independent replicas of one experiment in one vectorized pass.
+
+    All replicas share the instance, the output directory and the logger, but
+    each one owns an RNG stream spawned from the configured seed and may use
+    its own crossover and mutation probability. Stats are written to one CSV
+    table per replica.
+    """
+
+    def __init__(
+        self,
+        input_config: dict,
+        replicas: int,
+        crossover_probabilities: Sequence[float] | None = None,
+        mutation_probabilities: Sequence[float] | None = None,
+    ) -> None:
+        """Initialize the replica stack and write generation zero.
+
+        Args:
+            input_config (dict): Raw configuration values from the user.
+            replicas (int): Number of independent replicas (R).
+            crossover_probabilities (Sequence[float] | None): Optional Pc per
+                replica. Defaults to the configured value for every replica.
+            mutation_probabilities (Sequence[float] | None): Optional Pm per
+                replica. Defaults to the configured value for every replica.
+
+        Raises:
+            ValueError: If ``replicas`` is not positive, a per-replica
+                probability list has the wrong length or the selection method
+                has no stacked variant.
+        """
+        if replicas < 1:
+            raise ValueError("Number of replicas must be greater than 0")
+        self.config = ExperimentConfig(**input_config)
+        StackedEvolution.check_selection(self.config.selection_type)
+        self.replicas = replicas
+        self.paths = PathResolver()
+        self.value_weight_array = load_data(
+            self.paths.get_dict_filepath(self.config.data_filename)
+        )
+        self.generations = self.config.generations
+        self.replica_configs = self._spawn_replica_configs(
+            crossover_probabilities, mutation_probabilities
+        )
+
+        filename_constant = create_unique_experiment_name(
+            config=self.config,
+            genome_length=self.value_weight_array.shape[0],
+        )
+        self.paths.initialize(filename_constant=f"{filename_constant}-R{replicas}")
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self.timer = Timer(self.logger, self.config)
+
+        self.csv_loggers = []
+        for index, config in enumerate(self.replica_configs):
+            csv_logger = OutputGenerator(
+                self.paths, config, suffix=f"_replica{index:03d}"
+            )
+            csv_logger.init_csv(config, extra_meta={"replica": index})
+            self.csv_loggers.append(csv_logger)
+
+        self.engine = StackedEvolution(
+            configs=self.replica_configs,
+            values=np.tile(self.value_weight_array[:, 0], (replicas, 1)),
+            weights=np.tile(self.value_weight_array[:, 1], (replicas, 1)),
+        )
+        self.logger.info(f"{replicas} replicas created successfully as iteration 0")
+        self._log_and_save(iteration=0)
+
+    def _spawn_replica_configs(
+        self,
+        crossover_probabilities: Sequence[float] | None,
+        mutation_probabilities: Sequence[float] | None,
+    ) -> list[ExperimentConfig]:
+        """Derive one config per replica with an independent RNG stream.
+
+        Streams are spawned from ``np.random.SeedSequence(seed)``, so a fixed
+        seed reproduces the whole set of replicas.
+        """
+        count = self.replicas
+        if crossover_probabilities is None:
+            crossover_probabilities = [self.config.crossover_probability] * count
+        if mutation_probabilities is None:
+            mutation_probabilities = [self.config.mutation_probability] * count
+        if len(crossover_probabilities) != count:
+            raise ValueError("Expected one crossover probability per replica")
+        if len(mutation_probabilities) != count:
+            raise ValueError("Expected one mutation probability per replica")
+        streams = np.random.SeedSequence(self.config.seed).spawn(count)
+        return [
+            replace(
+                self.config,
+                rng=np.random.default_rng(stream),
+                crossover_probability=crossover,
+                mutation_probability=mutation,
+            )
+            for stream, crossover, mutation in zip(
+                streams, crossover_probabilities, mutation_probabilities
+            )
+        ]
+
+    def evolve(self) -> None:
+        """Run all generations for every replica and write the stats tables."""
+        try:
+            for iteration in range(1, self.generations + 1):
+                self.timer.start(iteration)
+                self.engine.step()
+                self._log_and_save(iteration)
+                self.timer.stop(iteration)
+        finally:
+            for csv_logger in self.csv_loggers:
+                csv_logger.close()
+            self.paths.cleanup_temp_dir()
+
+    def _log_and_save(self, iteration: int) -> None:
+        """Log a summary over all replicas and write one CSV row per replica."""
+        (
+            best_idx,
+            best_score,
+            best_weight,
+            avg_fitness,
+            worst_score,
+            worst_weight,
+            number_of_identical_best,
+        ) = self.engine.statistics()
+        self.logger.info(
+            f"Generation {iteration}: best fitness over {self.replicas} replicas "
+            f"min {best_score.min()} | mean {best_score.mean():.3f} | "
+            f"max {best_score.max()}"
+        )
+        genomes = self.engine.genomes(best_idx)
+        for index, csv_logger in enumerate(self.csv_loggers):
+            csv_logger.write_iteration(
+                iteration=iteration,
+                best_fitness=best_score[index],
+                best_weight=best_weight[index],
+                avg_fitness=avg_fitness[index],
+                worst_fitness=worst_score[index],
+                worst_weight=worst_weight[index],
+                identical_best_count=number_of_identical_best[index],
+                genome="".join(str(gene) for gene in genomes[index].tolist()),
+            )
@@ -1,6 +1,6 @@
 """Crossover and mutation helpers for the genetic algorithm."""
 
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -42,26 +42,64 @@ class Reproduction:
         self._pair_parents()
 
     def single_crossover(
-        self, pop_manager: PopulationHandler, children_manager: ChildrenHandler
-    ) -> None:
+        self,
+        pop_manager: PopulationHandler,
+        children_manager: ChildrenHandler,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> bool:
         """Run single-point crossover for the current parent pairs.
 
         Args:
             pop_manager (PopulationHandler): Population memmap handler.
             children_manager (ChildrenHandler): Children memmap handler.
+            should_stop (Callable[[], bool] | None): Polled between stream
+                batches; returning ``True`` aborts the generation.
+
+        Returns:
+            bool: ``True`` if all children were produced.
         """
-        self._calculation_runner(self._kernel_single, pop_manager, children_manager)
+        return self._calculation_runner(
+            self._kernel_single, pop_manager, children_manager, should_stop
+        )
 
     def double_crossover(
-        self, pop_manager: PopulationHandler, children_manager: ChildrenHandler
-    ) -> None:
+        self,
+        pop_manager: PopulationHandler,
+        children_manager: ChildrenHandler,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> bool:
         """Run double-point crossover for the current parent pairs.
 
         Args:
             pop_manager (PopulationHandler): Population memmap handler.
             children_manager (ChildrenHandler): Children memmap handler.
+            should_stop (Callable[[], bool] | None): Polled between stream
+                batches; returning ``True`` aborts the generation.
+
+        Returns:
+            bool: ``True`` if all children were produced.
         """
-        self._calculation_runner(self._kernel_double, pop_manager, children_manager)
+        return self._calculation_runner(
+            self._kernel_double, pop_manager, children_manager, should_stop
+        )
+
+    def child_parents(self) -> np.ndarray:
+        """Return the parent every child starts as before crossover.
+
+        Each stream batch writes the first children of its pairs, then the
+        second ones.
+
+        Returns:
+            np.ndarray: Population row of the parent of every children row.
+        """
+        batch = self.config.stream_batch_size
+        assert batch is not None
+        parents = [
+            self.parent_pairs[start : start + batch, column]
+            for start in range(0, len(self.parent_pairs), batch)
+            for column in (0, 1)
+        ]
+        return np.concatenate(parents)
 
     def _pair_parents(self) -> None:
         """Shuffle parent pool into pairs."""
@@ -129,13 +167,19 @@ class Reproduction:
         kernel: kernel_type,
         pop_manager: PopulationHandler,
         children_manager: ChildrenHandler,
-    ) -> None:
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> bool:
         """Execute crossover and mutation in streamed batches.
 
         Args:
             kernel (kernel_type): Crossover kernel to apply.
             pop_manager (PopulationHandler): Population memmap handler.
             children_manager (ChildrenHandler): Children memmap handler.
+            should_stop (Callable[[], bool] | None): Polled before every batch
+                but the first; returning ``True`` aborts the generation.
+
+        Returns:
+            bool: ``True`` if all children were produced, ``False`` if aborted.
         """
         population = pop_manager.get_pop_handle()
         children = children_manager.get_children_handle()
@@ -144,6 +188,8 @@ class Reproduction:
         self._setup()
         assert self.stream_batch is not None and self.rng is not None
         for start in range(0, len(self.parent_pairs), self.stream_batch):
+            if start > 0 and should_stop is not None and should_stop():
+                return False
             stop = min(start + self.stream_batch, len(self.parent_pairs))
             parent_indices = self.parent_pairs[start:stop]
             p1 = population[parent_indices[:, 0]]
@@ -157,6 +203,7 @@ class Reproduction:
                 self._mutation(c1, c2)
             children[start * 2 : stop * 2] = np.concatenate((c1, c2), axis=0)
             children.flush()
+        return True
 
     def _mutation(
         self, c1: genome_array, c2: genome_array
@@ -0,0 +1,145 @@
+"""Module recording the RNG state at the start of every generation."""
+
+import json
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+import numpy as np
+from src.classes.PathResolver import PathResolver
+
+RECORD = struct.Struct("<I16s16sBI")
+RNG_SUFFIX = ".rng"
+
+
+class RngStateRecorder:
+    """Appends compact PCG64 states to a per-run side file.
+
+    The file starts with one JSON line (run name and raw configuration) and is
+    followed by fixed-size binary records of ``RECORD.size`` (41) bytes: the
+    generation number, the 128-bit state and increment, and the buffered
+    32-bit output of the generator. Record ``0`` is taken right before the
+    initial population is drawn.
+    """
+
+    def __init__(self, paths: PathResolver, header: dict[str, Any]) -> None:
+        """Stores the side file location and the header to write.
+
+        Args:
+            paths (PathResolver): Resolver bound to the recorded run.
+            header (dict[str, Any]): JSON-serializable run description.
+        """
+        self.path = (
+            paths.get_checkpoint_path() / f"{paths.filename_constant}{RNG_SUFFIX}"
+        )
+        self.header = header
+        self.file: Optional[BinaryIO] = None
+
+    def open(self, resume_iteration: int | None = None) -> None:
+        """Creates the side file, or reopens it when continuing a run.
+
+        Args:
+            resume_iteration (int | None): Last generation restored from a
+                checkpoint. Records after it are dropped before appending.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume_iteration is None or not self.path.exists():
+            self.file = open(self.path, "wb")
+            self.file.write(json.dumps(self.header).encode() + b"\n")
+            return
+        with open(self.path, "rb") as file:
+            header_size = len(file.readline())
+        self.file = open(self.path, "r+b")
+        self.file.truncate(header_size + (resume_iteration + 1) * RECORD.size)
+        self.file.seek(0, 2)
+
+    def record(self, iteration: int, rng: np.random.Generator) -> None:
+        """Appends the current state of ``rng`` for a starting generation.
+
+        Args:
+            iteration (int): Generation about to be produced.
+            rng (np.random.Generator): Generator backed by ``PCG64``.
+
+        Raises:
+            RuntimeError: If the side file is not open.
+        """
+        if self.file is None:
+            raise RuntimeError("Recorder not opened. Call .open() first.")
+        self.file.write(pack_state(iteration, rng.bit_generator.state))
+        self.file.flush()
+
+    def close(self) -> None:
+        """Closes the side file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    @staticmethod
+    def load(path: str | Path) -> tuple[dict[str, Any], dict[int, dict[str, Any]]]:
+        """Reads a side file written by the recorder.
+
+        Args:
+            path (str | Path): Path of the ``.rng`` file.
+
+        Raises:
+            ValueError: If the file is truncated mid-record.
+
+        Returns:
+            tuple[dict, dict]: The header and the states keyed by generation.
+        """
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+            payload = file.read()
+        if len(payload) % RECORD.size != 0:
+            raise ValueError(f"{path} is corrupted")
+        states = {}
+        for offset in range(0, len(payload), RECORD.size):
+            iteration, state = unpack_state(payload[offset : offset + RECORD.size])
+            states[iteration] = state
+        return header, states
+
+
+def pack_state(iteration: int, state: Mapping[str, Any]) -> bytes:
+    """Packs a ``PCG64`` state dictionary into one binary record.
+
+    Args:
+        iteration (int): Generation the state belongs to.
+        state (Mapping[str, Any]): ``bit_generator.state`` of a ``PCG64``.
+
+    Raises:
+        ValueError: If the state is not a ``PCG64`` state.
+
+    Returns:
+        bytes: Record of ``RECORD.size`` bytes.
+    """
+    if state["bit_generator"] != "PCG64":
+        raise ValueError(f"Unsupported bit generator: {state['bit_generator']}")
+    return RECORD.pack(
+        iteration,
+        state["state"]["state"].to_bytes(16, "little"),
+        state["state"]["inc"].to_bytes(16, "little"),
+        state["has_uint32"],
+        state["uinteger"],
+    )
+
+
+def unpack_state(record: bytes) -> tuple[int, dict[str, Any]]:
+    """Inverse of ``pack_state``.
+
+    Args:
+        record (bytes): Record of ``RECORD.size`` bytes.
+
+    Returns:
+        tuple[int, dict[str, Any]]: Generation and ``PCG64`` state dictionary.
+    """
+    iteration, state, inc, has_uint32, uinteger = RECORD.unpack(record)
+    return iteration, {
+        "bit_generator": "PCG64",
+        "state": {
+            "state": int.from_bytes(state, "little"),
+            "inc": int.from_bytes(inc, "little"),
+        },
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
@@ -0,0 +1,92 @@
+"""Reusable session executing many runs of one instance back to back."""
+
+from collections.abc import Iterable
+
+import src.methods.logging_library as log
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.PathResolver import PathResolver
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.utils import load_data
+
+
+class RunnerSession:
+    """Amortizes instance loading and environment setup across many runs.
+
+    The session parses the instance once, creates a single output directory
+    tree and a single logger, and hands them to every ``EvolutionRunner`` it
+    starts. Each run only differs by its seed or overridden parameters and
+    writes its own CSV table into the shared ``output`` directory.
+    """
+
+    def __init__(self, input_config: dict, plot: bool = False) -> None:
+        """Load the instance and prepare the shared environment.
+
+        Args:
+            input_config (dict): Raw configuration values used as the base of
+                every run.
+            plot (bool): Whether every run ends with a plot and the final
+                screen. Defaults to ``False`` to keep per-run cost low.
+        """
+        self.base_config = dict(input_config)
+        self.config = ExperimentConfig(**self.base_config)
+        self.plot = plot
+        self.paths = PathResolver()
+        self.value_weight_array = load_data(
+            self.paths.get_dict_filepath(self.config.data_filename)
+        )
+        self.session_name = create_unique_experiment_name(
+            config=self.config,
+            genome_length=self.value_weight_array.shape[0],
+        )
+        self.paths.initialize(filename_constant=self.session_name)
+        self.session_name = self.paths.filename_constant
+        self.logger = log.initialize(config=self.config, paths=self.paths)
+        self.runs_started = 0
+
+    def run(self, seed: int | None = None, **overrides: object) -> EvolutionRunner:
+        """Execute one full run with the given seed and parameter overrides.
+
+        Args:
+            seed (int | None): Seed of this run. Keeps the base seed if ``None``.
+            **overrides: Configuration fields replacing base values, using the
+                keyword names of ``ExperimentConfig``.
+
+        Raises:
+            ValueError: If an override tries to change the instance.
+
+        Returns:
+            EvolutionRunner: The finished runner, e.g. for inspecting results.
+        """
+        filename = overrides.get("data_filename", self.config.data_filename)
+        if filename != self.config.data_filename:
+            raise ValueError("A session is bound to a single instance")
+        input_config = {**self.base_config, **overrides}
+        if seed is not None:
+            input_config["seed"] = seed
+        self.runs_started += 1
+        runner = EvolutionRunner(
+            input_config,
+            value_weight_array=self.value_weight_array,
+            paths=self.paths,
+            logger=self.logger,
+            filename_constant=f"{self.session_name}-RUN{self.runs_started:04d}",
+            report=self.plot,
+        )
+        runner.evolve()
+        return runner
+
+    def run_many(self, seeds: Iterable[int | None]) -> list[EvolutionRunner]:
+        """Execute one run per seed with the base configuration.
+
+        Args:
+            seeds (Iterable[int | None]): Seeds of consecutive runs.
+
+        Returns:
+            list[EvolutionRunner]: Finished runners in execution order.
+        """
+        return [self.run(seed=seed) for seed in seeds]
+
+    def close(self) -> None:
+        """Removes the shared temporary directory."""
+        self.paths.cleanup_temp_dir()
@@ -0,0 +1,50 @@
+"""Module defining the result of an in-process ``solve`` call."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class SolveResult:
+    """Best solution of a run together with its per-generation stats.
+
+    Attributes:
+        genome (np.ndarray): Best genome found during the run (uint8).
+        fitness (int): Fitness of ``genome``.
+        weight (int): Total weight of ``genome``.
+        stats (dict[str, np.ndarray]): Per-generation arrays named like the
+                                       CSV columns (``iteration``,
+                                       ``best_fitness``, ``best_weight``,
+                                       ``avg_fitness``, ``worst_fitness``,
+                                       ``worst_weight``,
+                                       ``identical_best_count``); index ``0``
+                                       is the initial population.
+    """
+
+    genome: np.ndarray
+    fitness: int
+    weight: int
+    stats: dict[str, np.ndarray]
+
+    def save(self, path: str | Path) -> Path:
+        """Write the result as an ``.npz`` archive.
+
+        Args:
+            path (str | Path): Destination file.
+
+        Returns:
+            Path: Path of the written file.
+        """
+        path = Path(path)
+        arrays: dict[str, Any] = {
+            "genome": self.genome,
+            "fitness": self.fitness,
+            "weight": self.weight,
+            **self.stats,
+        }
+        with open(path, "wb") as file:
+            np.savez(file, **arrays)
+        return path
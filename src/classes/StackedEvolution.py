@@ -0,0 +1,204 @@
+"""Module for evolving several independent populations in one vectorized pass.
+
+It provides the StackedEvolution class, which keeps ``B`` populations as a
+single in-memory ``(B, N, L)`` array and advances all of them together using
+the operators from ``src.methods.stacked_operators``.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.methods.stacked_operators import (
+    SELECTION_TYPES,
+    stacked_crossover,
+    stacked_fitness,
+    stacked_generation_stats,
+    stacked_mutation,
+    stacked_selection,
+)
+
+SHARED_FIELDS = (
+    "population_size",
+    "selection_type",
+    "crossover_type",
+    "penalty",
+    "selection_pressure",
+)
+
+
+class StackedEvolution:
+    """Evolves a stack of independent in-memory populations in lockstep.
+
+    Every stack member is described by its own ``ExperimentConfig``, which
+    supplies its RNG stream, weight limit and operator probabilities. Fields
+    that shape the arrays or pick the operators must be shared by all members.
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[ExperimentConfig],
+        values: np.ndarray,
+        weights: np.ndarray,
+        genome_lengths: Sequence[int] | None = None,
+    ) -> None:
+        """Validates the stack, creates generation zero and evaluates it.
+
+        Args:
+            configs (Sequence[ExperimentConfig]): One configuration per stack
+                member.
+            values (np.ndarray): Item values of shape ``(B, L)``.
+            weights (np.ndarray): Item weights of shape ``(B, L)``.
+            genome_lengths (Sequence[int] | None): Real genome length of each
+                member when shorter genomes are zero-padded to ``L``. Padded
+                genes must have zero value and weight; they stay ``0`` because
+                they are masked out of initialization and mutation.
+
+        Raises:
+            ValueError: If the stack is empty, the item arrays do not match the
+                number of configs, the configs disagree on shared fields or the
+                selection method has no stacked variant.
+        """
+        if not configs:
+            raise ValueError("At least one configuration is required")
+        if values.shape != weights.shape or values.shape[0] != len(configs):
+            raise ValueError("Item arrays must have shape (number of configs, genes)")
+        for field in SHARED_FIELDS:
+            if len({getattr(config, field) for config in configs}) != 1:
+                raise ValueError(f"Stacked configs must share the same {field}")
+        self.check_selection(configs[0].selection_type)
+        self.configs = list(configs)
+        self.rngs: list[np.random.Generator] = []
+        for config in self.configs:
+            assert config.rng is not None
+            self.rngs.append(config.rng)
+        first = self.configs[0]
+        self.population_size = first.population_size
+        self.selection_type = first.selection_type
+        self.crossover_type = first.crossover_type
+        self.selection_pressure = first.selection_pressure
+        self.penalty = first.penalty
+        self.values = np.asarray(values, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.max_weights = np.array([c.max_weight for c in self.configs])
+        self.crossover_probabilities = np.array(
+            [c.crossover_probability for c in self.configs]
+        )
+        self.mutation_probabilities = np.array(
+            [c.mutation_probability for c in self.configs]
+        )
+        if genome_lengths is None:
+            genome_lengths = [self.values.shape[1]] * len(self.configs)
+        self.genome_lengths = np.asarray(genome_lengths, dtype=np.int64)
+        self.gene_mask = (
+            np.arange(self.values.shape[1])[None, :] < self.genome_lengths[:, None]
+        )
+        self.iteration = 0
+        self.population = self._initial_population()
+        self.fitness = self.evaluate()
+
+    @staticmethod
+    def check_selection(selection_type: str) -> None:
+        """Reject selection methods without a stacked variant, e.g. ``pareto``.
+
+        Runners call this before they create any files.
+
+        Args:
+            selection_type (str): Configured selection method.
+
+        Raises:
+            ValueError: If the stacked operators do not implement it.
+        """
+        if selection_type not in SELECTION_TYPES:
+            raise ValueError(
+                f"Selection method {selection_type} is not supported by stacked "
+                "evolution"
+            )
+
+    @property
+    def stack_size(self) -> int:
+        """Number of populations held in the stack."""
+        return len(self.configs)
+
+    @property
+    def genome_length(self) -> int:
+        """Number of genes in every genome of the stack."""
+        return int(self.values.shape[1])
+
+    def _initial_population(self) -> np.ndarray:
+        """Samples generation zero with each member's own Bernoulli bias."""
+        shape = (self.population_size, self.genome_length)
+        population = np.stack(
+            [
+                rng.random(size=shape)
+                < config.generate_probability_of_failure(int(self.weights[b].sum()))
+                for b, (config, rng) in enumerate(zip(self.configs, self.rngs))
+            ]
+        )
+        population &= self.gene_mask[:, None, :]
+        return population.astype(np.uint8)
+
+    def evaluate(self) -> np.ndarray:
+        """Computes fitness of the whole stack with one batched matmul per array.
+
+        Returns:
+            np.ndarray: Array of shape ``(B, N, 2)`` with [fitness, weight].
+        """
+        return stacked_fitness(
+            population=self.population,
+            values=self.values,
+            weights=self.weights,
+            max_weights=self.max_weights,
+            penalty_factor=self.penalty,
+        )
+
+    def step(self, out: np.ndarray | None = None) -> None:
+        """Advances every population by one generation and re-evaluates it.
+
+        Args:
+            out (np.ndarray | None): Buffer that becomes the next population,
+                see ``stacked_crossover``. Defaults to a new array.
+        """
+        parents = stacked_selection(
+            selection_type=self.selection_type,
+            fitness=self.fitness,
+            rngs=self.rngs,
+            selection_pressure=self.selection_pressure,
+        )
+        children = stacked_crossover(
+            population=self.population,
+            parents=parents,
+            crossover_type=self.crossover_type,
+            crossover_probabilities=self.crossover_probabilities,
+            rngs=self.rngs,
+            genome_lengths=self.genome_lengths,
+            out=out,
+        )
+        self.population = stacked_mutation(
+            children=children,
+            mutation_probabilities=self.mutation_probabilities,
+            rngs=self.rngs,
+            gene_mask=self.gene_mask,
+        )
+        self.fitness = self.evaluate()
+        self.iteration += 1
+
+    def statistics(self) -> tuple[np.ndarray, ...]:
+        """Returns per-population generation stats.
+
+        Returns:
+            tuple: See ``stacked_generation_stats``.
+        """
+        return stacked_generation_stats(self.fitness)
+
+    def genomes(self, indices: np.ndarray) -> np.ndarray:
+        """Returns one genome per population.
+
+        Args:
+            indices (np.ndarray): Index of the requested individual in each
+                population, shape ``(B,)``.
+
+        Returns:
+            np.ndarray: Genomes of shape ``(B, L)``.
+        """
+        return self.population[np.arange(self.stack_size), indices]
@@ -0,0 +1,174 @@
+"""Module evaluating configurable early stopping criteria of a run."""
+
+import math
+from logging import LoggerAdapter
+
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.GenerationStats import GenerationStats
+
+OPTIMUM_REACHED = "optimum_reached"
+LP_BOUND_REACHED = "lp_bound_reached"
+STAGNATION = "stagnation"
+DIVERSITY_COLLAPSE = "diversity_collapse"
+TIME_BUDGET = "time_budget"
+EVALUATION_BUDGET = "evaluation_budget"
+GENERATIONS_COMPLETED = "generations_completed"
+INTERRUPTED = "interrupted"
+
+
+class StoppingCriteria:
+    """Decides after every generation whether the run should stop early.
+
+    Criteria are enabled through ``ExperimentConfig`` and checked in a fixed
+    order: known optimum, LP upper bound, stagnation and diversity floor. The
+    first satisfied criterion is reported as the stop reason. Time and
+    evaluation budgets are checked separately, before any work is started.
+    """
+
+    def __init__(
+        self,
+        config: ExperimentConfig,
+        logger: LoggerAdapter,
+        optimum: float | None = None,
+        lp_bound: float | None = None,
+    ) -> None:
+        """Stores thresholds and initializes stagnation tracking.
+
+        Args:
+            config (ExperimentConfig): Configuration enabling the criteria.
+            logger (LoggerAdapter): Logger used to report the stop decision.
+            optimum (float | None): Known optimum of the instance. Required
+                when ``config.stop_at_optimum`` is set.
+            lp_bound (float | None): LP relaxation upper bound. Required when
+                ``config.lp_bound_tolerance`` is set.
+        """
+        self._logger = logger
+        self.optimum = optimum if config.stop_at_optimum else None
+        self.lp_target: float | None = None
+        self._lp_tolerance = config.lp_bound_tolerance
+        if config.lp_bound_tolerance is not None and lp_bound is not None:
+            self.lp_target = math.floor(lp_bound) * (1 - config.lp_bound_tolerance)
+        self.stagnation_window = config.stagnation_window
+        self.diversity_floor = config.diversity_floor
+        self.time_budget = config.time_budget
+        self.evaluation_budget = config.evaluation_budget
+        self.best_so_far: int | None = None
+        self.generations_without_improvement = 0
+
+    def state(self) -> dict[str, int | None]:
+        """Return the stagnation tracking state, e.g. for checkpoints."""
+        return {
+            "best_so_far": self.best_so_far,
+            "generations_without_improvement": self.generations_without_improvement,
+        }
+
+    def load_state(self, state: dict[str, int | None]) -> None:
+        """Restore stagnation tracking saved by ``state``.
+
+        Args:
+            state (dict[str, int | None]): Previously saved tracking state.
+        """
+        self.best_so_far = state["best_so_far"]
+        self.generations_without_improvement = int(
+            state["generations_without_improvement"] or 0
+        )
+
+    def rebase(self, lp_bound: float | None = None) -> None:
+        """Drop targets and tracking that belong to a changed instance.
+
+        The known optimum is discarded, the LP target is recomputed from the
+        new bound and stagnation tracking starts over.
+
+        Args:
+            lp_bound (float | None): LP relaxation upper bound of the changed
+                instance. Required to keep the LP target.
+        """
+        self.optimum = None
+        self.lp_target = None
+        if self._lp_tolerance is not None and lp_bound is not None:
+            self.lp_target = math.floor(lp_bound) * (1 - self._lp_tolerance)
+        self.best_so_far = None
+        self.generations_without_improvement = 0
+
+    @property
+    def needs_diversity(self) -> bool:
+        """Whether ``check`` expects the current population diversity."""
+        return self.diversity_floor is not None
+
+    def check(
+        self, stats: GenerationStats, diversity: float | None = None
+    ) -> str | None:
+        """Update tracking state with a finished generation and test criteria.
+
+        Args:
+            stats (GenerationStats): Stats of the finished generation.
+            diversity (float | None): Population diversity in [0, 1]; only
+                used when a diversity floor is configured.
+
+        Returns:
+            str | None: The stop reason, or ``None`` to continue.
+        """
+        if self.best_so_far is None or stats.best_fitness > self.best_so_far:
+            self.best_so_far = stats.best_fitness
+            self.generations_without_improvement = 0
+        else:
+            self.generations_without_improvement += 1
+
+        reason = None
+        if self.optimum is not None and stats.best_fitness >= self.optimum:
+            reason = OPTIMUM_REACHED
+        elif self.lp_target is not None and stats.best_fitness >= self.lp_target:
+            reason = LP_BOUND_REACHED
+        elif (
+            self.stagnation_window is not None
+            and self.generations_without_improvement >= self.stagnation_window
+        ):
+            reason = STAGNATION
+        elif (
+            self.diversity_floor is not None
+            and diversity is not None
+            and diversity < self.diversity_floor
+        ):
+            reason = DIVERSITY_COLLAPSE
+        if reason is not None:
+            self._logger.info(f"Stopping after generation {stats.iteration}: {reason}")
+        return reason
+
+    def out_of_time(self, elapsed: float) -> bool:
+        """Whether the wall-clock budget is used up.
+
+        Args:
+            elapsed (float): Seconds elapsed since the run started.
+
+        Returns:
+            bool: ``True`` if a time budget is set and has been reached.
+        """
+        return self.time_budget is not None and elapsed >= self.time_budget
+
+    def check_budget(
+        self, elapsed: float, evaluations: int, next_evaluations: int
+    ) -> str | None:
+        """Test whether the budgets allow starting another generation.
+
+        Args:
+            elapsed (float): Seconds elapsed since the run started.
+            evaluations (int): Fitness evaluations performed so far.
+            next_evaluations (int): Evaluations the next generation would cost.
+
+        Returns:
+            str | None: The exhausted budget, or ``None`` to continue.
+        """
+        reason = None
+        if self.out_of_time(elapsed):
+            reason = TIME_BUDGET
+        elif (
+            self.evaluation_budget is not None
+            and evaluations + next_evaluations > self.evaluation_budget
+        ):
+            reason = EVALUATION_BUDGET
+        if reason is not None:
+            self._logger.info(
+                f"Budget exhausted after {evaluations} evaluations "
+                f"and {elapsed:.3f} s: {reason}"
+            )
+        return reason
@@ -0,0 +1,272 @@
+"""Run many configurations and seeds in parallel worker processes."""
+
+import csv
+import datetime
+import itertools
+import logging
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import yaml
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.PathResolver import PathResolver
+from src.methods.experiment_defining_tools import create_unique_experiment_name
+from src.methods.utils import load_data
+
+SUMMARY_FILENAME = "summary.csv"
+SUMMARY_FIELDS = (
+    "job",
+    "run",
+    "seed",
+    "best_fitness",
+    "best_weight",
+    "last_iteration",
+    "evaluations",
+    "stop_reason",
+    "elapsed",
+)
+
+
+def expand_grid(
+    base: Mapping[str, Any], grid: Mapping[str, Sequence[Any]]
+) -> list[dict]:
+    """Build one configuration per combination of grid values.
+
+    Args:
+        base (Mapping[str, Any]): Flat configuration shared by all jobs, as
+            returned by ``load_yaml_config``.
+        grid (Mapping[str, Sequence[Any]]): Values tried for each overridden
+            ``ExperimentConfig`` field.
+
+    Returns:
+        list[dict]: Configurations in row-major order of the grid.
+    """
+    keys = list(grid)
+    return [
+        {**base, **dict(zip(keys, values))}
+        for values in itertools.product(*(grid[key] for key in keys))
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class SharedInstance:
+    """Location of an instance published in shared memory."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True, slots=True)
+class SweepJob:
+    """One configuration and seed to evolve in a worker."""
+
+    index: int
+    config: dict
+    run_name: str
+    instance: SharedInstance
+
+
+def _run_job(job: SweepJob) -> dict[str, Any]:
+    """Evolve one job on the shared instance and return its summary row."""
+    memory = shared_memory.SharedMemory(name=job.instance.name)
+    items: np.ndarray = np.ndarray(
+        job.instance.shape, dtype=job.instance.dtype, buffer=memory.buf
+    )
+    row = _evolve(job, items)
+    # On failure the mapping is released when the worker exits instead.
+    del items
+    memory.close()
+    return row
+
+
+def _evolve(job: SweepJob, items: np.ndarray) -> dict[str, Any]:
+    """Run the evolution of one job; the runner only lives in this frame."""
+    # A worker runs many jobs, and the logger keeps the file of the first one.
+    main_logger = logging.getLogger("GA experiment run")
+    for handler in list(main_logger.handlers):
+        main_logger.removeHandler(handler)
+        handler.close()
+    runner = EvolutionRunner(
+        job.config,
+        value_weight_array=items,
+        filename_constant=job.run_name,
+        report=False,
+    )
+    with runner:
+        for _ in runner.steps():
+            pass
+    return {
+        "job": job.index,
+        "run": job.run_name,
+        "seed": job.config["seed"],
+        "best_fitness": runner.last_stats.best_fitness,
+        "best_weight": runner.last_stats.best_weight,
+        "last_iteration": runner.last_stats.iteration,
+        "evaluations": runner.evaluations,
+        "stop_reason": runner.stop_reason,
+        "elapsed": round(runner.timer.total_elapsed(), 3),
+    }
+
+
+class SweepExecutor:
+    """Runs configurations x seeds as independent jobs on a process pool.
+
+    Every instance is loaded once and published in ``multiprocessing``
+    shared memory; workers map it instead of reading the data file. Each job
+    is a normal ``EvolutionRunner`` run with its own run directory, claimed
+    up front with ``PathResolver.reserve_run`` so parallel jobs never collide.
+    When all jobs are done, one row per job is written to
+    ``run_output/<sweep>/summary.csv``, ordered by job index, with the
+    configuration fields that vary across the sweep as extra columns.
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[dict],
+        seeds: Sequence[int] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Validate the configurations and lay out the jobs.
+
+        Args:
+            configs (Sequence[dict]): Flat configurations of the sweep.
+            seeds (Sequence[int] | None): Seeds every configuration is run
+                with. Defaults to the seed of each configuration.
+            max_workers (int | None): Worker processes. Defaults to the number
+                of CPUs.
+
+        Raises:
+            ValueError: If no configuration is given or one is invalid.
+        """
+        if not configs:
+            raise ValueError("Sweep needs at least one configuration")
+        self.configs = [
+            {**config, "seed": seed}
+            for config in configs
+            for seed in (seeds if seeds is not None else [config["seed"]])
+        ]
+        for config in self.configs:
+            ExperimentConfig(**config)
+        self.max_workers = max_workers
+        self.paths = PathResolver()
+        self.varied = sorted(
+            key
+            for key in set().union(*self.configs)
+            if key != "seed"
+            and len({repr(config.get(key)) for config in self.configs}) > 1
+        )
+        self.summary_path: Path | None = None
+
+    @classmethod
+    def from_grid(
+        cls,
+        base: Mapping[str, Any],
+        grid: Mapping[str, Sequence[Any]],
+        seeds: Sequence[int] | None = None,
+        max_workers: int | None = None,
+    ) -> "SweepExecutor":
+        """Create a sweep over every combination of grid values.
+
+        Args:
+            base (Mapping[str, Any]): Flat configuration shared by all jobs.
+            grid (Mapping[str, Sequence[Any]]): Values tried for each field.
+            seeds (Sequence[int] | None): Seeds every combination is run with.
+            max_workers (int | None): Worker processes.
+
+        Returns:
+            SweepExecutor: The sweep, not started yet.
+        """
+        return cls(expand_grid(base, grid), seeds=seeds, max_workers=max_workers)
+
+    @classmethod
+    def from_yaml(cls, base: Mapping[str, Any], path: str | Path) -> "SweepExecutor":
+        """Create a sweep described by a YAML file.
+
+        The file may hold ``grid`` (field -> list of values), ``seeds`` and
+        ``max_workers``.
+
+        Args:
+            base (Mapping[str, Any]): Flat configuration shared by all jobs.
+            path (str | Path): Sweep file.
+
+        Returns:
+            SweepExecutor: The sweep, not started yet.
+        """
+        with open(path, "r") as file:
+            sweep = yaml.safe_load(file) or {}
+        return cls.from_grid(
+            base,
+            sweep.get("grid") or {},
+            seeds=sweep.get("seeds"),
+            max_workers=sweep.get("max_workers"),
+        )
+
+    def run(self) -> list[dict[str, Any]]:
+        """Run all jobs and write the summary.
+
+        Returns:
+            list[dict[str, Any]]: Summary row of every job, by job index.
+        """
+        sweep_name = self.paths.reserve_run(
+            f"sweep-{datetime.datetime.now().strftime('%Y%m%dT%H%M%S')}"
+        )
+        memories: dict[str, shared_memory.SharedMemory] = {}
+        try:
+            instances = {
+                name: self._share(name, memories)
+                for name in dict.fromkeys(c["data_filename"] for c in self.configs)
+            }
+            jobs = [
+                SweepJob(
+                    index=index,
+                    config=config,
+                    run_name=self._reserve_name(index, config, instances),
+                    instance=instances[config["data_filename"]],
+                )
+                for index, config in enumerate(self.configs)
+            ]
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                rows = list(pool.map(_run_job, jobs))
+        finally:
+            for memory in memories.values():
+                memory.close()
+                memory.unlink()
+        for row, config in zip(rows, self.configs):
+            row.update({key: config.get(key) for key in self.varied})
+        self.summary_path = (
+            Path(self.paths.PROJECT_ROOT) / "run_output" / sweep_name / SUMMARY_FILENAME
+        )
+        with open(self.summary_path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=[*SUMMARY_FIELDS, *self.varied])
+            writer.writeheader()
+            writer.writerows(rows)
+        return rows
+
+    def _share(
+        self, data_filename: str, memories: dict[str, shared_memory.SharedMemory]
+    ) -> SharedInstance:
+        """Load one instance and copy it into a new shared memory block."""
+        items = load_data(self.paths.get_dict_filepath(data_filename))
+        memory = shared_memory.SharedMemory(create=True, size=max(1, items.nbytes))
+        memories[data_filename] = memory
+        shared: np.ndarray = np.ndarray(items.shape, items.dtype, buffer=memory.buf)
+        shared[:] = items
+        del shared
+        return SharedInstance(memory.name, items.shape, items.dtype.str)
+
+    def _reserve_name(
+        self, index: int, config: dict, instances: dict[str, SharedInstance]
+    ) -> str:
+        """Claim the run directory of one job."""
+        name = create_unique_experiment_name(
+            config=ExperimentConfig(**config),
+            genome_length=instances[config["data_filename"]].shape[0],
+        )
+        return self.paths.reserve_run(f"{name}-J{index:03d}")
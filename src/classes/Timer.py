@@ -20,6 +20,7 @@ class Timer:
         self._start: Optional[float] = None
         self._stop: Optional[float] = None
         self._exp_start: float = perf_counter()
+        self._runtime_logged = False
         self._generations: int = config.generations
         self._logger = logger
         logger.debug("TIMER initalized")
@@ -47,8 +48,30 @@ class Timer:
         self.elapsed(generation=generation)
         self.eta_left(generation)
         if generation == self._generations:
-            runtime = self._stop - self._exp_start
-            self._logger.info("Program worked for %.3f s", runtime)
+            self.log_runtime()
+
+    def log_runtime(self) -> None:
+        """Log the wall-clock time of the experiment, once per experiment."""
+        if self._runtime_logged:
+            return
+        self._runtime_logged = True
+        self._logger.info("Program worked for %.3f s", self.total_elapsed())
+
+    def total_elapsed(self) -> float:
+        """Return seconds elapsed since the timer (experiment) was created.
+
+        Returns:
+            float: Wall-clock time of the experiment so far.
+        """
+        return perf_counter() - self._exp_start
+
+    def set_elapsed(self, seconds: float) -> None:
+        """Rebase the experiment start, e.g. when continuing from a checkpoint.
+
+        Args:
+            seconds: Wall-clock time the experiment already used.
+        """
+        self._exp_start = perf_counter() - seconds
 
     def elapsed(self, generation: int) -> None:
         """Log elapsed time for the current generation.
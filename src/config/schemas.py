@@ -20,6 +20,7 @@ class SelectionType(str, Enum):
     ROULETTE = "roulette"
     TOURNAMENT = "tournament"
     LINEAR_RANK = "rank"
+    PARETO = "pareto"
 
 
 class CrossoverType(str, Enum):
@@ -78,6 +79,116 @@ class ExperimentVals(BaseModel):
     log_level: LogLevel
 
 
+class StoppingConfig(BaseModel):
+    """Optional early stopping criteria."""
+
+    stop_at_optimum: bool = False
+    lp_bound_tolerance: Optional[float] = None
+    stagnation_window: Optional[int] = None
+    diversity_floor: Optional[float] = None
+
+
+class BudgetConfig(BaseModel):
+    """Optional wall-clock and evaluation-count budgets."""
+
+    time_budget: Optional[float] = None
+    evaluation_budget: Optional[int] = None
+
+
+class CheckpointConfig(BaseModel):
+    """Optional periodic checkpointing of a run."""
+
+    checkpoint_interval: Optional[int] = None
+    checkpoint_seconds: Optional[float] = None
+    record_rng_states: bool = False
+
+
+class PopulationSizingConfig(BaseModel):
+    """Optional adaptive population sizing."""
+
+    adaptive_population: bool = False
+    min_population_size: Optional[int] = None
+    max_population_size: Optional[int] = None
+    convergence_threshold: float = 0.5
+    growth_window: int = 20
+
+
+class LocalSearchConfig(BaseModel):
+    """Optional hill climbing of elite individuals."""
+
+    local_search_interval: Optional[int] = None
+    local_search_elites: int = 1
+    local_search_steps: int = 50
+
+
+class InitializationConfig(BaseModel):
+    """Optional heuristic seeding of the initial population."""
+
+    greedy_init_share: float = 0.0
+    lp_init_share: float = 0.0
+
+
+class ImmigrantType(str, Enum):
+    """Allowed kinds of immigrants replacing duplicates."""
+
+    RANDOM = "random"
+    PERTURBED = "perturbed"
+
+
+class DuplicatesConfig(BaseModel):
+    """Optional replacement of duplicate genomes."""
+
+    replace_duplicates: bool = False
+    immigrant_type: ImmigrantType = ImmigrantType.RANDOM
+    perturbation_probability: float = 0.05
+
+
+class ArchiveConfig(BaseModel):
+    """Optional archive of the best unique solutions."""
+
+    hall_of_fame_size: Optional[int] = None
+
+
+class PreprocessingConfig(BaseModel):
+    """Optional reduction of the instance before evolution."""
+
+    reduce_problem: bool = False
+
+
+class LocusFreezingConfig(BaseModel):
+    """Optional removal of converged loci from the evolved genome."""
+
+    freeze_interval: Optional[int] = None
+
+
+class WarmStartConfig(BaseModel):
+    """Optional start from genomes of a previous run."""
+
+    initial_population: Optional[str] = None
+    save_population: bool = False
+
+
+class DynamicConfig(BaseModel):
+    """Optional changes of the instance during the run."""
+
+    dynamic_instance: bool = False
+
+
+class ParameterlessConfig(BaseModel):
+    """Optional settings of the parameter-less population race."""
+
+    counter_base: int = 4
+    max_populations: int = 12
+
+
+class EdaConfig(BaseModel):
+    """Optional settings of the estimation-of-distribution engines."""
+
+    learning_rate: float = 0.1
+    mutation_shift: float = 0.05
+    virtual_population: Optional[int] = None
+
+
 class JobConfig(BaseModel):
     """Aggregate configuration for a GA run."""
 
@@ -86,3 +197,17 @@ class JobConfig(BaseModel):
     selection: SelectionConfig
     genetic_operators: GeneticOperatorsConfig
     experiment: ExperimentVals
+    stopping: Optional[StoppingConfig] = None
+    budget: Optional[BudgetConfig] = None
+    checkpoint: Optional[CheckpointConfig] = None
+    population_sizing: Optional[PopulationSizingConfig] = None
+    local_search: Optional[LocalSearchConfig] = None
+    initialization: Optional[InitializationConfig] = None
+    duplicates: Optional[DuplicatesConfig] = None
+    archive: Optional[ArchiveConfig] = None
+    preprocessing: Optional[PreprocessingConfig] = None
+    locus_freezing: Optional[LocusFreezingConfig] = None
+    warm_start: Optional[WarmStartConfig] = None
+    dynamic: Optional[DynamicConfig] = None
+    parameterless: Optional[ParameterlessConfig] = None
+    eda: Optional[EdaConfig] = None
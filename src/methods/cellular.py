@@ -0,0 +1,141 @@
+"""Defines neighbourhood operations of the cellular genetic algorithm.
+
+In a cellular GA the population sits on a 2D torus grid and every cell only
+mates within its neighbourhood, so good genes spread by diffusion instead of
+taking over the whole population at once. All cells are updated
+synchronously: neighbourhoods are read by shifting whole grids with
+``np.roll``, one shift per neighbour offset, without looping over cells.
+"""
+
+import numpy as np
+
+NEIGHBORHOODS = {
+    "von_neumann": ((-1, 0), (1, 0), (0, -1), (0, 1)),
+    "moore": (
+        (-1, -1),
+        (-1, 0),
+        (-1, 1),
+        (0, -1),
+        (0, 1),
+        (1, -1),
+        (1, 0),
+        (1, 1),
+    ),
+}
+
+
+def grid_shape(size: int) -> tuple[int, int]:
+    """Return the most square (rows, columns) grid holding ``size`` cells.
+
+    Args:
+        size (int): Number of individuals.
+
+    Returns:
+        tuple[int, int]: Grid shape with ``rows <= columns``.
+    """
+    rows = int(np.sqrt(size))
+    while size % rows:
+        rows -= 1
+    return rows, size // rows
+
+
+def fitness_ranks(fitness: np.ndarray) -> np.ndarray:
+    """Rank individuals by fitness, then by lower weight; ``0`` is the best.
+
+    Args:
+        fitness (np.ndarray): Array of shape (individuals, 2) with
+            [fitness, weight].
+
+    Returns:
+        np.ndarray: Position of every individual in the ranking.
+    """
+    ranks = np.empty(len(fitness), dtype=np.int64)
+    ranks[np.lexsort((fitness[:, 1], -fitness[:, 0]))] = np.arange(len(fitness))
+    return ranks
+
+
+def neighborhood_tournament(
+    fitness: np.ndarray,
+    shape: tuple[int, int],
+    neighborhood: str,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Pick a mate for every cell by a binary tournament among its neighbours.
+
+    The rank grid and the index grid are rolled once per neighbour offset, so
+    every cell sees the ranks and indices of all its neighbours at the same
+    position. Two neighbours are drawn per cell and the better one wins.
+
+    Args:
+        fitness (np.ndarray): Array of shape (individuals, 2) with
+            [fitness, weight], in row-major grid order.
+        shape (tuple[int, int]): Grid shape, as returned by ``grid_shape``.
+        neighborhood (str): ``von_neumann`` (4 neighbours) or ``moore`` (8).
+        rng (np.random.Generator): Random number generator of the experiment.
+
+    Raises:
+        ValueError: If the neighbourhood is unknown.
+
+    Returns:
+        np.ndarray: Index of the mate of every cell.
+    """
+    if neighborhood not in NEIGHBORHOODS:
+        raise ValueError(f"Invalid neighborhood: {neighborhood}")
+    offsets = NEIGHBORHOODS[neighborhood]
+    rank_grid = fitness_ranks(fitness).reshape(shape)
+    index_grid = np.arange(len(fitness)).reshape(shape)
+    # Rolling by (-dy, -dx) brings the neighbour at (dy, dx) to every cell.
+    rolled_ranks = np.stack(
+        [np.roll(rank_grid, (-dy, -dx), axis=(0, 1)) for dy, dx in offsets]
+    ).reshape(len(offsets), -1)
+    rolled_indices = np.stack(
+        [np.roll(index_grid, (-dy, -dx), axis=(0, 1)) for dy, dx in offsets]
+    ).reshape(len(offsets), -1)
+    cells = np.arange(len(fitness))
+    first, second = rng.integers(0, len(offsets), size=(2, len(fitness)))
+    first_wins = rolled_ranks[first, cells] <= rolled_ranks[second, cells]
+    return np.where(
+        first_wins, rolled_indices[first, cells], rolled_indices[second, cells]
+    )
+
+
+def cellular_offspring(
+    cells: np.ndarray,
+    mates: np.ndarray,
+    crossover_type: str,
+    crossover_probability: float,
+    mutation_probability: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Cross every cell with its mate and mutate the single child.
+
+    The child keeps the genes of the cell outside the crossover segment and
+    takes the segment from the mate.
+
+    Args:
+        cells (np.ndarray): Binary genomes of the cells, (cells, genes).
+        mates (np.ndarray): Binary genomes of their mates, same shape.
+        crossover_type (str): ``one`` or ``two`` point crossover.
+        crossover_probability (float): Probability that a cell is crossed.
+        mutation_probability (float): Per-gene mutation probability.
+        rng (np.random.Generator): Random number generator of the experiment.
+
+    Returns:
+        np.ndarray: One child per cell.
+    """
+    count, genome_length = cells.shape
+    column_index = np.arange(genome_length)
+    if crossover_type == "one":
+        start = np.asarray(rng.integers(1, genome_length, size=count))
+        stop = np.full(count, genome_length)
+    else:
+        start = np.asarray(rng.integers(1, genome_length - 1, size=count))
+        stop = np.asarray(rng.integers(start + 1, genome_length, size=count))
+    cut_mask = (column_index[None, :] >= start[:, None]) & (
+        column_index[None, :] < stop[:, None]
+    )
+    cut_mask &= np.asarray(rng.random(count) < crossover_probability)[:, None]
+    children = np.where(cut_mask, mates, cells)
+    if mutation_probability > 0:
+        children[rng.random(children.shape) < mutation_probability] ^= 1
+    return children
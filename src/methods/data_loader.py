@@ -52,6 +52,65 @@ def load_data(path: str | Path) -> np.ndarray:
     return items
 
 
+def load_optimum(path: str | Path) -> float:
+    """Load the known optimum value of an instance.
+
+    Args:
+        path (str | pathlib.Path): Path to the optimum file; its first token is
+            the optimum value.
+
+    Returns:
+        float: The optimum value.
+
+    Raises:
+        FileNotFoundError: If the file does not exist at the given path.
+        ValueError: If the file is empty or its first token is not numeric.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found {path}")
+    with open(path) as f:
+        tokens = f.read().split()
+    if not tokens:
+        raise ValueError("File is empty")
+    try:
+        return float(tokens[0])
+    except ValueError:
+        raise ValueError(f"Invalid optimum value: {tokens[0]}")
+
+
+def load_capacity(path: str | Path) -> int:
+    """Load the knapsack capacity stated in the header line of an instance.
+
+    Instance files start with a ``<items> <capacity>`` line followed by one
+    line per item.
+
+    Args:
+        path (str | pathlib.Path): Path to the instance file.
+
+    Returns:
+        int: The capacity from the header line.
+
+    Raises:
+        FileNotFoundError: If the file does not exist at the given path.
+        ValueError: If the first line is not a header whose item count matches
+            the number of remaining lines.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found {path}")
+    with open(path) as f:
+        lines = [line.split() for line in f.readlines() if line.strip()]
+    if not lines:
+        raise ValueError("File is empty")
+    header = lines[0]
+    if (
+        len(header) != 2
+        or not all(token.isdigit() for token in header)
+        or int(header[0]) != len(lines) - 1
+    ):
+        raise ValueError(f"No '<items> <capacity>' header line in {path}")
+    return int(header[1])
+
+
 def load_yaml_config(filepath: Path | str) -> dict:
     """Load experiment configuration from a YAML file.
 
@@ -69,14 +128,19 @@ def load_yaml_config(filepath: Path | str) -> dict:
         ``generations``, ``stream_batch_size``, ``selection_type``,
         ``selection_pressure``, ``crossover_type``, ``crossover_probability``,
         ``mutation_probability``, ``penalty``, ``seed``,
-        ``experiment_identifier``, and ``log_level``.
+        ``experiment_identifier``, and ``log_level``. Fields of optional
+        sections (``stopping``, ``budget``, ``checkpoint``,
+        ``population_sizing``, ``local_search``, ``initialization``,
+        ``duplicates``, ``archive``, ``preprocessing``, ``locus_freezing``,
+        ``warm_start``, ``dynamic``, ``parameterless``, ``eda``) are only
+        included when the section is present.
     """
     with open(filepath, "r") as file:
         yaml_file = yaml.safe_load(file)
 
     job = JobConfig.model_validate(yaml_file)
 
-    return {
+    config = {
         "data_filename": job.data.filename,
         "max_weight": job.data.max_weight,
         "population_size": job.population.size,
@@ -92,3 +156,32 @@ def load_yaml_config(filepath: Path | str) -> dict:
         "experiment_identifier": job.experiment.identifier,
         "log_level": job.experiment.log_level.value,  # Enum → str
     }
+    if job.stopping is not None:
+        config.update(job.stopping.model_dump())
+    if job.budget is not None:
+        config.update(job.budget.model_dump())
+    if job.checkpoint is not None:
+        config.update(job.checkpoint.model_dump())
+    if job.population_sizing is not None:
+        config.update(job.population_sizing.model_dump())
+    if job.local_search is not None:
+        config.update(job.local_search.model_dump())
+    if job.initialization is not None:
+        config.update(job.initialization.model_dump())
+    if job.duplicates is not None:
+        config.update(job.duplicates.model_dump(mode="json"))
+    if job.archive is not None:
+        config.update(job.archive.model_dump())
+    if job.preprocessing is not None:
+        config.update(job.preprocessing.model_dump())
+    if job.locus_freezing is not None:
+        config.update(job.locus_freezing.model_dump())
+    if job.warm_start is not None:
+        config.update(job.warm_start.model_dump())
+    if job.dynamic is not None:
+        config.update(job.dynamic.model_dump())
+    if job.parameterless is not None:
+        config.update(job.parameterless.model_dump())
+    if job.eda is not None:
+        config.update(job.eda.model_dump())
+    return config
@@ -6,6 +6,39 @@ from src.classes.ExperimentConfig import ExperimentConfig
 from src.classes.PopulationHandler import PopulationHandler
 
 
+def apply_penalty(
+    scores: np.ndarray,
+    weights: np.ndarray,
+    max_weight: int | np.ndarray,
+    penalty_factor: float,
+) -> np.ndarray:
+    """Penalize raw value sums of individuals that exceed the weight limit.
+
+    Works element-wise, so ``scores`` and ``weights`` may have any shape as long
+    as ``max_weight`` broadcasts against them.
+
+    Args:
+        scores (np.ndarray): Raw value sums of the individuals.
+        weights (np.ndarray): Raw weight sums of the individuals.
+        max_weight (int | np.ndarray): Maximum allowed total weight.
+        penalty_factor (float): Factor used to penalize overweight individuals.
+            ``0`` nullifies the score of every overweight individual.
+
+    Returns:
+        np.ndarray: Penalized scores with the same shape as ``scores``.
+    """
+    over_limit_mask = weights > max_weight
+    if penalty_factor == 0:
+        penalty_value = scores
+    else:
+        penalty_value = np.maximum(0, (weights - max_weight) * (penalty_factor))
+    return np.where(
+        over_limit_mask,
+        np.maximum(0, (scores - penalty_value)),
+        scores,
+    )
+
+
 def fitness_calculation(
     max_weight: int,
     penalty_factor: float,
@@ -13,9 +46,14 @@ def fitness_calculation(
     batch: int,
     value_arr: np.ndarray,
     weight_arr: np.ndarray,
+    value_offset: int = 0,
+    weight_offset: int = 0,
 ) -> np.ndarray:
     """Calculate penalized fitness and total weight for each individual.
 
+    The offsets add items outside the genome, e.g. items fixed by problem
+    reduction, before the penalty is applied.
+
     Args:
         max_weight (int): Maximum allowed total weight.
         penalty_factor (float): Factor used to penalize overweight individuals.
@@ -23,39 +61,83 @@ def fitness_calculation(
         batch (int): Batch size used for streaming computation.
         value_arr (np.ndarray): Value of each gene.
         weight_arr (np.ndarray): Weight of each gene.
+        value_offset (int): Value added to every individual.
+        weight_offset (int): Weight added to every individual.
 
     Returns:
         np.ndarray: Array of shape (individuals, 2) with [fitness, weight].
     """
-    fitness_score = np.zeros(shape=(population.shape[0], 2), dtype=np.int64)
+    sums = raw_sums(
+        population=population,
+        batch=batch,
+        value_arr=value_arr,
+        weight_arr=weight_arr,
+        value_offset=value_offset,
+        weight_offset=weight_offset,
+    )
+    return rescore(sums, max_weight=max_weight, penalty_factor=penalty_factor)
+
+
+def raw_sums(
+    population: np.memmap,
+    batch: int,
+    value_arr: np.ndarray,
+    weight_arr: np.ndarray,
+    value_offset: int = 0,
+    weight_offset: int = 0,
+) -> np.ndarray:
+    """Calculate the unpenalized value and weight sums of each individual.
+
+    Args:
+        population (np.memmap): Binary population matrix (individuals x genes).
+        batch (int): Batch size used for streaming computation.
+        value_arr (np.ndarray): Value of each gene.
+        weight_arr (np.ndarray): Weight of each gene.
+        value_offset (int): Value added to every individual.
+        weight_offset (int): Weight added to every individual.
+
+    Returns:
+        np.ndarray: Array of shape (individuals, 2) with [value, weight].
+    """
+    sums = np.zeros(shape=(population.shape[0], 2), dtype=np.int64)
     for start in range(0, population.shape[0], batch):
         stop = min(start + batch, population.shape[0])
         current_batch = population[start:stop]
-        calculated_scores = current_batch @ value_arr
-        calculated_weights = current_batch @ weight_arr
-        over_limit_mask = calculated_weights > max_weight
-        if penalty_factor == 0:
-            penalty_value = calculated_scores
-        else:
-            penalty_value = np.maximum(
-                0, (calculated_weights - max_weight) * (penalty_factor)
-            )
-        penalized_score = np.where(
-            over_limit_mask,
-            np.maximum(0, (calculated_scores - penalty_value)),
-            calculated_scores,
-        )
-
-        fitness_score[start:stop] = np.array(
-            (penalized_score, calculated_weights)
-        ).transpose()
-    return fitness_score
+        sums[start:stop, 0] = current_batch @ value_arr + value_offset
+        sums[start:stop, 1] = current_batch @ weight_arr + weight_offset
+    return sums
+
+
+def rescore(sums: np.ndarray, max_weight: int, penalty_factor: float) -> np.ndarray:
+    """Turn value and weight sums into the [fitness, weight] array.
+
+    Genomes are not read, so a population can be re-scored in O(N) when the
+    capacity or the penalty changes.
+
+    Args:
+        sums (np.ndarray): Array of shape (individuals, 2) with [value, weight],
+            as returned by ``raw_sums``.
+        max_weight (int): Maximum allowed total weight.
+        penalty_factor (float): Factor used to penalize overweight individuals.
+
+    Returns:
+        np.ndarray: Array of shape (individuals, 2) with [fitness, weight].
+    """
+    penalized_score = apply_penalty(
+        scores=sums[:, 0],
+        weights=sums[:, 1],
+        max_weight=max_weight,
+        penalty_factor=penalty_factor,
+    )
+    return np.stack((penalized_score, sums[:, 1]), axis=1).astype(np.int64)
 
 
 def fitness_class_adapter(
     value_weight_arr: np.ndarray,
     config: ExperimentConfig,
     pop_manager: PopulationHandler,
+    value_offset: int = 0,
+    weight_offset: int = 0,
 ) -> np.ndarray:
     """Adapter computing batched fitness from config and population handler.
 
@@ -63,6 +145,8 @@ def fitness_class_adapter(
         value_weight_arr (np.ndarray): Array with columns [value, weight] per gene.
         config (ExperimentConfig): Experiment configuration with fitness settings.
         pop_manager (PopulationHandler): Provides memmap handle to the population.
+        value_offset (int): Value added to every individual.
+        weight_offset (int): Weight added to every individual.
 
     Returns:
         np.ndarray: Array of shape (individuals, 2) with [fitness, weight].
@@ -86,6 +170,8 @@ def fitness_class_adapter(
         batch=batch,
         value_arr=value,
         weight_arr=weight,
+        value_offset=value_offset,
+        weight_offset=weight_offset,
     )
 
 
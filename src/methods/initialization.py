@@ -0,0 +1,256 @@
+"""Defines heuristic construction of initial individuals.
+
+Two constructions seed part of the initial population instead of uniform
+Bernoulli sampling:
+
+* randomized greedy: items are packed by value/weight ratio perturbed with
+  multiplicative noise, so every individual follows a slightly different order,
+* LP rounding: genes are sampled with the probabilities of the fractional
+  LP-relaxation optimum, softened by ``LP_ROUNDING_NOISE``.
+
+Both produce whole batches at once and end with a first-fit repair: packed
+items are visited from the most efficient one and each is kept only if it still
+fits, so every seeded individual is feasible.
+
+A warm start seeds the population with genomes of a previous run instead,
+repaired the same way, e.g. after ``max_weight`` was lowered.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from src.classes.CheckpointManager import CheckpointManager
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.methods.lp_relaxation import efficiency_order, lp_relaxation
+from src.methods.random_keys import first_fit
+
+GREEDY_NOISE = 0.3
+LP_ROUNDING_NOISE = 0.05
+
+BatchGenerator = Callable[[int], np.ndarray]
+
+
+def greedy_rows(
+    count: int,
+    values: np.ndarray,
+    weights: np.ndarray,
+    capacity: int,
+    rng: np.random.Generator,
+    noise: float = GREEDY_NOISE,
+) -> np.ndarray:
+    """Build individuals with a randomized greedy-by-efficiency construction.
+
+    Args:
+        count (int): Number of individuals to build.
+        values (np.ndarray): Value of each gene.
+        weights (np.ndarray): Weight of each gene.
+        capacity (int): Maximum allowed total weight.
+        rng (np.random.Generator): Random number generator of the experiment.
+        noise (float): Relative perturbation of the efficiency ratios.
+
+    Returns:
+        np.ndarray: Feasible genomes of shape (count, genes) and dtype uint8.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    ratio = np.divide(
+        values, weights, out=np.full(values.shape, np.inf), where=weights > 0
+    )
+    perturbation = 1 + noise * (2 * rng.random(size=(count, len(values))) - 1)
+    order = np.argsort(-(ratio * perturbation), axis=1, kind="stable")
+    genomes = np.ones((count, len(values)), dtype=np.uint8)
+    return repair_in_order(genomes, order, weights, capacity)
+
+
+def lp_rounding_rows(
+    count: int,
+    solution: np.ndarray,
+    order: np.ndarray,
+    weights: np.ndarray,
+    capacity: int,
+    rng: np.random.Generator,
+    noise: float = LP_ROUNDING_NOISE,
+) -> np.ndarray:
+    """Build individuals by randomized rounding of the LP-relaxation optimum.
+
+    Args:
+        count (int): Number of individuals to build.
+        solution (np.ndarray): Fractional LP solution with entries in [0, 1].
+        order (np.ndarray): Item indices, most efficient first.
+        weights (np.ndarray): Weight of each gene.
+        capacity (int): Maximum allowed total weight.
+        rng (np.random.Generator): Random number generator of the experiment.
+        noise (float): Lower and upper clip of the sampling probabilities.
+
+    Returns:
+        np.ndarray: Feasible genomes of shape (count, genes) and dtype uint8.
+    """
+    probability = np.clip(solution, noise, 1 - noise)
+    genomes = (rng.random(size=(count, len(solution))) < probability).astype(np.uint8)
+    return repair_in_order(genomes, order, weights, capacity)
+
+
+def repair_in_order(
+    genomes: np.ndarray, order: np.ndarray, weights: np.ndarray, capacity: int
+) -> np.ndarray:
+    """Keep every packed item that still fits when taken in the given order.
+
+    Args:
+        genomes (np.ndarray): Binary genomes of shape (individuals, genes).
+        order (np.ndarray): Item order, either shared (genes,) or per
+            individual (individuals, genes).
+        weights (np.ndarray): Weight of each gene.
+        capacity (int): Maximum allowed total weight.
+
+    Returns:
+        np.ndarray: Repaired genomes; only the items that would overflow the
+            capacity are dropped, later ones that still fit are kept (see
+            ``first_fit``).
+    """
+    order = np.broadcast_to(order, genomes.shape)
+    ordered = np.take_along_axis(genomes, order, axis=1)
+    ordered_weights = np.asarray(weights, dtype=np.int64)[order]
+    kept = first_fit(ordered_weights, ordered.astype(bool), capacity)
+    repaired = np.zeros_like(genomes)
+    np.put_along_axis(repaired, order, kept.astype(genomes.dtype), axis=1)
+    return repaired
+
+
+def load_genomes(source: str | Path, genome_length: int) -> np.ndarray:
+    """Read the genomes of a previous run.
+
+    Supported sources are ``.npy`` files holding a binary genome matrix (a
+    population saved with ``save_population`` or rebuilt by ``--replay``), a
+    saved hall of fame, and checkpoints (a manifest, checkpoint directory or
+    run directory). Genome matrices are memory-mapped, not read.
+
+    Args:
+        source (str | Path): Location of the genomes.
+        genome_length (int): Number of items of the instance.
+
+    Raises:
+        ValueError: If the genomes do not match ``genome_length``.
+
+    Returns:
+        np.ndarray: Binary genomes of shape (individuals, genome_length).
+    """
+    path = Path(source)
+    if path.suffix == ".npy":
+        genomes = np.load(path, mmap_mode="r")
+        if genomes.dtype.names is not None and "genome" in genomes.dtype.names:
+            genomes = np.unpackbits(genomes["genome"], axis=1, count=genome_length)
+    else:
+        manifest = CheckpointManager.load(path)
+        genomes = np.memmap(
+            Path(manifest["directory"]) / manifest["population"],
+            dtype=np.uint8,
+            mode="r",
+            shape=tuple(manifest["population_shape"]),
+        )
+    if genomes.ndim != 2 or genomes.shape[1] != genome_length:
+        raise ValueError(
+            f"{source} holds genomes of shape {genomes.shape}, "
+            f"expected {genome_length} genes"
+        )
+    return genomes
+
+
+def warm_start_rows(
+    genomes: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    capacity: int,
+    columns: np.ndarray | None = None,
+) -> BatchGenerator:
+    """Return a generator handing out repaired genomes of a previous run.
+
+    Consecutive calls return consecutive rows of ``genomes``.
+
+    Args:
+        genomes (np.ndarray): Full-length genomes of the previous run.
+        values (np.ndarray): Value of each evolved gene.
+        weights (np.ndarray): Weight of each evolved gene.
+        capacity (int): Maximum allowed total weight of the evolved genes.
+        columns (np.ndarray | None): Items evolved by this run, e.g.
+            ``ProblemReduction.free``. Defaults to all items.
+
+    Returns:
+        BatchGenerator: Function returning the next ``n`` genomes.
+    """
+    order = efficiency_order(values, weights)
+    position = 0
+
+    def generate(count: int) -> np.ndarray:
+        nonlocal position
+        batch = np.asarray(genomes[position : position + count], dtype=np.uint8)
+        position += count
+        if columns is not None:
+            batch = batch[:, columns]
+        return repair_in_order(batch, order, weights, capacity)
+
+    return generate
+
+
+def initial_seeders(
+    config: ExperimentConfig,
+    value_weight_array: np.ndarray,
+    initial_genomes: np.ndarray | None = None,
+    genome_columns: np.ndarray | None = None,
+) -> list[tuple[int, BatchGenerator]]:
+    """Return the batch generators seeding the initial population.
+
+    Genomes of a previous run come first, then the heuristic constructions
+    enabled by the configuration.
+
+    Args:
+        config (ExperimentConfig): Configuration with the initialization shares.
+        value_weight_array (np.ndarray): Array with columns [value, weight].
+        initial_genomes (np.ndarray | None): Full-length genomes to warm start
+            from, e.g. from ``load_genomes``.
+        genome_columns (np.ndarray | None): Items evolved by this run, if only
+            a part of ``initial_genomes`` is.
+
+    Returns:
+        list[tuple[int, BatchGenerator]]: Number of rows and the generator
+            producing a batch of given size, for each enabled construction.
+    """
+    assert config.rng is not None
+    rng = config.rng
+    values = value_weight_array[:, 0]
+    weights = value_weight_array[:, 1]
+    capacity = config.max_weight
+    seeders: list[tuple[int, BatchGenerator]] = []
+
+    if initial_genomes is not None:
+        seeders.append(
+            (
+                min(len(initial_genomes), config.population_size),
+                warm_start_rows(
+                    initial_genomes, values, weights, capacity, genome_columns
+                ),
+            )
+        )
+
+    greedy = _share_to_rows(config.greedy_init_share, config.population_size)
+    if greedy:
+        seeders.append(
+            (greedy, lambda n: greedy_rows(n, values, weights, capacity, rng))
+        )
+    rounded = _share_to_rows(config.lp_init_share, config.population_size)
+    if rounded:
+        solution, _ = lp_relaxation(values, weights, capacity)
+        order = efficiency_order(values, weights)
+        seeders.append(
+            (
+                rounded,
+                lambda n: lp_rounding_rows(n, solution, order, weights, capacity, rng),
+            )
+        )
+    return seeders
+
+
+def _share_to_rows(share: float, population_size: int) -> int:
+    """Number of individuals making up ``share`` of the population."""
+    return int(round(share * population_size))
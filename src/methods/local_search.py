@@ -0,0 +1,186 @@
+"""Defines vectorized hill climbing used to refine elite individuals.
+
+Two neighbourhoods are searched at once for every individual:
+
+* 1-flip: add or drop a single item,
+* add/drop swap: drop one packed item and add one unpacked item.
+
+Move gains are computed from value and weight deltas, so scanning a
+neighbourhood never re-evaluates whole genomes. Swaps are limited to the
+``swap_candidates`` least efficient packed items and the most efficient unpacked
+items. They are picked with ``np.partition`` rather than a full sort, which
+keeps a step linear in the genome length.
+
+Moves are ranked by fitness. Individuals whose fitness is clipped to ``0`` (for
+example overweight ones under a ``0`` penalty) are ranked by their excess
+weight instead, so the search repairs them rather than getting stuck.
+"""
+
+import numpy as np
+
+from src.methods.fitness_score import apply_penalty
+from src.methods.lp_relaxation import efficiency_order
+
+
+def hill_climb(
+    genomes: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    max_weight: int,
+    penalty_factor: float,
+    max_steps: int,
+    swap_candidates: int = 16,
+    value_offset: int | np.ndarray = 0,
+    weight_offset: int | np.ndarray = 0,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Improve genomes by best-improvement 1-flip and add/drop swap moves.
+
+    Each step applies the best strictly improving move of every individual that
+    still has one; the search ends when no individual improves or after
+    ``max_steps`` steps.
+
+    Args:
+        genomes (np.ndarray): Binary genomes of shape (individuals, genes).
+        values (np.ndarray): Value of each gene.
+        weights (np.ndarray): Weight of each gene.
+        max_weight (int): Maximum allowed total weight.
+        penalty_factor (float): Penalty factor of the fitness function.
+        max_steps (int): Maximum number of moves per individual.
+        swap_candidates (int): Items per side considered for swaps.
+        value_offset (int | np.ndarray): Value of items outside the genome,
+            per individual if an array.
+        weight_offset (int | np.ndarray): Weight of items outside the genome,
+            per individual if an array.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, int]: Improved genomes, their
+            [fitness, weight] array and the number of steps performed.
+    """
+    genomes = np.array(genomes, dtype=np.uint8, copy=True)
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    order = efficiency_order(values, weights)
+    candidates = min(swap_candidates, genomes.shape[1])
+    rows = np.arange(genomes.shape[0])
+
+    total_value = genomes @ values + value_offset
+    total_weight = genomes @ weights + weight_offset
+    score = _score(total_value, total_weight, max_weight, penalty_factor)
+    active = np.ones(genomes.shape[0], dtype=bool)
+    steps = 0
+    while steps < max_steps and active.any():
+        steps += 1
+        idx = rows[active]
+        current = genomes[idx]
+        current_value = total_value[idx]
+        current_weight = total_weight[idx]
+
+        sign = 1 - 2 * current.astype(np.int64)
+        flip_score = _score(
+            current_value[:, None] + sign * values,
+            current_weight[:, None] + sign * weights,
+            max_weight,
+            penalty_factor,
+        )
+        flip = np.argmax(flip_score, axis=1)
+        best_flip = flip_score[np.arange(len(idx)), flip]
+
+        drop, add, swap_score = _best_swap(
+            current,
+            current_value,
+            current_weight,
+            values,
+            weights,
+            order,
+            candidates,
+            max_weight,
+            penalty_factor,
+        )
+
+        use_swap = swap_score > best_flip
+        gain = np.where(use_swap, swap_score, best_flip) - score[idx]
+        improved = gain > 0
+        active[idx[~improved]] = False
+        for local, item in (
+            (improved & ~use_swap, flip),
+            (improved & use_swap, drop),
+            (improved & use_swap, add),
+        ):
+            targets = idx[local]
+            items = item[local]
+            delta = 1 - 2 * genomes[targets, items].astype(np.int64)
+            genomes[targets, items] ^= 1
+            total_value[targets] += delta * values[items]
+            total_weight[targets] += delta * weights[items]
+        score[idx[improved]] = _score(
+            total_value[idx[improved]],
+            total_weight[idx[improved]],
+            max_weight,
+            penalty_factor,
+        )
+    fitness = apply_penalty(total_value, total_weight, max_weight, penalty_factor)
+    # Truncated like ``fitness_calculation`` stores penalized scores.
+    return genomes, np.stack((fitness, total_weight), axis=1).astype(np.int64), steps
+
+
+def _score(
+    total_value: np.ndarray,
+    total_weight: np.ndarray,
+    max_weight: int,
+    penalty_factor: float,
+) -> np.ndarray:
+    """Fitness, or the negated excess weight where the fitness is ``0``."""
+    fitness = apply_penalty(total_value, total_weight, max_weight, penalty_factor)
+    excess = np.maximum(0, total_weight - max_weight)
+    return np.where(fitness > 0, fitness, -excess).astype(np.float64)
+
+
+def _best_swap(
+    genomes: np.ndarray,
+    total_value: np.ndarray,
+    total_weight: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    order: np.ndarray,
+    candidates: int,
+    max_weight: int,
+    penalty_factor: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the best add/drop swap of every individual among the candidates.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Item to drop, item to add and
+            the resulting score (``-inf`` if an individual has no swap).
+    """
+    genome_length = len(order)
+    position = np.arange(genome_length)
+    ordered = genomes[:, order]
+    # Least efficient packed items and most efficient unpacked items. Only the
+    # selected candidates are sorted, the partition itself is linear.
+    drop_at = np.partition(
+        np.where(ordered == 1, position, -1), genome_length - candidates, axis=1
+    )[:, genome_length - candidates :]
+    drop_at = np.sort(drop_at, axis=1)[:, ::-1]
+    add_at = np.partition(
+        np.where(ordered == 0, position, genome_length), candidates - 1, axis=1
+    )[:, :candidates]
+    add_at = np.sort(add_at, axis=1)
+    drop_valid = drop_at >= 0
+    add_valid = add_at < genome_length
+    drop = order[np.where(drop_valid, drop_at, 0)]
+    add = order[np.where(add_valid, add_at, 0)]
+
+    swap_score = _score(
+        total_value[:, None, None] - values[drop][:, :, None] + values[add][:, None, :],
+        total_weight[:, None, None]
+        - weights[drop][:, :, None]
+        + weights[add][:, None, :],
+        max_weight,
+        penalty_factor,
+    )
+    valid = drop_valid[:, :, None] & add_valid[:, None, :]
+    swap_score = np.where(valid, swap_score, -np.inf).reshape(len(genomes), -1)
+    best = np.argmax(swap_score, axis=1)
+    rows = np.arange(len(genomes))
+    best_drop, best_add = np.divmod(best, candidates)
+    return drop[rows, best_drop], add[rows, best_add], swap_score[rows, best]
@@ -0,0 +1,57 @@
+"""Defines the linear-programming relaxation of the 0/1 knapsack problem.
+
+The relaxation allows fractional items. Its optimum is obtained greedily
+(Dantzig): items are packed by decreasing value/weight ratio and the first
+item that does not fit is taken fractionally. The resulting value is an upper
+bound on the value of every feasible 0/1 solution.
+"""
+
+import numpy as np
+
+
+def efficiency_order(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Return item indices sorted by decreasing value/weight ratio.
+
+    Items without weight come first; ties keep their original order.
+
+    Args:
+        values (np.ndarray): Value of each item.
+        weights (np.ndarray): Weight of each item.
+
+    Returns:
+        np.ndarray: Item indices, most efficient first.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    ratio = np.divide(
+        values, weights, out=np.full(values.shape, np.inf), where=weights > 0
+    )
+    return np.argsort(-ratio, kind="stable")
+
+
+def lp_relaxation(
+    values: np.ndarray, weights: np.ndarray, capacity: int
+) -> tuple[np.ndarray, float]:
+    """Solve the LP relaxation of a 0/1 knapsack instance.
+
+    Args:
+        values (np.ndarray): Value of each item.
+        weights (np.ndarray): Weight of each item.
+        capacity (int): Maximum allowed total weight.
+
+    Returns:
+        tuple[np.ndarray, float]: Fractional solution with entries in [0, 1]
+            and its value, the LP upper bound.
+    """
+    order = efficiency_order(values, weights)
+    sorted_weights = np.asarray(weights, dtype=np.float64)[order]
+    cumulative = np.cumsum(sorted_weights)
+    solution = np.zeros(len(order), dtype=np.float64)
+    full = cumulative <= capacity
+    solution[order[full]] = 1.0
+    if not np.all(full):
+        critical = int(np.argmin(full))
+        remaining = capacity - (cumulative[critical - 1] if critical > 0 else 0.0)
+        solution[order[critical]] = remaining / sorted_weights[critical]
+    bound = float(solution @ np.asarray(values, dtype=np.float64))
+    return solution, bound
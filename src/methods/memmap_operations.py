@@ -6,6 +6,7 @@ arrays.
 """
 
 import json
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Literal
 
@@ -20,6 +21,7 @@ def create_population_file(
     temp: Path,
     probability_of_failure: float | None = None,
     filename_constant: str | None = None,
+    seeders: Sequence[tuple[int, Callable[[int], np.ndarray]]] = (),
 ) -> None:
     """Create a memory-mapped population file on disk.
 
@@ -30,7 +32,8 @@ def create_population_file(
     distribution with probability ``probability_of_failure`` of being 1.
 
     The population is written in batches, controlled by ``stream_batch``,
-    to limit peak memory usage.
+    to limit peak memory usage. Rows produced by ``seeders`` are written first;
+    the remaining rows are sampled at random.
 
     Args:
         population_size (int): even integer value defining amount of individuals
@@ -45,6 +48,9 @@ def create_population_file(
             bernoulli distribution of probability. Defaults to standard ``0.5``.
         filename_constant (str | None, optional): Unique filename used to name
             experiment files. Defaults to `population`.
+        seeders (Sequence[tuple[int, Callable]], optional): Pairs of a row count
+            and a function returning that many genomes for a given batch size,
+            e.g. from ``initialization.initial_seeders``. Defaults to none.
     """
     if filename_constant is None:
         filename_constant = "population"
@@ -58,18 +64,51 @@ def create_population_file(
     )
     if probability_of_failure is None:
         probability_of_failure = 0.5
-    for start in range(0, population_size, stream_batch):
-        stop = min(start + stream_batch, population_size)
-        batch = (
-            rng.random(size=(stop - start, genome_length)) < probability_of_failure
-        ).astype(np.uint8)
-        population[start:stop] = batch
-        population.flush()
+    seeded = 0
+    for rows, generate in seeders:
+        stop = min(seeded + rows, population_size)
+        for batch_start in range(seeded, stop, stream_batch):
+            batch_stop = min(batch_start + stream_batch, stop)
+            population[batch_start:batch_stop] = generate(batch_stop - batch_start)
+            population.flush()
+        seeded = stop
+    fill_random_rows(
+        population, seeded, population_size, stream_batch, rng, probability_of_failure
+    )
     create_memmap_config_json(
         population_json, population_dat, np.uint8, population_size, genome_length
     )
 
 
+def fill_random_rows(
+    array: np.ndarray,
+    start: int,
+    stop: int,
+    stream_batch: int,
+    rng: np.random.Generator,
+    probability: float,
+) -> None:
+    """Fill rows ``start:stop`` of a memmap with random Bernoulli genomes.
+
+    Args:
+        array (np.ndarray): Writable 2D population-like memmap.
+        start (int): First row to fill.
+        stop (int): Row after the last one to fill.
+        stream_batch (int): Number of rows generated and flushed at once.
+        rng (np.random.Generator): Random number generator of the experiment.
+        probability (float): Probability of a gene being ``1``.
+    """
+    genome_length = array.shape[1]
+    for batch_start in range(start, stop, stream_batch):
+        batch_stop = min(batch_start + stream_batch, stop)
+        batch = (
+            rng.random(size=(batch_stop - batch_start, genome_length)) < probability
+        ).astype(np.uint8)
+        array[batch_start:batch_stop] = batch
+        if isinstance(array, np.memmap):
+            array.flush()
+
+
 def create_memmap_config_json(
     path: Path, dat_path: Path, datatype: type, population_size: int, genome_length: int
 ) -> None:
@@ -0,0 +1,81 @@
+"""Defines migration between the islands of the island-model GA.
+
+Each island evolves its own subpopulation and, every few generations, takes
+the best individuals of one other island in place of its own worst ones.
+Who sends to whom is set by the topology: on a ``ring`` island ``i`` always
+receives from island ``i - 1``, with ``random`` every island draws a new
+source other than itself at each migration. Rows are copied between the
+island buffers with plain array assignment, so the same functions work on
+in-process arrays and on views of shared memory.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+TOPOLOGIES = ("ring", "random")
+
+
+def migration_sources(
+    topology: str, islands: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Return the island every island receives migrants from.
+
+    Args:
+        topology (str): ``ring`` or ``random``.
+        islands (int): Number of islands.
+        rng (np.random.Generator): Generator shared by all islands; it is
+            only drawn from by the ``random`` topology, so every island that
+            calls this with the same generator state gets the same sources.
+
+    Raises:
+        ValueError: If the topology is unknown.
+
+    Returns:
+        np.ndarray: Source island of every island, never the island itself.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Invalid migration topology: {topology}")
+    destinations = np.arange(islands)
+    if topology == "ring":
+        return (destinations - 1) % islands
+    return (destinations + rng.integers(1, islands, size=islands)) % islands
+
+
+def migration_rows(fitness: np.ndarray, migrants: int) -> tuple[np.ndarray, ...]:
+    """Return the rows an island sends and the rows it overwrites.
+
+    Args:
+        fitness (np.ndarray): Array of shape (individuals, 2) with
+            [fitness, weight] of one island.
+        migrants (int): Number of individuals exchanged.
+
+    Returns:
+        tuple[np.ndarray, ...]: Indices of the ``migrants`` best individuals,
+            then of the ``migrants`` worst ones.
+    """
+    ranking = np.lexsort((fitness[:, 1], -fitness[:, 0]))
+    return ranking[:migrants], ranking[len(ranking) - migrants :]
+
+
+def migrate(
+    populations: Sequence[np.ndarray],
+    fitness: np.ndarray,
+    island: int,
+    source: int,
+    emigrants: np.ndarray,
+    replaced: np.ndarray,
+) -> None:
+    """Copy the emigrants of ``source`` over the ``replaced`` rows of ``island``.
+
+    Args:
+        populations (Sequence[np.ndarray]): Population of every island.
+        fitness (np.ndarray): Array of shape (islands, individuals, 2) with
+            [fitness, weight]; updated together with the genomes.
+        island (int): Receiving island.
+        source (int): Sending island.
+        emigrants (np.ndarray): Rows sent by ``source``.
+        replaced (np.ndarray): Rows of ``island`` that are overwritten.
+    """
+    populations[island][replaced] = populations[source][emigrants]
+    fitness[island, replaced] = fitness[source, emigrants]
@@ -0,0 +1,98 @@
+"""Defines bi-objective ranking of a population.
+
+In Pareto mode the [fitness, weight] array produced by ``fitness_calculation``
+is read as two objectives: fitness is maximized and knapsack weight is
+minimized. Instead of a single penalized score, individuals are ranked by
+non-dominated fronts and spread along a front by crowding distance, as in
+NSGA-II.
+
+With two objectives the fronts are found by one sweep in O(N log N): points
+are visited by decreasing fitness, and a point joins the first front whose
+lightest member so far is heavier than the point itself.
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+
+def non_dominated_ranks(fitness: np.ndarray) -> np.ndarray:
+    """Assign every individual the index of its non-dominated front.
+
+    An individual dominates another when its fitness is not lower, its weight
+    is not higher and the two differ in at least one objective. Individuals
+    with identical objectives share a front.
+
+    Args:
+        fitness (np.ndarray): Array of shape (individuals, 2) with
+            [fitness, weight].
+
+    Returns:
+        np.ndarray: Front index of every individual; ``0`` is the
+            non-dominated front.
+    """
+    objectives = np.stack((-fitness[:, 0], fitness[:, 1]), axis=1)
+    # Sorted by decreasing fitness, then increasing weight.
+    points, inverse = np.unique(objectives, axis=0, return_inverse=True)
+    front_weights: list[int] = []
+    point_ranks = np.empty(len(points), dtype=np.int64)
+    for position, weight in enumerate(points[:, 1].tolist()):
+        rank = bisect_right(front_weights, weight)
+        if rank == len(front_weights):
+            front_weights.append(weight)
+        else:
+            front_weights[rank] = weight
+        point_ranks[position] = rank
+    return point_ranks[inverse.reshape(-1)]
+
+
+def crowding_distance(fitness: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Compute the crowding distance of every individual within its front.
+
+    For each objective the members of a front are sorted and every member
+    gets the gap between its neighbours, normalized by the objective range of
+    the front. Boundary members get ``inf``. All fronts are handled at once.
+
+    Args:
+        fitness (np.ndarray): Array of shape (individuals, 2) with
+            [fitness, weight].
+        ranks (np.ndarray): Front index of every individual, as returned by
+            ``non_dominated_ranks``.
+
+    Returns:
+        np.ndarray: Crowding distance of every individual.
+    """
+    size = len(fitness)
+    distance = np.zeros(size, dtype=np.float64)
+    for column in range(fitness.shape[1]):
+        values = fitness[:, column].astype(np.float64)
+        order = np.lexsort((values, ranks))
+        sorted_ranks = ranks[order]
+        sorted_values = values[order]
+        boundary = sorted_ranks[1:] != sorted_ranks[:-1]
+        first = np.concatenate(([True], boundary))
+        last = np.concatenate((boundary, [True]))
+        front = np.cumsum(first) - 1
+        span = (sorted_values[last] - sorted_values[first])[front]
+        gap = np.zeros(size, dtype=np.float64)
+        gap[1:-1] = sorted_values[2:] - sorted_values[:-2]
+        gap = np.divide(gap, span, out=np.zeros(size), where=span > 0)
+        gap[first | last] = np.inf
+        distance[order] += gap
+    return distance
+
+
+def pareto_front(fitness: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Return one individual per distinct point of the non-dominated front.
+
+    Args:
+        fitness (np.ndarray): Array of shape (individuals, 2) with
+            [fitness, weight].
+        ranks (np.ndarray): Front index of every individual.
+
+    Returns:
+        np.ndarray: Row indices ordered by decreasing fitness.
+    """
+    members = np.flatnonzero(ranks == 0)
+    _, first = np.unique(-fitness[members, 0], return_index=True)
+    return members[first]
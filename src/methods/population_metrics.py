@@ -0,0 +1,112 @@
+"""Defines cheap population-level metrics computed in streamed batches."""
+
+import numpy as np
+
+
+def allele_frequencies(population: np.ndarray, batch: int) -> np.ndarray:
+    """Compute the frequency of allele ``1`` at every locus.
+
+    Args:
+        population (np.ndarray): Binary population matrix (individuals x genes).
+        batch (int): Batch size used for streaming computation.
+
+    Returns:
+        np.ndarray: Array of shape (genes,) with values in [0, 1].
+    """
+    counts = np.zeros(population.shape[1], dtype=np.int64)
+    for start in range(0, population.shape[0], batch):
+        stop = min(start + batch, population.shape[0])
+        counts += population[start:stop].sum(axis=0, dtype=np.int64)
+    return counts / population.shape[0]
+
+
+def genotype_diversity(frequencies: np.ndarray) -> float:
+    """Summarize allele frequencies as a diversity score.
+
+    The score is the mean of ``4 * p * (1 - p)`` over all loci: ``1`` when every
+    locus is split half-and-half, ``0`` when the population has converged.
+
+    Args:
+        frequencies (np.ndarray): Allele ``1`` frequency of every locus.
+
+    Returns:
+        float: Diversity in range [0, 1].
+    """
+    if frequencies.size == 0:
+        return 0.0
+    return float(np.mean(4 * frequencies * (1 - frequencies)))
+
+
+def row_hashes(population: np.ndarray, batch: int) -> np.ndarray:
+    """Hash every genome of a population into one 64-bit integer.
+
+    Genomes are bit-packed and folded as a weighted sum of 64-bit words, so a
+    hash costs one pass over ``genes / 8`` bytes. Equal genomes always share a
+    hash; different genomes collide only rarely.
+
+    Args:
+        population (np.ndarray): Binary population matrix (individuals x genes).
+        batch (int): Batch size used for streaming computation.
+
+    Returns:
+        np.ndarray: Array of shape (individuals,) with dtype uint64.
+    """
+    words = -(-population.shape[1] // 64)
+    # Fixed odd multipliers keep hashes comparable across calls and runs.
+    multipliers = np.random.default_rng(0x5EED).integers(
+        0, 2**63, size=words, dtype=np.uint64
+    ) * np.uint64(2) + np.uint64(1)
+    hashes = np.empty(population.shape[0], dtype=np.uint64)
+    for start in range(0, population.shape[0], batch):
+        stop = min(start + batch, population.shape[0])
+        packed = np.packbits(population[start:stop], axis=1)
+        padded = np.zeros((stop - start, words * 8), dtype=np.uint8)
+        padded[:, : packed.shape[1]] = packed
+        hashes[start:stop] = (padded.view("<u8") * multipliers).sum(
+            axis=1, dtype=np.uint64
+        )
+    return hashes
+
+
+def duplicate_rows(population: np.ndarray, batch: int) -> tuple[np.ndarray, np.ndarray]:
+    """Find genomes that repeat an earlier genome of the population.
+
+    Candidates are found by equal row hashes and confirmed by comparing them
+    with the first genome of their hash. A hash whose genomes are not all equal
+    (a collision) is resolved by grouping its genomes by content, so collisions
+    are never reported and repeats within them are not missed.
+
+    Args:
+        population (np.ndarray): Binary population matrix (individuals x genes).
+        batch (int): Batch size used for streaming computation.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Indices of the duplicates and of the
+            earlier genome each one repeats.
+    """
+    hashes = row_hashes(population, batch)
+    _, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+    original = first[inverse]
+    candidates = np.flatnonzero(original != np.arange(len(hashes)))
+    confirmed = np.zeros(len(candidates), dtype=bool)
+    for start in range(0, len(candidates), batch):
+        rows = candidates[start : start + batch]
+        confirmed[start : start + batch] = np.all(
+            population[rows] == population[original[rows]], axis=1
+        )
+    mismatched = inverse[candidates[~confirmed]]
+    collided = np.isin(inverse[candidates], mismatched)
+    duplicates = [candidates[confirmed & ~collided]]
+    originals = [original[duplicates[0]]]
+    for bucket in np.unique(mismatched):
+        members = np.flatnonzero(inverse == bucket)
+        _, first_copy, group = np.unique(
+            population[members], axis=0, return_index=True, return_inverse=True
+        )
+        earlier = members[first_copy[group.ravel()]]
+        repeated = earlier != members
+        duplicates.append(members[repeated])
+        originals.append(earlier[repeated])
+    found = np.concatenate(duplicates)
+    order = np.argsort(found)
+    return found[order], np.concatenate(originals)[order]
@@ -0,0 +1,92 @@
+"""Defines preprocessing that fixes knapsack items before evolution.
+
+Two kinds of rules are applied:
+
+* dominance: an item heavier than the capacity is fixed to ``0`` and an item
+  without weight (but with value) is fixed to ``1``,
+* LP reduced costs (Dembo & Hammer): with ``r`` the efficiency of the critical
+  item of the LP relaxation and ``U`` its bound, flipping item ``j`` away from
+  its LP value costs at least ``|v_j - r * w_j|``. If ``U`` minus that cost is
+  below the value of a known feasible solution, every optimal solution keeps
+  the LP value of ``j``, so the item is fixed.
+
+The lower bound comes from the greedy solution that skips items which do not
+fit. Only provably decided items are fixed, so the optimum of the reduced
+instance plus the fixed items is the optimum of the full instance. At least one
+item is always left free.
+"""
+
+import numpy as np
+
+from src.classes.ProblemReduction import ProblemReduction
+from src.methods.lp_relaxation import efficiency_order, lp_relaxation
+
+
+def greedy_lower_bound(values: np.ndarray, weights: np.ndarray, capacity: int) -> int:
+    """Value of the greedy solution packing items by decreasing efficiency.
+
+    Items that do not fit are skipped, so smaller items further down the order
+    may still be packed.
+
+    Args:
+        values (np.ndarray): Value of each item.
+        weights (np.ndarray): Weight of each item.
+        capacity (int): Maximum allowed total weight.
+
+    Returns:
+        int: Value of a feasible solution.
+    """
+    total_value, load = 0, 0
+    for item in efficiency_order(values, weights).tolist():
+        if load + weights[item] <= capacity:
+            load += int(weights[item])
+            total_value += int(values[item])
+    return total_value
+
+
+def reduce_problem(
+    values: np.ndarray, weights: np.ndarray, capacity: int
+) -> ProblemReduction:
+    """Fix items whose optimal value is decided by dominance or LP bounds.
+
+    Args:
+        values (np.ndarray): Value of each item.
+        weights (np.ndarray): Weight of each item.
+        capacity (int): Maximum allowed total weight.
+
+    Returns:
+        ProblemReduction: Fixed items and the free core.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    fix_one = (weights == 0) & (values > 0)
+    fix_zero = (weights > capacity) | ((values <= 0) & (weights > 0))
+
+    candidates = ~(fix_one | fix_zero)
+    lower = greedy_lower_bound(values[candidates], weights[candidates], capacity)
+    solution, bound = lp_relaxation(values[candidates], weights[candidates], capacity)
+    fractional = np.flatnonzero((solution > 0) & (solution < 1))
+    if len(fractional):
+        critical = np.flatnonzero(candidates)[fractional[0]]
+        ratio = values[critical] / weights[critical]
+        reduced_cost = np.abs(values - ratio * weights)
+        # Solutions flipping such an item are worth less than the greedy one.
+        decided = candidates & (np.floor(bound - reduced_cost + 1e-9) < lower)
+        decided[critical] = False
+        in_lp = np.zeros(len(values), dtype=bool)
+        in_lp[np.flatnonzero(candidates)] = solution == 1
+        fix_one |= decided & in_lp
+        fix_zero |= decided & ~in_lp
+    if np.all(fix_one | fix_zero):
+        # Keep one gene so the evolved genomes are never empty.
+        fix_one[0] = fix_zero[0] = False
+
+    fixed_one = np.flatnonzero(fix_one)
+    return ProblemReduction(
+        genome_length=len(values),
+        free=np.flatnonzero(~(fix_one | fix_zero)),
+        fixed_one=fixed_one,
+        fixed_zero=np.flatnonzero(fix_zero),
+        value_offset=int(values[fixed_one].sum()),
+        weight_offset=int(weights[fixed_one].sum()),
+    )
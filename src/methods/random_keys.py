@@ -0,0 +1,122 @@
+"""Defines the random-key representation and its greedy decoder.
+
+In random-key mode an individual is a vector of float keys, one per item, and
+never a binary genome. The keys only set the order in which items are offered
+to the knapsack: the decoder visits items by decreasing key and packs every
+item that still fits, so each decoded solution is feasible. Crossover and
+mutation act on the keys and need no repair.
+
+The decoder is exact first-fit greedy, vectorized over a whole batch. Each
+pass drops items heavier than the remaining capacity of their row and packs
+the longest prefix of the rest whose cumulative weight fits. The first item
+past that prefix no longer fits, so the next pass drops it; passes repeat
+until every row has no item left to offer, which usually takes a handful of
+passes rather than one per item.
+"""
+
+import numpy as np
+
+
+def first_fit(
+    ordered_weights: np.ndarray, offered: np.ndarray, capacity: int
+) -> np.ndarray:
+    """Pack every offered item that still fits, visiting items in order.
+
+    Args:
+        ordered_weights (np.ndarray): Weights of shape (individuals, genes),
+            already in visiting order.
+        offered (np.ndarray): Boolean array of the same shape; only these
+            items may be packed.
+        capacity (int): Maximum allowed total weight.
+
+    Returns:
+        np.ndarray: Boolean array of the packed items, in visiting order.
+    """
+    remaining = np.full(len(ordered_weights), capacity, dtype=np.int64)
+    taken = np.zeros(ordered_weights.shape, dtype=bool)
+    offered = offered.copy()
+    while True:
+        offered &= ordered_weights <= remaining[:, None]
+        if not offered.any():
+            break
+        offered_weights = np.where(offered, ordered_weights, 0)
+        load = np.cumsum(offered_weights, axis=1)
+        packed = offered & (load <= remaining[:, None])
+        taken |= packed
+        offered &= ~packed
+        remaining -= np.where(packed, ordered_weights, 0).sum(axis=1)
+    return taken
+
+
+def decode_keys(keys: np.ndarray, weights: np.ndarray, capacity: int) -> np.ndarray:
+    """Greedily pack items in decreasing key order up to ``capacity``.
+
+    Args:
+        keys (np.ndarray): Keys of shape (individuals, genes).
+        weights (np.ndarray): Weight of each gene.
+        capacity (int): Maximum allowed total weight.
+
+    Returns:
+        np.ndarray: Binary genomes of shape (individuals, genes), none of
+            which exceeds ``capacity``.
+    """
+    order = np.argsort(-np.asarray(keys), axis=1, kind="stable")
+    ordered_weights = np.asarray(weights, dtype=np.int64)[order]
+    taken = first_fit(ordered_weights, np.ones(order.shape, dtype=bool), capacity)
+    genomes = np.zeros(order.shape, dtype=np.uint8)
+    np.put_along_axis(genomes, order, taken.astype(np.uint8), axis=1)
+    return genomes
+
+
+def key_crossover(
+    p1: np.ndarray,
+    p2: np.ndarray,
+    crossover_type: str,
+    probability: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cross pairs of key vectors with one- or two-point crossover.
+
+    Args:
+        p1 (np.ndarray): First parents of shape (pairs, genes).
+        p2 (np.ndarray): Second parents of shape (pairs, genes).
+        crossover_type (str): ``one`` or ``two``.
+        probability (float): Probability that a pair is crossed at all.
+        rng (np.random.Generator): Random number generator of the experiment.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The two children of every pair.
+    """
+    pairs, genome_length = p1.shape
+    column_index = np.arange(genome_length)
+    if crossover_type == "one":
+        start = np.asarray(rng.integers(1, genome_length, size=pairs))
+        stop = np.full(pairs, genome_length)
+    else:
+        start = np.asarray(rng.integers(1, genome_length - 1, size=pairs))
+        stop = np.asarray(rng.integers(start + 1, genome_length, size=pairs))
+    cut_mask = (column_index[None, :] >= start[:, None]) & (
+        column_index[None, :] < stop[:, None]
+    )
+    cut_mask &= np.asarray(rng.random(pairs) < probability)[:, None]
+    c1 = np.where(cut_mask, p2, p1)
+    c2 = np.where(cut_mask, p1, p2)
+    return c1, c2
+
+
+def key_mutation(
+    keys: np.ndarray, probability: float, rng: np.random.Generator
+) -> np.ndarray:
+    """Redraw every key with ``probability`` from the uniform distribution.
+
+    Args:
+        keys (np.ndarray): Keys of shape (individuals, genes); changed in place.
+        probability (float): Per-key mutation probability.
+        rng (np.random.Generator): Random number generator of the experiment.
+
+    Returns:
+        np.ndarray: The mutated keys.
+    """
+    mutated = rng.random(keys.shape, dtype=np.float32) < probability
+    keys[mutated] = rng.random(int(mutated.sum()), dtype=np.float32)
+    return keys
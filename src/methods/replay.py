@@ -0,0 +1,140 @@
+"""Rebuild the population of a past generation from recorded RNG states.
+
+Instead of storing every population file, a run started with
+``record_rng_states`` keeps one small record per generation. Replaying
+re-executes the deterministic operators from the nearest earlier checkpoint
+(or from the initial population) inside a scratch run that is removed
+afterwards.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.classes.CheckpointManager import MANIFEST_SUFFIX, CheckpointManager
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.PathResolver import PathResolver
+from src.classes.RngStateRecorder import RNG_SUFFIX, RngStateRecorder
+
+REPLAY_OVERRIDES: dict[str, Any] = {
+    "stop_at_optimum": False,
+    "lp_bound_tolerance": None,
+    "stagnation_window": None,
+    "diversity_floor": None,
+    "time_budget": None,
+    "evaluation_budget": None,
+    "checkpoint_interval": None,
+    "checkpoint_seconds": None,
+    "record_rng_states": False,
+}
+
+
+def find_rng_file(path: str | Path) -> Path:
+    """Locate the RNG side file of a run.
+
+    Args:
+        path (str | Path): The ``.rng`` file itself, a checkpoint directory or a
+            run directory containing ``checkpoints``. The most recently written
+            side file is used if a directory holds several.
+
+    Raises:
+        FileNotFoundError: If no side file can be found.
+
+    Returns:
+        Path: Path of the side file.
+    """
+    path = Path(path)
+    if path.is_file():
+        return path
+    if (path / "checkpoints").is_dir():
+        path = path / "checkpoints"
+    files = sorted(path.glob(f"*{RNG_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+    if not files:
+        raise FileNotFoundError(f"No recorded RNG states found in {path}")
+    return files[-1]
+
+
+def replay_population(
+    path: str | Path, generation: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Recompute the population and fitness of a recorded generation.
+
+    The replay starts from the run's checkpoint if it precedes ``generation``,
+    otherwise from the initial population drawn with the recorded state of
+    generation ``0``. Before every replayed generation the RNG state is compared
+    with the recorded one, so a diverging replay fails loudly instead of
+    returning a wrong population.
+
+    Args:
+        path (str | Path): Run directory, checkpoint directory or ``.rng`` file.
+        generation (int): Generation to rebuild.
+
+    Raises:
+        ValueError: If the generation was not recorded.
+        RuntimeError: If the replay diverges from the recorded states.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Population of shape
+            ``(population_size, genome_length)`` and its fitness array. Runs
+            with problem reduction or locus freezing are expanded to the full
+            instance width.
+    """
+    rng_file = find_rng_file(path)
+    header, states = RngStateRecorder.load(rng_file)
+    if generation not in states:
+        raise ValueError(f"Generation {generation} was not recorded")
+
+    input_config = {
+        **header["config"],
+        **REPLAY_OVERRIDES,
+        "generations": max(generation, 1),
+    }
+    checkpoint = None
+    manifest_path = rng_file.parent / f"{header['run']}{MANIFEST_SUFFIX}"
+    if manifest_path.exists():
+        manifest = CheckpointManager.load(manifest_path)
+        if manifest["iteration"] <= generation:
+            # Without a CSV offset the scratch run starts its own table.
+            checkpoint = {k: v for k, v in manifest.items() if k != "csv_offset"}
+    if checkpoint is None:
+        rng = np.random.Generator(np.random.PCG64())
+        rng.bit_generator.state = states[0]
+        input_config["rng"] = rng
+
+    scratch_name = f"{header['run']}-replay-g{generation}"
+    paths = PathResolver()
+    paths.initialize(filename_constant=scratch_name)
+    logger = logging.LoggerAdapter(
+        logging.getLogger("GA experiment replay"), {"exp_id": scratch_name}
+    )
+    try:
+        with EvolutionRunner(
+            input_config,
+            paths=paths,
+            logger=logger,
+            filename_constant=scratch_name,
+            report=False,
+            checkpoint=checkpoint,
+        ) as runner:
+            steps = runner.steps()
+            while runner.last_stats.iteration < generation:
+                _verify_state(runner, states)
+                next(steps)
+            return runner.full_population(), runner.fitness.copy()
+    finally:
+        shutil.rmtree(paths.get_temp_path().parent, ignore_errors=True)
+
+
+def _verify_state(runner: EvolutionRunner, states: dict[int, dict]) -> None:
+    """Compare the RNG state before the next generation with the recording.
+
+    Raises:
+        RuntimeError: If the states differ.
+    """
+    assert runner.config.rng is not None
+    iteration = runner.last_stats.iteration + 1
+    if runner.config.rng.bit_generator.state != states[iteration]:
+        raise RuntimeError(f"Replay diverged from the recorded run at {iteration}")
@@ -7,6 +7,7 @@ appropriate parent pool based on individuals fitness score.
 import numpy as np
 
 from src.classes.ExperimentConfig import ExperimentConfig
+from src.methods.pareto import crowding_distance, non_dominated_ranks
 
 
 def roulette_selection(fitness_arr: np.ndarray, config: ExperimentConfig) -> list[int]:
@@ -80,7 +81,7 @@ def tournament_selection(
     selected_parents = []
     for i in range(config.population_size):
         gladiators = rng.choice(
-            config.population_size,
+            len(fitness_arr),
             size=tournament_size,
             replace=False,
         )
@@ -139,3 +140,35 @@ def linear_rank_selection(
         p=probability_distribution,
     )
     return parent_arr.tolist()
+
+
+def pareto_selection(fitness_arr: np.ndarray, config: ExperimentConfig) -> list[int]:
+    """Select parents by binary tournaments on Pareto rank and crowding.
+
+    Fitness (column 0) is maximized and weight (column 1) is minimized as two
+    separate objectives. The winner of a tournament is the individual in the
+    better non-dominated front; within one front, the less crowded one wins.
+
+    Args:
+        fitness_arr (np.ndarray): 2D array of shape (population_size, 2) where
+            column 0 stores fitness and column 1 stores weight.
+        config (ExperimentConfig): Experiment configuration holding the RNG
+            instance and population size.
+
+    Returns:
+        list[int]: Indices of selected parents (with replacement), of length
+            ``config.population_size``.
+    """
+    # Defensive guard: ExperimentConfig.__post_init__ guarantees rng is not None.
+    # Marked as no cover because this branch should be unreachable in normal usage.
+    if config.rng is None:  # pragma: no cover
+        raise ValueError("Experiment config was not defined!")
+    ranks = non_dominated_ranks(fitness_arr)
+    crowding = crowding_distance(fitness_arr, ranks)
+    first, second = config.rng.integers(
+        0, len(fitness_arr), size=(2, config.population_size)
+    )
+    first_wins = (ranks[first] < ranks[second]) | (
+        (ranks[first] == ranks[second]) & (crowding[first] >= crowding[second])
+    )
+    return np.where(first_wins, first, second).tolist()
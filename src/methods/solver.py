@@ -0,0 +1,112 @@
+"""Defines the in-process, filesystem-free entry point of the GA.
+
+``solve`` runs the genetic algorithm on item arrays held in memory. It reuses
+the vectorized engine of replica mode (``StackedEvolution``) with a single
+population, so no config file, instance directory, memmap, log or CSV is
+touched. Nothing is written unless ``output`` is given.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.SolveResult import SolveResult
+from src.classes.StackedEvolution import StackedEvolution
+
+STAT_FIELDS = (
+    "best_fitness",
+    "best_weight",
+    "avg_fitness",
+    "worst_fitness",
+    "worst_weight",
+    "identical_best_count",
+)
+
+
+def solve(
+    values: np.ndarray,
+    weights: np.ndarray,
+    capacity: int,
+    population_size: int = 100,
+    generations: int = 100,
+    selection_type: str = "tournament",
+    crossover_type: str = "two",
+    crossover_probability: float = 0.8,
+    mutation_probability: float | None = None,
+    penalty: float = 0.0,
+    selection_pressure: float | None = None,
+    seed: int | None = None,
+    output: str | Path | None = None,
+) -> SolveResult:
+    """Solve a 0/1 knapsack instance in memory.
+
+    Args:
+        values (np.ndarray): Value of each item.
+        weights (np.ndarray): Weight of each item.
+        capacity (int): Maximum allowed total weight.
+        population_size (int): Number of individuals (must be even).
+        generations (int): Number of generations after the initial one.
+        selection_type (str): ``roulette``, ``tournament`` or ``rank``.
+        crossover_type (str): ``one`` or ``two``.
+        crossover_probability (float): Probability of crossing a pair.
+        mutation_probability (float | None): Per-gene flip probability.
+            Defaults to ``1 / len(values)``.
+        penalty (float): Penalty factor for exceeding ``capacity``; ``0``
+            clips the fitness of overweight individuals to ``0``.
+        selection_pressure (float | None): Pressure of ``rank`` selection.
+        seed (int | None): Seed of the random number generator.
+        output (str | Path | None): If given, the result is also saved there
+            as an ``.npz`` archive.
+
+    Raises:
+        ValueError: If the item arrays are not matching 1-D arrays, or a
+            parameter fails ``ExperimentConfig`` validation.
+
+    Returns:
+        SolveResult: Best genome of the whole run, its fitness and weight,
+            and the per-generation stats arrays.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    if values.ndim != 1 or values.shape != weights.shape or values.size == 0:
+        raise ValueError(
+            "Values and weights must be non-empty 1-D arrays of equal length"
+        )
+    if mutation_probability is None:
+        mutation_probability = 1 / values.size
+    config = ExperimentConfig(
+        data_filename="<memory>",
+        population_size=population_size,
+        generations=generations,
+        max_weight=capacity,
+        seed=seed,
+        selection_type=selection_type,
+        crossover_type=crossover_type,
+        crossover_probability=crossover_probability,
+        mutation_probability=mutation_probability,
+        penalty=penalty,
+        experiment_identifier=0,
+        log_level="WARNING",
+        selection_pressure=selection_pressure,
+    )
+    engine = StackedEvolution([config], values[None, :], weights[None, :])
+
+    history: dict[str, list] = {field: [] for field in STAT_FIELDS}
+    best = (-1, 0, engine.population[0, 0])
+    for iteration in range(generations + 1):
+        if iteration:
+            engine.step()
+        best_idx, *row = (column[0] for column in engine.statistics())
+        for field, value in zip(STAT_FIELDS, row):
+            history[field].append(value)
+        score, weight = int(row[0]), int(row[1])
+        if (score, -weight) > (best[0], -best[1]):
+            best = (score, weight, engine.population[0, best_idx].copy())
+
+    stats = {"iteration": np.arange(generations + 1)}
+    stats.update((field, np.asarray(column)) for field, column in history.items())
+    result = SolveResult(genome=best[2], fitness=best[0], weight=best[1], stats=stats)
+    if output is not None:
+        result.save(output)
+    return result
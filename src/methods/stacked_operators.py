@@ -0,0 +1,328 @@
+"""Defines vectorized genetic operators for stacks of independent populations.
+
+Every function in this module works on arrays with a leading stack axis ``B``,
+e.g. a population of shape ``(B, N, L)`` holding ``B`` populations of ``N``
+individuals with ``L`` genes each. Arithmetic is vectorized across the whole
+stack, while random numbers are drawn from one generator per stack member so
+every population keeps its own reproducible stream.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.methods.fitness_score import apply_penalty
+
+TOURNAMENT_SIZE = 5
+
+
+def stacked_fitness(
+    population: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    max_weights: np.ndarray,
+    penalty_factor: float,
+) -> np.ndarray:
+    """Calculate penalized fitness and total weight for every stacked individual.
+
+    Args:
+        population (np.ndarray): Binary genomes of shape ``(B, N, L)``.
+        values (np.ndarray): Item values of shape ``(B, L)``.
+        weights (np.ndarray): Item weights of shape ``(B, L)``.
+        max_weights (np.ndarray): Weight limit of each stack member, shape ``(B,)``.
+        penalty_factor (float): Factor used to penalize overweight individuals.
+
+    Returns:
+        np.ndarray: Array of shape ``(B, N, 2)`` with [fitness, weight].
+    """
+    scores = np.matmul(population, values[:, :, None])[..., 0]
+    total_weights = np.matmul(population, weights[:, :, None])[..., 0]
+    penalized = apply_penalty(
+        scores=scores,
+        weights=total_weights,
+        max_weight=np.asarray(max_weights)[:, None],
+        penalty_factor=penalty_factor,
+    )
+    fitness = np.empty(shape=(*scores.shape, 2), dtype=np.int64)
+    fitness[..., 0] = penalized
+    fitness[..., 1] = total_weights
+    return fitness
+
+
+def stacked_positions(fitness: np.ndarray) -> np.ndarray:
+    """Return the position of each individual in its population's ranking.
+
+    Individuals are ordered by descending fitness and, on ties, by ascending
+    weight, exactly like ``EvolutionRunner._analyze_generation``.
+
+    Args:
+        fitness (np.ndarray): Array of shape ``(B, N, 2)`` with [fitness, weight].
+
+    Returns:
+        np.ndarray: Integer array of shape ``(B, N)``, where ``0`` marks the best
+            individual of each population.
+    """
+    order = np.lexsort((fitness[..., 1], -fitness[..., 0]), axis=-1)
+    positions = np.empty_like(order)
+    ranking = np.broadcast_to(np.arange(order.shape[1]), order.shape)
+    np.put_along_axis(positions, order, ranking, axis=1)
+    return positions
+
+
+def _sample_from_weights(
+    weights: np.ndarray, rngs: Sequence[np.random.Generator]
+) -> np.ndarray:
+    """Draw ``N`` indices per population proportionally to non-negative weights.
+
+    All cumulative distributions are laid out on one axis shifted by the stack
+    index, so a single ``searchsorted`` call serves the whole stack.
+    """
+    stack, size = weights.shape
+    cdf = np.cumsum(weights, axis=1) / weights.sum(axis=1, keepdims=True)
+    cdf[:, -1] = 1
+    offsets = np.arange(stack)[:, None]
+    draws = np.stack([rng.random(size) for rng in rngs])
+    flat = np.searchsorted((cdf + offsets).ravel(), (draws + offsets).ravel(), "right")
+    return flat.reshape(stack, size) - offsets * size
+
+
+def stacked_roulette_selection(
+    fitness: np.ndarray, rngs: Sequence[np.random.Generator]
+) -> np.ndarray:
+    """Select parents with fitness-proportionate selection for each population.
+
+    Populations whose fitness sums to zero fall back to the weight-based
+    pseudo-fitness used by ``roulette_selection``.
+
+    Args:
+        fitness (np.ndarray): Array of shape ``(B, N, 2)`` with [fitness, weight].
+        rngs (Sequence[np.random.Generator]): One generator per population.
+
+    Returns:
+        np.ndarray: Parent indices of shape ``(B, N)``.
+    """
+    proportions = fitness[..., 0].astype(np.float64)
+    empty = proportions.sum(axis=1) == 0
+    if np.any(empty):
+        pseudo = fitness[empty, :, 1].max(axis=1, keepdims=True) - fitness[empty, :, 1]
+        pseudo[np.all(pseudo == 0, axis=1)] = 1
+        proportions[empty] = pseudo
+    return _sample_from_weights(proportions, rngs)
+
+
+def stacked_tournament_selection(
+    fitness: np.ndarray, rngs: Sequence[np.random.Generator]
+) -> np.ndarray:
+    """Select parents with tournaments of ``TOURNAMENT_SIZE`` for each population.
+
+    Contestants are drawn with replacement, which keeps the operator fully
+    vectorized; the winner is the contestant ranked highest by
+    ``stacked_positions``.
+
+    Args:
+        fitness (np.ndarray): Array of shape ``(B, N, 2)`` with [fitness, weight].
+        rngs (Sequence[np.random.Generator]): One generator per population.
+
+    Returns:
+        np.ndarray: Parent indices of shape ``(B, N)``.
+    """
+    size = fitness.shape[1]
+    positions = stacked_positions(fitness)
+    gladiators = np.stack(
+        [rng.integers(0, size, size=(size, TOURNAMENT_SIZE)) for rng in rngs]
+    )
+    contestant_positions = np.take_along_axis(positions[:, :, None], gladiators, axis=1)
+    winners = np.argmin(contestant_positions, axis=2)
+    return np.take_along_axis(gladiators, winners[..., None], axis=2)[..., 0]
+
+
+def stacked_rank_selection(
+    fitness: np.ndarray,
+    rngs: Sequence[np.random.Generator],
+    selection_pressure: float,
+) -> np.ndarray:
+    """Select parents with linear rank selection for each population.
+
+    Args:
+        fitness (np.ndarray): Array of shape ``(B, N, 2)`` with [fitness, weight].
+        rngs (Sequence[np.random.Generator]): One generator per population.
+        selection_pressure (float): Linear ranking pressure in range [1.0, 2.0].
+
+    Returns:
+        np.ndarray: Parent indices of shape ``(B, N)``.
+    """
+    size = fitness.shape[1]
+    ranks = size - stacked_positions(fitness)
+    pressure = selection_pressure
+    probabilities = 2 - pressure + 2 * (pressure - 1) * (ranks - 1) / (size - 1)
+    return _sample_from_weights(probabilities, rngs)
+
+
+SELECTION_TYPES = ("roulette", "tournament", "rank")
+
+
+def stacked_selection(
+    selection_type: str,
+    fitness: np.ndarray,
+    rngs: Sequence[np.random.Generator],
+    selection_pressure: float | None = None,
+) -> np.ndarray:
+    """Dispatch to the stacked variant of the configured selection method.
+
+    Args:
+        selection_type (str): One of ``roulette``, ``tournament`` or ``rank``.
+        fitness (np.ndarray): Array of shape ``(B, N, 2)`` with [fitness, weight].
+        rngs (Sequence[np.random.Generator]): One generator per population.
+        selection_pressure (float | None): Pressure used by ``rank`` selection.
+
+    Raises:
+        ValueError: If the selection type is unknown.
+
+    Returns:
+        np.ndarray: Parent indices of shape ``(B, N)``.
+    """
+    if selection_type == "roulette":
+        return stacked_roulette_selection(fitness, rngs)
+    if selection_type == "tournament":
+        return stacked_tournament_selection(fitness, rngs)
+    if selection_type == "rank":
+        pressure = 1.0 if selection_pressure is None else selection_pressure
+        return stacked_rank_selection(fitness, rngs, pressure)
+    raise ValueError(f"Invalid selection method: {selection_type}")
+
+
+def _cut_mask(
+    crossover_type: str,
+    pairs: int,
+    genome_length: int,
+    used_length: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Build the per-pair column mask of genes swapped by crossover.
+
+    Cut points are drawn within the first ``used_length`` columns, so padded
+    columns never shift the distribution of cuts.
+    """
+    column_index = np.arange(genome_length)
+    if crossover_type == "one":
+        cut_columns = rng.integers(1, used_length, size=pairs)
+        return column_index[None, :] >= cut_columns[:, None]
+    if crossover_type == "two":
+        start_cut_col = rng.integers(1, used_length - 1, size=pairs)
+        stop_cut_col = rng.integers(start_cut_col + 1, used_length, size=pairs)
+        return (column_index[None, :] >= start_cut_col[:, None]) & (
+            column_index[None, :] < stop_cut_col[:, None]
+        )
+    raise ValueError(f"Invalid crossover method: {crossover_type}")
+
+
+def stacked_crossover(
+    population: np.ndarray,
+    parents: np.ndarray,
+    crossover_type: str,
+    crossover_probabilities: np.ndarray,
+    rngs: Sequence[np.random.Generator],
+    genome_lengths: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Pair selected parents and recombine them into a new stacked population.
+
+    Args:
+        population (np.ndarray): Binary genomes of shape ``(B, N, L)``.
+        parents (np.ndarray): Selected parent indices of shape ``(B, N)``.
+        crossover_type (str): ``one`` or ``two`` point crossover.
+        crossover_probabilities (np.ndarray): Pc of each population, shape ``(B,)``.
+        rngs (Sequence[np.random.Generator]): One generator per population.
+        genome_lengths (np.ndarray | None): Number of real (unpadded) genes of
+            each population, shape ``(B,)``. Defaults to ``L`` for all of them.
+        out (np.ndarray | None): Array of shape ``(B, N, L)`` the children are
+            written to, e.g. a view of shared memory. It must not overlap
+            ``population``. Defaults to a new array.
+
+    Returns:
+        np.ndarray: Children of shape ``(B, N, L)``; the first half of each
+            population holds the first child of every pair.
+    """
+    stack, size, genome_length = population.shape
+    if genome_lengths is None:
+        genome_lengths = np.full(stack, genome_length)
+    pairs = np.stack([rng.permutation(parents[b]) for b, rng in enumerate(rngs)])
+    pairs = pairs.reshape(stack, size // 2, 2)
+    p1 = np.take_along_axis(population, pairs[:, :, 0, None], axis=1)
+    p2 = np.take_along_axis(population, pairs[:, :, 1, None], axis=1)
+    cut_mask = np.stack(
+        [
+            _cut_mask(
+                crossover_type, size // 2, genome_length, int(genome_lengths[b]), rng
+            )
+            & (rng.random(size // 2) < crossover_probabilities[b])[:, None]
+            for b, rng in enumerate(rngs)
+        ]
+    )
+    c1 = np.where(cut_mask, p2, p1)
+    c2 = np.where(cut_mask, p1, p2)
+    return np.concatenate((c1, c2), axis=1, out=out)
+
+
+def stacked_mutation(
+    children: np.ndarray,
+    mutation_probabilities: np.ndarray,
+    rngs: Sequence[np.random.Generator],
+    gene_mask: np.ndarray | None = None,
+) -> np.ndarray:
+    """Flip genes in place with each population's own mutation probability.
+
+    Args:
+        children (np.ndarray): Binary genomes of shape ``(B, N, L)``.
+        mutation_probabilities (np.ndarray): Pm of each population, shape ``(B,)``.
+        rngs (Sequence[np.random.Generator]): One generator per population.
+        gene_mask (np.ndarray | None): Boolean array of shape ``(B, L)``;
+            genes marked ``False`` (e.g. padding) are never mutated.
+
+    Returns:
+        np.ndarray: The mutated ``children`` array.
+    """
+    if not np.any(mutation_probabilities > 0):
+        return children
+    shape = children.shape[1:]
+    flips = np.stack(
+        [
+            rng.random(size=shape) < mutation_probabilities[b]
+            for b, rng in enumerate(rngs)
+        ]
+    )
+    if gene_mask is not None:
+        flips &= gene_mask[:, None, :]
+    children[flips] ^= 1
+    return children
+
+
+def stacked_generation_stats(
+    fitness: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    """Compute best/worst individuals and repetition counts of every population.
+
+    Args:
+        fitness (np.ndarray): Array of shape ``(B, N, 2)`` with [fitness, weight].
+
+    Returns:
+        tuple: Arrays of shape ``(B,)`` holding best index, best score, best
+            weight, average fitness, worst score, worst weight and the number of
+            individuals identical to the best one.
+    """
+    order = np.lexsort((fitness[..., 1], -fitness[..., 0]), axis=-1)
+    best_idx = order[:, 0]
+    worst_idx = order[:, -1]
+    stack_index = np.arange(fitness.shape[0])
+    best = fitness[stack_index, best_idx]
+    worst = fitness[stack_index, worst_idx]
+    identical = np.all(fitness == best[:, None, :], axis=2).sum(axis=1) - 1
+    return (
+        best_idx,
+        best[:, 0],
+        best[:, 1],
+        fitness[..., 0].mean(axis=1),
+        worst[:, 0],
+        worst[:, 1],
+        identical,
+    )
@@ -1,10 +1,16 @@
 """Imports methods previusly placed here for temporary path resolution."""
 
 # ruff: noqa
-from src.methods.data_loader import load_data, load_yaml_config
+from src.methods.data_loader import (
+    load_capacity,
+    load_data,
+    load_optimum,
+    load_yaml_config,
+)
 from src.methods.cli_output import final_screen
 from src.methods.memmap_operations import (
     create_population_file,
     create_memmap_config_json,
+    fill_random_rows,
     load_memmap,
 )
@@ -5,8 +5,10 @@ test files in the 'tests/' directory, including mocked path resolution
 and data generation utilities.
 """
 
-from collections.abc import Callable
+import logging
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import pytest
@@ -39,6 +41,42 @@ def test_only_pathresolver(
     return path_resolver
 
 
+@pytest.fixture
+def dataset_factory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[str, Sequence[tuple[int, int]]], Path]:
+    """Pytest fixture writing low-dimensional instances for runner tests.
+
+    The PROJECT_ROOT of the PathResolver is mocked to point to 'tmp_path', and
+    handlers left on the "GA experiment run" logger by earlier runs are
+    removed, so every runner logs into its own run directory.
+
+    Args:
+        tmp_path (pathlib.Path): Pytest std fixture for creating a temp directory.
+        monkeypatch (pytest.MonkeyPatch): Pytest std fixture for setting attributes.
+
+    Returns:
+        Callable[[str, Sequence[tuple[int, int]]], Path]: A factory taking the
+        instance name and its (value, weight) items and returning the path of
+        the written "dane AG 2/low-dimensional/<name>" file.
+
+    """
+    monkeypatch.setattr(PathResolver, "PROJECT_ROOT", tmp_path)
+    main_logger = logging.getLogger("GA experiment run")
+    for handler in list(main_logger.handlers):
+        main_logger.removeHandler(handler)
+        handler.close()
+
+    def _factory(name: str, items: Sequence[tuple[int, int]]) -> Path:
+        data_dir = tmp_path / "dane AG 2" / "low-dimensional"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        path = data_dir / name
+        path.write_text("".join(f"{value} {weight}\n" for value, weight in items))
+        return path
+
+    return _factory
+
+
 @pytest.fixture
 def test_only_rng() -> np.random.Generator:
     """Pytest fixture creating a deterministic random number generator.
@@ -88,7 +126,8 @@ def experiment_config_factory() -> Callable[..., ExperimentConfig]:
 
     This fixture returns an inner function that builds ExperimentConfig objects with
     reasonable defaults. Individual tests can override any parameter using keyword
-    arguments, while avoiding repeated boilerplate configuration code.
+    arguments, while avoiding repeated boilerplate configuration code. Further
+    ExperimentConfig fields (e.g. ``stagnation_window``) are passed through.
 
     Usage example:
         def test_something(experiment_config_factory):
@@ -102,20 +141,21 @@ def experiment_config_factory() -> Callable[..., ExperimentConfig]:
 
     def _factory(
         *,
-        population_size: int,
-        generations: int,
-        max_weight: int,
-        selection_type: str,
-        crossover_type: str,
-        crossover_probability: float,
-        mutation_probability: float,
-        penalty_multiplier: float,
+        population_size: int = 6,
+        generations: int = 3,
+        max_weight: int = 15,
+        selection_type: str = "roulette",
+        crossover_type: str = "one",
+        crossover_probability: float = 0.9,
+        mutation_probability: float = 0.1,
+        penalty_multiplier: float = 0.0,
         seed: int | None = 1234,
         exp_identifier: int = 0,
         log_level: str = "INFO",
         stream_batch: int | None = None,
         selection_pressure: float | None = None,
         rng: np.random.Generator | None = None,
+        **extra: Any,
     ) -> ExperimentConfig:
         return ExperimentConfig(
             data_filename="temp_test_data.csv",
@@ -133,11 +173,54 @@ def experiment_config_factory() -> Callable[..., ExperimentConfig]:
             stream_batch_size=stream_batch,
             rng=rng,
             selection_pressure=selection_pressure,
+            **extra,
         )
 
     return _factory
 
 
+@pytest.fixture
+def run_config_factory() -> Callable[..., dict[str, Any]]:
+    """Create raw runner configurations with the defaults of ExperimentConfig tests.
+
+    Runners take the configuration as a dict of ExperimentConfig fields. This
+    fixture returns an inner function building such a dict for a dataset, with
+    the same defaults as ``experiment_config_factory``; tests override only the
+    fields they rely on.
+
+    Usage example:
+        def test_something(dataset_factory, run_config_factory):
+            dataset_factory("f_dummy", [(10, 5), (8, 4)])
+            runner = EvolutionRunner(run_config_factory("f_dummy", seed=3))
+
+    Returns:
+        Callable[..., dict[str, Any]]: A factory function taking the dataset
+        name and ExperimentConfig fields as keyword arguments and returning
+        the configuration dict.
+
+    """
+
+    def _factory(data_filename: str, **overrides: Any) -> dict[str, Any]:
+        config = {
+            "data_filename": data_filename,
+            "population_size": 6,
+            "generations": 3,
+            "max_weight": 15,
+            "seed": 1234,
+            "selection_type": "roulette",
+            "crossover_type": "one",
+            "crossover_probability": 0.9,
+            "mutation_probability": 0.1,
+            "penalty": 0.0,
+            "experiment_identifier": 0,
+            "log_level": "INFO",
+        }
+        config.update(overrides)
+        return config
+
+    return _factory
+
+
 class DummyPopManager:
     """Lightweight stand-in for PopulationHandler used in fitness adapter tests.
 
@@ -0,0 +1,114 @@
+"""Tests for the cellular GA neighbourhood operations and runner."""
+
+import csv
+
+import numpy as np
+import pytest
+from src.classes.CellularRunner import CellularRunner
+from src.methods.cellular import (
+    cellular_offspring,
+    grid_shape,
+    neighborhood_tournament,
+)
+
+ITEMS = [(10, 5), (8, 4), (3, 3), (7, 6), (2, 1), (9, 7), (4, 4), (6, 2)]
+
+
+@pytest.mark.parametrize(
+    "size, shape", [(16, (4, 4)), (20, (4, 5)), (14, (2, 7)), (2, (1, 2))]
+)
+def test_grid_shape_is_most_square(size, shape) -> None:
+    assert grid_shape(size) == shape
+
+
+@pytest.mark.parametrize("neighborhood, reach", [("von_neumann", 1), ("moore", 2)])
+def test_mates_are_torus_neighbours(neighborhood, reach) -> None:
+    rng = np.random.default_rng(0)
+    shape = (5, 6)
+    fitness = np.stack(
+        (rng.integers(0, 50, size=30), rng.integers(0, 50, size=30)), axis=1
+    )
+    for _ in range(20):
+        mates = neighborhood_tournament(fitness, shape, neighborhood, rng)
+        rows, cols = np.divmod(np.arange(30), shape[1])
+        mate_rows, mate_cols = np.divmod(mates, shape[1])
+        dy = np.minimum((rows - mate_rows) % 5, (mate_rows - rows) % 5)
+        dx = np.minimum((cols - mate_cols) % 6, (mate_cols - cols) % 6)
+        assert (np.maximum(dy, dx) == 1).all()
+        assert ((dy + dx) <= reach).all()
+
+
+def test_tournament_prefers_better_neighbour() -> None:
+    # On a 3x3 torus the neighbours of the centre cell 4 are 1, 3, 5 and 7.
+    fitness = np.zeros((9, 2), dtype=np.int64)
+    fitness[[1, 3, 5, 7], 0] = [2, 4, 6, 8]
+    mates = [
+        int(neighborhood_tournament(fitness, (3, 3), "von_neumann", rng)[4])
+        for rng in map(np.random.default_rng, range(100))
+    ]
+    assert set(mates) == {1, 3, 5, 7}
+    assert [mates.count(cell) for cell in (1, 3, 5, 7)] == sorted(
+        mates.count(cell) for cell in (1, 3, 5, 7)
+    )
+
+
+def test_invalid_neighborhood_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Invalid neighborhood: hex"):
+        neighborhood_tournament(
+            np.zeros((4, 2)), (2, 2), "hex", np.random.default_rng(0)
+        )
+
+
+@pytest.mark.parametrize("crossover_type", ["one", "two"])
+def test_offspring_takes_one_segment_from_mate(crossover_type) -> None:
+    rng = np.random.default_rng(4)
+    cells = np.zeros((40, 12), dtype=np.uint8)
+    mates = np.ones((40, 12), dtype=np.uint8)
+    children = cellular_offspring(cells, mates, crossover_type, 1.0, 0.0, rng)
+    assert children.any(axis=1).all()
+    assert not children[:, 0].any()
+    segments = (np.diff(children.astype(np.int8), axis=1) != 0).sum(axis=1)
+    assert segments.max() == (1 if crossover_type == "one" else 2)
+    copies = cellular_offspring(cells, mates, crossover_type, 0.0, 0.0, rng)
+    assert not copies.any()
+
+
+@pytest.fixture
+def cellular_config(dataset_factory, run_config_factory) -> dict:
+    dataset_factory("f_cellular", ITEMS)
+    return run_config_factory(
+        "f_cellular", population_size=24, generations=25, stream_batch_size=10
+    )
+
+
+@pytest.mark.parametrize("neighborhood", ["von_neumann", "moore"])
+def test_runner_never_loses_best_cell(cellular_config, neighborhood) -> None:
+    runner = CellularRunner(cellular_config, neighborhood=neighborhood)
+    stats = runner.evolve()
+
+    assert stats.iteration == 25
+    assert runner.best_fitness == 29
+    assert not list(runner.paths.get_output_path().parent.rglob("*.dat"))
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    with open(csv_path, newline="") as f:
+        rows = list(csv.reader(f))
+    meta = {row[0]: row[1] for row in rows if row and row[0].startswith("#")}
+    table = [row for row in rows if row and row[0].isdigit()]
+    assert meta["# neighborhood"] == neighborhood
+    assert meta["# grid"] == "4x6"
+    assert meta["# evaluations"] == str(24 * 26)
+    best = [int(row[1]) for row in table]
+    assert best == sorted(best)
+    assert int(table[0][-1]) == 0
+    assert sum(int(row[-1]) for row in table) > 0
+
+
+def test_invalid_runner_neighborhood_is_rejected(cellular_config) -> None:
+    with pytest.raises(ValueError, match="Invalid neighborhood: hex"):
+        CellularRunner(cellular_config, neighborhood="hex")
+
+
+@pytest.mark.parametrize("size, grid", [(2, "1x2"), (22, "2x11")])
+def test_thin_grid_is_rejected(cellular_config, size, grid) -> None:
+    with pytest.raises(ValueError, match=f"gives a {grid} grid"):
+        CellularRunner({**cellular_config, "population_size": size})
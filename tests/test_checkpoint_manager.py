@@ -0,0 +1,128 @@
+"""Tests for periodic checkpoints and resuming interrupted runs."""
+
+import json
+import logging
+
+import numpy as np
+import pytest
+from src.classes.CheckpointManager import CheckpointManager
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.PathResolver import PathResolver
+
+
+def _prepare_root(root, monkeypatch) -> None:
+    monkeypatch.setattr(PathResolver, "PROJECT_ROOT", root)
+    data_dir = root / "dane AG 2" / "low-dimensional"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "f_dummy.txt").write_text("10 5\n8 4\n3 3\n7 6\n2 1\n9 7\n")
+    main_logger = logging.getLogger("GA experiment run")
+    for handler in list(main_logger.handlers):
+        main_logger.removeHandler(handler)
+        handler.close()
+
+
+@pytest.fixture
+def checkpoint_config(run_config_factory) -> dict:
+    return run_config_factory(
+        "f_dummy.txt", generations=7, stream_batch_size=2, checkpoint_interval=2
+    )
+
+
+def _table(runner: EvolutionRunner) -> str:
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    return csv_path.read_text()
+
+
+@pytest.mark.parametrize(
+    "overrides", [{}, {"freeze_interval": 1, "mutation_probability": 0.02}]
+)
+def test_resume_continues_run_bit_identically(
+    tmp_path, monkeypatch, checkpoint_config, overrides
+) -> None:
+    _prepare_root(tmp_path / "reference", monkeypatch)
+    reference = EvolutionRunner({**checkpoint_config, **overrides}, report=False)
+    reference.evolve()
+
+    _prepare_root(tmp_path / "crashed", monkeypatch)
+    crashed = EvolutionRunner({**checkpoint_config, **overrides}, report=False)
+    steps = crashed.steps()
+    for _ in range(5):
+        next(steps)
+    # Simulate a crash: rows of generation 5 reach the disk, nothing is closed.
+    assert crashed.csv_logger.file is not None
+    crashed.csv_logger.file.flush()
+    run_directory = crashed.paths.get_checkpoint_path().parent
+
+    resumed = EvolutionRunner.resume(run_directory, report=False)
+    assert resumed.last_stats.iteration == 4
+    resumed.evolve()
+
+    assert _table(resumed) == _table(reference)
+    assert resumed.evaluations == reference.evaluations
+    checkpoints = sorted(p.name for p in resumed.paths.get_checkpoint_path().iterdir())
+    name = resumed.paths.filename_constant
+    assert checkpoints == [
+        f"{name}.checkpoint.json",
+        f"{name}_g0000006.dat",
+        f"{name}_g0000006_fitness.npy",
+    ]
+
+
+def test_manifest_is_written_last_and_load_picks_it_up(
+    tmp_path, monkeypatch, checkpoint_config
+) -> None:
+    _prepare_root(tmp_path, monkeypatch)
+    runner = EvolutionRunner({**checkpoint_config, "generations": 2}, report=False)
+    with runner:
+        list(runner.steps())
+        manifest = CheckpointManager.load(runner.paths.get_checkpoint_path())
+        population = runner.population_manager.get_pop_handle()
+        assert population is not None
+        saved = np.fromfile(
+            runner.paths.get_checkpoint_path() / manifest["population"], np.uint8
+        )
+        np.testing.assert_array_equal(saved.reshape(6, 6), population)
+    assert manifest["iteration"] == 2
+    assert manifest["config"]["checkpoint_interval"] == 2
+    assert json.loads(json.dumps(manifest["rng_state"])) == manifest["rng_state"]
+    assert not list(runner.paths.get_checkpoint_path().glob("*.tmp"))
+
+    with pytest.raises(FileNotFoundError, match="No checkpoint found"):
+        CheckpointManager.load(tmp_path)
+
+
+def test_resume_keeps_instance_changes(
+    tmp_path, monkeypatch, checkpoint_config
+) -> None:
+    def change(runner: EvolutionRunner) -> None:
+        runner.update_item(0, value=1, weight=9)
+        runner.update_constraints(max_weight=11)
+
+    config = {**checkpoint_config, "dynamic_instance": True}
+    _prepare_root(tmp_path / "reference", monkeypatch)
+    reference = EvolutionRunner(config, report=False)
+    with reference:
+        steps = reference.steps()
+        for _ in range(3):
+            next(steps)
+        change(reference)
+        list(steps)
+
+    _prepare_root(tmp_path / "crashed", monkeypatch)
+    crashed = EvolutionRunner(config, report=False)
+    steps = crashed.steps()
+    for _ in range(3):
+        next(steps)
+    change(crashed)
+    for _ in range(2):
+        next(steps)
+    assert crashed.csv_logger.file is not None
+    crashed.csv_logger.file.flush()
+
+    resumed = EvolutionRunner.resume(
+        crashed.paths.get_checkpoint_path().parent, report=False
+    )
+    assert resumed.config.max_weight == 11
+    assert resumed.item_data[0].tolist() == [1, 9]
+    resumed.evolve()
+    assert _table(resumed) == _table(reference)
@@ -0,0 +1,69 @@
+"""Tests for the PBIL and compact GA engines."""
+
+import csv
+import itertools
+
+import pytest
+from src.classes.DistributionRunner import DistributionRunner
+
+ITEMS = [(10, 5), (8, 4), (3, 3), (7, 6), (2, 1), (9, 7), (4, 4), (6, 2)]
+
+
+@pytest.fixture
+def eda_config(dataset_factory, run_config_factory) -> dict:
+    dataset_factory("f_eda", ITEMS)
+    return run_config_factory(
+        "f_eda", population_size=20, generations=300, stream_batch_size=8
+    )
+
+
+def _optimum() -> int:
+    best = 0
+    for genome in itertools.product((0, 1), repeat=len(ITEMS)):
+        value = sum(g * v for g, (v, _) in zip(genome, ITEMS))
+        weight = sum(g * w for g, (_, w) in zip(genome, ITEMS))
+        if weight <= 15:
+            best = max(best, value)
+    return best
+
+
+@pytest.mark.parametrize("algorithm", ["pbil", "cga"])
+def test_engines_learn_without_population_files(eda_config, algorithm) -> None:
+    runner = DistributionRunner(eda_config, algorithm=algorithm, learning_rate=0.2)
+    runner.evolve()
+
+    assert runner.stop_reason == "converged"
+    assert runner.converged_loci == 1
+    assert runner.best_fitness >= 0.9 * _optimum()
+    assert runner.probabilities.shape == (len(ITEMS),)
+    assert not list(runner.paths.get_output_path().parent.rglob("*.dat"))
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    with open(csv_path, newline="") as f:
+        rows = list(csv.reader(f))
+    meta = {row[0]: row[1] for row in rows if row and row[0].startswith("#")}
+    table = [row for row in rows if row and row[0].isdigit()]
+    assert meta["# algorithm"] == algorithm
+    assert meta["# evaluations"] == str(20 * len(table))
+    assert float(table[-1][-1]) == 1.0
+
+
+def test_invalid_algorithm_is_rejected(eda_config) -> None:
+    with pytest.raises(ValueError, match="Invalid distribution algorithm: umda"):
+        DistributionRunner(eda_config, algorithm="umda")
+
+
+def test_step_sizes_come_from_the_config(eda_config) -> None:
+    runner = DistributionRunner(
+        {
+            **eda_config,
+            "learning_rate": 0.3,
+            "mutation_shift": 0.0,
+            "virtual_population": 6,
+        },
+        algorithm="cga",
+    )
+    assert (runner.learning_rate, runner.mutation_shift) == (0.3, 0.0)
+    assert runner.virtual_population == 6
+    assert DistributionRunner(eda_config, learning_rate=0.5).learning_rate == 0.5
+    with pytest.raises(ValueError, match="Virtual population must be at least 2"):
+        DistributionRunner({**eda_config, "virtual_population": 1})
@@ -1,11 +1,17 @@
 """Top-level smoke tests for the EvolutionRunner entry point."""
 
+import asyncio
 import csv
 import logging
 
+import numpy as np
 import pytest
 from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.ParetoFrontRecorder import ParetoFrontRecorder
 from src.classes.PathResolver import PathResolver
+from src.methods.fitness_score import fitness_calculation
+from src.methods.initialization import repair_in_order
+from src.methods.lp_relaxation import efficiency_order
 
 
 def test_evolution_runner_rejects_zero_generations() -> None:
@@ -101,3 +107,353 @@ def test_evolution_runner_evolve_writes_iterations(tmp_path, monkeypatch) -> Non
     iteration_rows = [row for row in rows if row and row[0].isdigit()]
 
     assert {row[0] for row in iteration_rows} == {"0", "1"}
+
+
+def _make_runner(dataset_factory, **overrides) -> EvolutionRunner:
+    dataset_factory("f_dummy.txt", [(10, 5), (8, 4), (3, 3), (7, 6)])
+    config = {
+        "data_filename": "f_dummy.txt",
+        "population_size": 4,
+        "generations": 5,
+        "max_weight": 10,
+        "seed": 123,
+        "selection_type": "roulette",
+        "crossover_type": "one",
+        "crossover_probability": 0.5,
+        "mutation_probability": 0.1,
+        "penalty": 1.0,
+        "experiment_identifier": 3,
+        "log_level": "INFO",
+    }
+    config.update(overrides)
+    return EvolutionRunner(config)
+
+
+def test_steps_stream_stats_and_stop_early_without_plotting(
+    dataset_factory, monkeypatch
+) -> None:
+    def _no_plot(self):
+        raise AssertionError("closing a stepped runner must not plot")
+
+    monkeypatch.setattr(
+        "src.classes.Plotter.Plotter.performance_and_correctness", _no_plot
+    )
+    runner = _make_runner(dataset_factory)
+
+    with runner:
+        first = [stats.iteration for _, stats in zip(range(2), runner.steps())]
+        rest = [stats.iteration for stats in runner.steps()]
+        assert runner.last_stats.best_fitness >= runner.last_stats.worst_fitness
+
+    assert first == [1, 2]
+    assert rest == [3, 4, 5]
+    assert not runner.paths.get_temp_path().exists()
+    assert list(runner.steps()) == []
+
+
+def test_asteps_interleaves_runners_cooperatively(dataset_factory) -> None:
+    first = _make_runner(dataset_factory, generations=3)
+    second = _make_runner(
+        dataset_factory, generations=3, seed=7, experiment_identifier=4
+    )
+    order = []
+
+    async def _consume(name, runner, offload=False):
+        async for stats in runner.asteps(offload=offload):
+            order.append((name, stats.iteration))
+        runner.close()
+
+    async def _main():
+        await asyncio.gather(_consume("a", first), _consume("b", second))
+
+    asyncio.run(_main())
+    assert order == [("a", 1), ("b", 1), ("a", 2), ("b", 2), ("a", 3), ("b", 3)]
+
+    order.clear()
+    third = _make_runner(dataset_factory, generations=2, experiment_identifier=5)
+    asyncio.run(_consume("c", third, offload=True))
+    assert order == [("c", 1), ("c", 2)]
+
+
+def _metadata(runner: EvolutionRunner) -> dict:
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    with open(csv_path, newline="") as f:
+        return {row[0]: row[1] for row in csv.reader(f) if row and row[0][0] == "#"}
+
+
+def test_evaluation_budget_ends_run_before_overspending(dataset_factory) -> None:
+    runner = _make_runner(dataset_factory, generations=50, evaluation_budget=13)
+
+    with runner:
+        iterations = [stats.iteration for stats in runner.steps()]
+
+    assert iterations == [1, 2]
+    assert runner.evaluations == 12
+    meta = _metadata(runner)
+    assert meta["# stop_reason"] == "evaluation_budget"
+    assert meta["# evaluations"] == "12"
+
+
+def test_time_budget_aborts_generation_between_batches(dataset_factory) -> None:
+    runner = _make_runner(dataset_factory, time_budget=3600.0, stream_batch_size=1)
+    population = runner.population_manager.get_pop_handle()
+    assert population is not None
+    before = np.array(population)
+    runner._out_of_time = lambda: True  # type: ignore[method-assign]
+
+    with runner:
+        assert list(runner.steps()) == []
+        assert runner.stop_reason == "time_budget"
+        assert not runner.paths.get_children_filepath().exists()
+        np.testing.assert_array_equal(population, before)
+
+    meta = _metadata(runner)
+    assert meta["# stop_reason"] == "time_budget"
+    assert meta["# last_iteration"] == "0"
+
+
+def test_local_search_writes_refined_elites_back(dataset_factory) -> None:
+    runner = _make_runner(
+        dataset_factory,
+        generations=1,
+        local_search_interval=1,
+        local_search_elites=2,
+        penalty=0.0,
+    )
+
+    with runner:
+        (stats,) = list(runner.steps())
+        population = runner.population_manager.get_pop_handle()
+        assert population is not None
+        recomputed = population @ runner.value_weight_array
+        np.testing.assert_array_equal(recomputed[:, 1], runner.fitness[:, 1])
+
+    assert stats.best_fitness == 18
+    assert stats.genome == "1100"
+    assert runner.evaluations > 8
+
+
+@pytest.mark.parametrize("stream_batch_size", [None, 2])
+def test_duplicates_are_replaced_before_evaluation(
+    dataset_factory, stream_batch_size
+) -> None:
+    runner = _make_runner(
+        dataset_factory,
+        generations=1,
+        stream_batch_size=stream_batch_size,
+        replace_duplicates=True,
+        immigrant_type="perturbed",
+        perturbation_probability=1.0,
+    )
+    population = runner.population_manager.get_pop_handle()
+    assert population is not None
+    first = np.array(population[0])
+    runner.population_manager.update_individuals(np.arange(4), np.tile(first, (4, 1)))
+
+    assert runner._replace_duplicates() == 3
+    population = runner.population_manager.get_pop_handle()
+    assert population is not None
+    np.testing.assert_array_equal(population[0], first)
+    np.testing.assert_array_equal(population[1:], np.tile(1 - first, (3, 1)))
+
+    with runner:
+        (stats,) = list(runner.steps())
+
+    assert stats.duplicates_replaced is not None
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    with open(csv_path, newline="") as f:
+        rows = [row for row in csv.reader(f) if row and row[0][0] != "#"]
+    assert rows[0][-1] == "duplicates_replaced"
+    assert rows[-1][-1] == str(stats.duplicates_replaced)
+
+
+def test_hall_of_fame_is_saved_as_packed_bits(dataset_factory) -> None:
+    runner = _make_runner(dataset_factory, hall_of_fame_size=3)
+
+    with runner:
+        best = max(stats.best_fitness for stats in runner.steps())
+
+    path = runner.paths.get_output_path() / (
+        f"{runner.paths.filename_constant}_hall_of_fame.npy"
+    )
+    archive = np.load(path)
+    genomes = np.unpackbits(archive["genome"], axis=1, count=4)
+    assert archive["fitness"][0] == best
+    assert np.all(np.diff(archive["fitness"]) <= 0)
+    assert len(np.unique(genomes, axis=0)) == len(archive)
+
+
+def test_problem_reduction_reports_full_length_genomes(dataset_factory) -> None:
+    runner = _make_runner(dataset_factory, reduce_problem=True, penalty=0.0)
+
+    with runner:
+        stats = list(runner.steps())
+
+    assert runner.reduction is not None
+    assert runner.value_weight_array.shape[0] == len(runner.reduction.free)
+    for generation in stats:
+        genome = np.array([int(gene) for gene in generation.genome])
+        assert len(genome) == 4
+        value, weight = genome @ runner.item_data
+        assert (generation.best_fitness, generation.best_weight) == (value, weight)
+    assert _metadata(runner)["# free_items"] == str(len(runner.reduction.free))
+
+
+def test_pareto_mode_exports_front_every_generation(dataset_factory) -> None:
+    runner = _make_runner(dataset_factory, selection_type="pareto", reduce_problem=True)
+
+    with runner:
+        stats = list(runner.steps())
+
+    path = runner.paths.get_output_path() / (
+        f"{runner.paths.filename_constant}_pareto.bin"
+    )
+    header, fronts = ParetoFrontRecorder.load(path)
+    assert sorted(fronts) == [0] + [generation.iteration for generation in stats]
+    items = runner.item_data
+    for generation in stats:
+        front = fronts[generation.iteration]
+        assert len(front) == generation.front_size
+        assert front["fitness"][0] == generation.best_fitness
+        assert np.all(np.diff(front["fitness"]) < 0)
+        assert np.all(np.diff(front["weight"]) < 0)
+        genomes = np.unpackbits(front["genome"], axis=1, count=header["genome_length"])
+        np.testing.assert_array_equal(genomes @ items[:, 1], front["weight"])
+
+
+def test_locus_freezing_keeps_fitness_consistent(dataset_factory, monkeypatch) -> None:
+    rng = np.random.default_rng(7)
+    items = np.stack((rng.integers(1, 50, 40), rng.integers(1, 30, 40)), axis=1)
+    dataset_factory("f_freeze.txt", items)
+    runner = _make_runner(
+        dataset_factory,
+        data_filename="f_freeze.txt",
+        max_weight=200,
+        penalty=0.0,
+        population_size=20,
+        generations=30,
+        selection_type="tournament",
+        mutation_probability=0.002,
+        freeze_interval=2,
+    )
+    remapped = []
+    remap = runner.population_manager.remap
+    monkeypatch.setattr(
+        runner.population_manager,
+        "remap",
+        lambda *args: remapped.append(runner._next_iteration) or remap(*args),
+    )
+
+    with runner:
+        stats = list(runner.steps())
+
+    assert runner.freezer is not None
+    assert min(generation.working_loci for generation in stats) < 40
+    assert remapped and all(iteration % 2 == 0 for iteration in remapped)
+    for generation in stats:
+        genome = np.array([int(gene) for gene in generation.genome])
+        assert genome @ items[:, 0] == generation.best_fitness
+        assert genome @ items[:, 1] == generation.best_weight
+
+
+def test_warm_start_from_saved_population(dataset_factory, tmp_path) -> None:
+    first = _make_runner(dataset_factory, save_population=True)
+    with first:
+        list(first.steps())
+    saved = first.paths.get_output_path() / (
+        f"{first.paths.filename_constant}_population.npy"
+    )
+
+    second = _make_runner(
+        dataset_factory,
+        experiment_identifier=4,
+        initial_population=str(saved.relative_to(tmp_path)),
+        max_weight=8,
+    )
+    with second:
+        population = second.population_manager.get_pop_handle()
+        assert population is not None
+        values, weights = second.item_data[:, 0], second.item_data[:, 1]
+        expected = repair_in_order(
+            np.load(saved), efficiency_order(values, weights), weights, 8
+        )
+        np.testing.assert_array_equal(population, expected)
+        assert np.all(population @ weights <= 8)
+
+
+def test_dynamic_instance_rescores_without_full_evaluation(
+    dataset_factory, monkeypatch
+) -> None:
+    runner = _make_runner(dataset_factory, dynamic_instance=True, population_size=8)
+    with runner:
+        steps = runner.steps()
+        next(steps)
+
+        def expected() -> np.ndarray:
+            population = runner.population_manager.get_pop_handle()
+            assert population is not None
+            return fitness_calculation(
+                max_weight=runner.config.max_weight,
+                penalty_factor=runner.config.penalty,
+                population=population,
+                batch=3,
+                value_arr=np.array([10, 8, 3, 7]),
+                weight_arr=np.array([5, 4, 20, 6]),
+            )
+
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                "src.classes.EvolutionRunner.raw_sums",
+                lambda **_: pytest.fail("population was re-evaluated"),
+            )
+            runner.update_item(2, weight=20)
+            runner.update_constraints(max_weight=9, penalty=0.0)
+        np.testing.assert_array_equal(runner.fitness, expected())
+        assert runner.config.max_weight == 9
+
+        stats = next(steps)
+        assert stats.best_weight <= 9
+        np.testing.assert_array_equal(runner.fitness, expected())
+        with pytest.raises(ValueError, match="Item index 4 out of range"):
+            runner.update_item(4, value=1)
+
+
+def test_instance_changes_require_dynamic_mode(dataset_factory) -> None:
+    runner = _make_runner(dataset_factory)
+    with runner:
+        with pytest.raises(RuntimeError, match="require dynamic_instance"):
+            runner.update_constraints(max_weight=5)
+
+
+def test_runtime_is_logged_once_when_stopping_at_last_generation(
+    dataset_factory, monkeypatch
+) -> None:
+    runner = _make_runner(dataset_factory)
+    monkeypatch.setattr(
+        runner,
+        "_check_stopping",
+        lambda stats: "optimum_reached" if stats.iteration == 5 else None,
+    )
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append  # type: ignore[method-assign]
+    logging.getLogger("GA experiment run").addHandler(handler)
+
+    with runner:
+        iterations = [stats.iteration for stats in runner.steps()]
+
+    assert iterations == [1, 2, 3, 4, 5]
+    assert runner.stop_reason == "optimum_reached"
+    runtime_logs = [r for r in records if r.msg == "Program worked for %.3f s"]
+    assert len(runtime_logs) == 1
+
+
+def test_unexpected_optimum_errors_are_not_swallowed(
+    dataset_factory, monkeypatch
+) -> None:
+    def _denied(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr("src.classes.EvolutionRunner.load_optimum", _denied)
+    with pytest.raises(PermissionError):
+        _make_runner(dataset_factory, stop_at_optimum=True)
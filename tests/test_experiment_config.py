@@ -151,3 +151,76 @@ def test_porobability_of_failure_wrong_weight_sum() -> float:
     weight_sum = 0.5
     with pytest.raises(ValueError, match="Weight sum must be greater than 0"):
         config.generate_probability_of_failure(weight_sum)
+
+
+def test_stopping_criteria_validation() -> None:
+    for field, value, message in [
+        ("lp_bound_tolerance", -0.1, "LP bound tolerance must be non-negative"),
+        ("stagnation_window", 0, "Stagnation window must be greater than 0"),
+        ("diversity_floor", 1.5, "Diversity floor must be between 0 and 1"),
+    ]:
+        kwargs = _base_kwargs()
+        kwargs[field] = value
+        with pytest.raises(ValueError, match=message):
+            ExperimentConfig(**kwargs)
+
+
+def test_local_search_validation() -> None:
+    for field, value, message in [
+        ("local_search_interval", 0, "Local search interval must be greater than 0"),
+        ("local_search_elites", 0, "Local search elites must be greater than 0"),
+        ("local_search_steps", 0, "Local search steps must be greater than 0"),
+    ]:
+        kwargs = _base_kwargs()
+        kwargs[field] = value
+        with pytest.raises(ValueError, match=message):
+            ExperimentConfig(**kwargs)
+
+
+def test_initialization_shares_validation() -> None:
+    for shares, message in [
+        ({"greedy_init_share": 1.5}, "Initialization shares must be between 0 and 1"),
+        ({"lp_init_share": -0.1}, "Initialization shares must be between 0 and 1"),
+        (
+            {"greedy_init_share": 0.6, "lp_init_share": 0.6},
+            "Initialization shares must not exceed 1 in total",
+        ),
+    ]:
+        kwargs = _base_kwargs()
+        kwargs.update(shares)
+        with pytest.raises(ValueError, match=message):
+            ExperimentConfig(**kwargs)
+
+
+def test_immigrant_validation() -> None:
+    for field, value, message in [
+        ("immigrant_type", "clone", "Invalid immigrant type: clone"),
+        (
+            "perturbation_probability",
+            0.0,
+            "Perturbation probability must be between 0 and 1",
+        ),
+    ]:
+        kwargs = _base_kwargs()
+        kwargs[field] = value
+        with pytest.raises(ValueError, match=message):
+            ExperimentConfig(**kwargs)
+
+
+def test_dynamic_instance_excludes_fixed_items() -> None:
+    for field, value in [("reduce_problem", True), ("freeze_interval", 5)]:
+        kwargs = _base_kwargs()
+        kwargs.update({"dynamic_instance": True, field: value})
+        with pytest.raises(ValueError, match="Dynamic instance cannot be combined"):
+            ExperimentConfig(**kwargs)
+
+
+def test_parameterless_race_validation() -> None:
+    for field, value, message in [
+        ("counter_base", 1, "Counter base must be at least 2"),
+        ("max_populations", 0, "At least one population is required"),
+    ]:
+        kwargs = _base_kwargs()
+        kwargs[field] = value
+        with pytest.raises(ValueError, match=message):
+            ExperimentConfig(**kwargs)
@@ -5,7 +5,12 @@ method located in 'src/methods/fitness_score'.
 """
 
 import numpy as np
-from src.methods.fitness_score import fitness_calculation, fitness_class_adapter
+from src.methods.fitness_score import (
+    fitness_calculation,
+    fitness_class_adapter,
+    raw_sums,
+    rescore,
+)
 
 
 def test_fitness_penalty_factor_zero_discards_overweight_individuals() -> None:
@@ -105,3 +110,26 @@ def test_fitness_class_adapter_uses_config_and_population_handle(
 
     expected = np.array([[25, 9], [35, 17]])
     np.testing.assert_array_equal(result, expected)
+
+
+def test_rescore_of_cached_sums_matches_full_evaluation() -> None:
+    rng = np.random.default_rng(7)
+    population = rng.integers(0, 2, size=(20, 6), dtype=np.uint8)
+    value_arr = np.array([3, 5, 7, 11, 2, 4])
+    weight_arr = np.array([2, 4, 6, 8, 1, 3])
+    sums = raw_sums(population, 3, value_arr, weight_arr)
+    np.testing.assert_array_equal(
+        sums, np.stack((population @ value_arr, population @ weight_arr), axis=1)
+    )
+    for max_weight, penalty in [(10, 0.0), (12, 1.5), (25, 0.3)]:
+        np.testing.assert_array_equal(
+            rescore(sums, max_weight, penalty),
+            fitness_calculation(
+                max_weight=max_weight,
+                penalty_factor=penalty,
+                population=population,
+                batch=4,
+                value_arr=value_arr,
+                weight_arr=weight_arr,
+            ),
+        )
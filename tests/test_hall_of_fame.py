@@ -0,0 +1,47 @@
+"""Tests for the bounded archive of top unique genomes."""
+
+import numpy as np
+import pytest
+from src.classes.HallOfFame import HallOfFame
+
+
+def test_keeps_best_unique_genomes_ranked_by_fitness_then_weight() -> None:
+    hall = HallOfFame(size=3, genome_length=10)
+    population = np.eye(5, 10, dtype=np.uint8)
+    population[4] = population[0]
+    fitness = np.array([[50, 9], [40, 5], [50, 7], [10, 1], [50, 9]])
+
+    assert hall.update(population, fitness) == 3
+    np.testing.assert_array_equal(hall.entries()["fitness"], [50, 50, 40])
+    np.testing.assert_array_equal(hall.entries()["weight"], [7, 9, 5])
+    np.testing.assert_array_equal(hall.genomes(), population[[2, 0, 1]])
+
+    assert hall.update(population, fitness) == 0
+    better = np.array([[60, 1]])
+    assert hall.update(population[3:4], better) == 1
+    np.testing.assert_array_equal(hall.entries()["fitness"], [60, 50, 50])
+    assert len(hall) == 3
+
+
+def test_save_and_state_round_trip(tmp_path) -> None:
+    rng = np.random.default_rng(0)
+    population = (rng.random((20, 13)) < 0.5).astype(np.uint8)
+    fitness = np.stack((rng.integers(0, 100, 20), rng.integers(0, 50, 20)), axis=1)
+    hall = HallOfFame(size=5, genome_length=13)
+    hall.update(population, fitness)
+
+    saved = np.load(hall.save(tmp_path / "hof.npy"))
+    np.testing.assert_array_equal(saved, hall.entries())
+    assert saved["genome"].shape == (5, 2)
+    unpacked = np.unpackbits(saved["genome"], axis=1, count=13)
+    np.testing.assert_array_equal(unpacked, hall.genomes())
+
+    restored = HallOfFame(size=5, genome_length=13)
+    restored.load_state(hall.state())
+    np.testing.assert_array_equal(restored.entries(), hall.entries())
+    assert restored.update(population, fitness) == 0
+
+
+def test_rejects_empty_archive() -> None:
+    with pytest.raises(ValueError, match="Hall of fame size must be greater than 0"):
+        HallOfFame(size=0, genome_length=4)
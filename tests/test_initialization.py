@@ -0,0 +1,157 @@
+"""Tests for heuristic construction of initial individuals."""
+
+from collections.abc import Callable
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from src.classes.ExperimentConfig import ExperimentConfig
+from src.classes.HallOfFame import HallOfFame
+from src.classes.PathResolver import PathResolver
+from src.classes.PopulationHandler import PopulationHandler
+from src.methods.initialization import (
+    greedy_rows,
+    load_genomes,
+    lp_rounding_rows,
+    repair_in_order,
+)
+from src.methods.lp_relaxation import efficiency_order, lp_relaxation
+
+
+def _instance() -> tuple[np.ndarray, np.ndarray, int]:
+    rng = np.random.default_rng(3)
+    values = rng.integers(1, 100, 60)
+    weights = rng.integers(1, 100, 60)
+    return values, weights, int(weights.sum() // 4)
+
+
+def test_repair_keeps_prefix_that_fits_in_order() -> None:
+    genomes = np.array([[1, 1, 1, 0], [1, 0, 1, 1]], dtype=np.uint8)
+    weights = np.array([4, 3, 2, 1])
+
+    repaired = repair_in_order(genomes, np.array([3, 2, 1, 0]), weights, capacity=5)
+
+    np.testing.assert_array_equal(repaired, [[0, 1, 1, 0], [0, 0, 1, 1]])
+
+
+def test_repair_keeps_small_items_after_an_overflowing_one() -> None:
+    genomes = np.array([[1, 1, 1, 1], [0, 1, 1, 1]], dtype=np.uint8)
+    weights = np.array([3, 5, 1, 2])
+
+    repaired = repair_in_order(genomes, np.arange(4), weights, capacity=6)
+
+    np.testing.assert_array_equal(repaired, [[1, 0, 1, 1], [0, 1, 1, 0]])
+
+
+def test_heuristic_rows_are_feasible_and_better_than_random() -> None:
+    values, weights, capacity = _instance()
+    rng = np.random.default_rng(11)
+    solution, bound = lp_relaxation(values, weights, capacity)
+    order = efficiency_order(values, weights)
+
+    greedy = greedy_rows(50, values, weights, capacity, rng)
+    rounded = lp_rounding_rows(50, solution, order, weights, capacity, rng)
+    random = (rng.random((50, 60)) < 0.25).astype(np.uint8)
+
+    for rows in (greedy, rounded):
+        assert rows.dtype == np.uint8
+        assert np.all(rows @ weights <= capacity)
+        assert np.all(rows @ values <= bound)
+        assert np.mean(rows @ values) > np.mean(random @ values)
+    assert len(np.unique(greedy, axis=0)) > 1
+    assert len(np.unique(rounded, axis=0)) > 1
+
+
+def test_population_handler_seeds_leading_rows(
+    test_only_pathresolver: PathResolver,
+    experiment_config_factory: Callable[..., ExperimentConfig],
+) -> None:
+    values, weights, capacity = _instance()
+    config = replace(
+        experiment_config_factory(
+            population_size=10,
+            generations=1,
+            max_weight=capacity,
+            selection_type="roulette",
+            crossover_type="one",
+            crossover_probability=0.5,
+            mutation_probability=0.0,
+            penalty_multiplier=0.0,
+            stream_batch=3,
+        ),
+        greedy_init_share=0.4,
+        lp_init_share=0.2,
+    )
+
+    handler = PopulationHandler(
+        config=config,
+        paths=test_only_pathresolver,
+        genome_length=60,
+        filename_constant=test_only_pathresolver.filename_constant,
+        weight_sum=int(weights.sum()),
+        value_weight_array=np.stack((values, weights), axis=1),
+    )
+    population = handler.get_pop_handle()
+    assert population is not None
+
+    assert np.all(population[:6] @ weights <= capacity)
+    assert population.shape == (10, 60)
+    handler.close()
+
+
+def test_load_genomes_reads_matrices_and_hall_of_fame(tmp_path) -> None:
+    genomes = (np.random.default_rng(0).random((5, 11)) < 0.5).astype(np.uint8)
+    np.save(tmp_path / "population.npy", genomes)
+    hall = HallOfFame(size=5, genome_length=11)
+    hall.update(genomes, np.stack((np.arange(5), np.zeros(5, int)), axis=1))
+    hall.save(tmp_path / "hall.npy")
+
+    np.testing.assert_array_equal(
+        load_genomes(tmp_path / "population.npy", 11), genomes
+    )
+    np.testing.assert_array_equal(
+        load_genomes(tmp_path / "hall.npy", 11), genomes[::-1]
+    )
+    with pytest.raises(ValueError, match="expected 12 genes"):
+        load_genomes(tmp_path / "population.npy", 12)
+
+
+def test_population_handler_warm_starts_from_repaired_genomes(
+    test_only_pathresolver: PathResolver,
+    experiment_config_factory: Callable[..., ExperimentConfig],
+) -> None:
+    values, weights, capacity = _instance()
+    previous = np.ones((4, 60), dtype=np.uint8)
+    previous[0] = 0
+    config = experiment_config_factory(
+        population_size=10,
+        generations=1,
+        max_weight=capacity,
+        selection_type="roulette",
+        crossover_type="one",
+        crossover_probability=0.5,
+        mutation_probability=0.0,
+        penalty_multiplier=0.0,
+        stream_batch=3,
+    )
+    columns = np.arange(0, 60, 2)
+
+    handler = PopulationHandler(
+        config=config,
+        paths=test_only_pathresolver,
+        genome_length=30,
+        filename_constant=test_only_pathresolver.filename_constant,
+        weight_sum=int(weights[columns].sum()),
+        value_weight_array=np.stack((values, weights), axis=1)[columns],
+        initial_genomes=previous,
+        genome_columns=columns,
+    )
+    population = handler.get_pop_handle()
+    assert population is not None
+
+    order = efficiency_order(values[columns], weights[columns])
+    expected = repair_in_order(previous[:, columns], order, weights[columns], capacity)
+    np.testing.assert_array_equal(population[:4], expected)
+    assert np.all(population[:4] @ weights[columns] <= capacity)
+    assert population[1].any()
+    handler.close()
@@ -0,0 +1,133 @@
+"""Tests for the island model and its migration helpers."""
+
+import csv
+
+import numpy as np
+import pytest
+import src.classes.IslandRunner as island_runner
+from src.classes.IslandRunner import IslandRunner
+from src.methods.migration import migrate, migration_rows, migration_sources
+
+ITEMS = [(10, 5), (8, 4), (3, 3), (7, 6), (2, 1), (9, 7), (4, 4), (6, 2)]
+
+
+@pytest.fixture
+def base_config(dataset_factory) -> dict:
+    dataset_factory("f_islands", ITEMS)
+    return {
+        "data_filename": "f_islands",
+        "population_size": 8,
+        "generations": 7,
+        "max_weight": 15,
+        "seed": 3,
+        "selection_type": "tournament",
+        "crossover_type": "one",
+        "crossover_probability": 0.8,
+        "mutation_probability": 0.1,
+        "penalty": 0.0,
+        "experiment_identifier": 11,
+        "log_level": "WARNING",
+    }
+
+
+def test_ring_topology_receives_from_previous_island() -> None:
+    sources = migration_sources("ring", 4, np.random.default_rng(0))
+    assert sources.tolist() == [3, 0, 1, 2]
+
+
+def test_random_topology_never_picks_itself_and_agrees_across_islands() -> None:
+    first = np.random.default_rng(5)
+    second = np.random.default_rng(5)
+    for _ in range(20):
+        sources = migration_sources("random", 5, first)
+        assert np.all(sources != np.arange(5))
+        assert np.array_equal(sources, migration_sources("random", 5, second))
+
+
+def test_migration_copies_best_rows_over_worst_rows() -> None:
+    populations = [np.zeros((4, 3), dtype=np.uint8), np.eye(4, 3, dtype=np.uint8)]
+    fitness = np.array(
+        [
+            [[1, 0], [5, 0], [0, 2], [3, 0]],
+            [[7, 1], [2, 0], [9, 4], [0, 0]],
+        ]
+    )
+    best, _ = migration_rows(fitness[1], 2)
+    _, worst = migration_rows(fitness[0], 2)
+    assert best.tolist() == [2, 0]
+    assert sorted(worst.tolist()) == [0, 2]
+
+    migrate(populations, fitness, island=0, source=1, emigrants=best, replaced=worst)
+
+    assert np.array_equal(populations[0][worst], populations[1][best])
+    assert np.array_equal(fitness[0, worst], fitness[1, best])
+    assert np.array_equal(populations[0][[1, 3]], np.zeros((2, 3)))
+
+
+@pytest.mark.parametrize("topology", ["ring", "random"])
+def test_island_runner_writes_a_table_per_island(base_config, topology) -> None:
+    runner = IslandRunner(
+        base_config, islands=3, migration_interval=2, migrants=2, topology=topology
+    )
+    stats = runner.evolve()
+
+    assert stats.iteration == 7
+    assert 0 < stats.best_fitness <= 29
+    assert stats.best_weight <= 15
+    assert 0 <= stats.best_idx < 24
+    assert len(stats.genome) == len(ITEMS)
+    output = runner.paths.get_output_path()
+    for island in range(1, 4):
+        path = output / f"{runner.paths.filename_constant}_island{island}.csv"
+        with open(path, newline="") as f:
+            lines = list(csv.reader(f))
+        rows = [row for row in lines if row and row[0].isdigit()]
+        assert [int(row[0]) for row in rows] == list(range(8))
+        assert [int(row[-1]) for row in rows] == [0, 0, 2, 0, 2, 0, 2, 0]
+        assert ["# evaluations", "64"] in lines
+
+
+def test_island_runner_is_reproducible(base_config) -> None:
+    first = IslandRunner(base_config, islands=2, migration_interval=3).evolve()
+    second = IslandRunner(base_config, islands=2, migration_interval=3).evolve()
+    assert first == second
+
+
+def test_island_runner_rejects_invalid_migration(base_config) -> None:
+    with pytest.raises(ValueError):
+        IslandRunner(base_config, islands=1)
+    with pytest.raises(ValueError):
+        IslandRunner(base_config, islands=2, migration_interval=0)
+    with pytest.raises(ValueError):
+        IslandRunner(base_config, islands=2, migrants=5)
+    with pytest.raises(ValueError):
+        IslandRunner(base_config, islands=2, topology="star")
+
+
+def test_islands_log_every_generation_to_the_run_log(base_config) -> None:
+    runner = IslandRunner(
+        {**base_config, "log_level": "INFO"}, islands=2, migration_interval=3
+    )
+    runner.evolve()
+
+    log_path = runner.paths.get_logging_path() / "runtime_experiment_11.log"
+    lines = log_path.read_text().splitlines()
+    for island in (1, 2):
+        logged = [line for line in lines if f"Island {island} generation" in line]
+        assert len(logged) == 8
+        assert all("[experiment number 11]" in line for line in logged)
+        assert sum("immigrants 1" in line for line in logged) == 2
+
+
+def test_failed_island_stops_the_others(base_config, monkeypatch) -> None:
+    evolve_island = island_runner._evolve_island
+
+    def broken_evolve_island(island, *args) -> None:
+        if island == 1:
+            raise RuntimeError("lost island")
+        evolve_island(island, *args)
+
+    monkeypatch.setattr(island_runner, "_evolve_island", broken_evolve_island)
+    runner = IslandRunner(base_config, islands=3, migration_interval=2)
+    with pytest.raises(RuntimeError, match="Island 2 failed"):
+        runner.evolve()
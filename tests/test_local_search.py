@@ -0,0 +1,55 @@
+"""Tests for vectorized hill climbing of knapsack genomes."""
+
+import numpy as np
+from src.methods.fitness_score import apply_penalty
+from src.methods.local_search import hill_climb
+
+
+def test_swap_move_escapes_one_flip_local_optimum() -> None:
+    values = np.array([5, 6, 1])
+    weights = np.array([10, 10, 1])
+    genomes = np.array([[1, 0, 0]], dtype=np.uint8)
+
+    improved, fitness, steps = hill_climb(
+        genomes, values, weights, max_weight=10, penalty_factor=0, max_steps=1
+    )
+
+    np.testing.assert_array_equal(improved, [[0, 1, 0]])
+    np.testing.assert_array_equal(fitness, [[6, 10]])
+    assert steps == 1
+
+
+def test_hill_climb_never_worsens_and_reports_consistent_fitness() -> None:
+    rng = np.random.default_rng(7)
+    values = rng.integers(1, 100, 40)
+    weights = rng.integers(1, 100, 40)
+    max_weight = int(weights.sum() // 3)
+    genomes = (rng.random((12, 40)) < 0.5).astype(np.uint8)
+
+    for penalty in (0.0, 1.5):
+        before = apply_penalty(
+            genomes @ values, genomes @ weights, max_weight, penalty
+        ).astype(np.int64)
+        improved, fitness, _ = hill_climb(
+            genomes, values, weights, max_weight, penalty, max_steps=100
+        )
+        after = apply_penalty(
+            improved @ values, improved @ weights, max_weight, penalty
+        ).astype(np.int64)
+        np.testing.assert_array_equal(fitness[:, 0], after)
+        np.testing.assert_array_equal(fitness[:, 1], improved @ weights)
+        assert np.all(after >= before)
+
+
+def test_overweight_genomes_are_repaired_under_zero_penalty() -> None:
+    values = np.array([4, 3, 2, 1])
+    weights = np.array([4, 3, 2, 1])
+    genomes = np.ones((1, 4), dtype=np.uint8)
+
+    improved, fitness, _ = hill_climb(
+        genomes, values, weights, max_weight=5, penalty_factor=0, max_steps=10
+    )
+
+    assert fitness[0, 1] <= 5
+    assert fitness[0, 0] == 5
+    assert improved.sum() >= 1
@@ -0,0 +1,99 @@
+"""Tests for freezing converged loci and thawing spread ones."""
+
+import numpy as np
+from src.classes.LocusFreezer import MIN_WORKING_LOCI, LocusFreezer
+from src.classes.ProblemReduction import ProblemReduction
+
+ITEMS = np.array([[10, 5], [8, 4], [3, 3], [7, 6], [6, 2], [1, 9]])
+
+
+def test_freeze_moves_fixed_loci_into_offsets() -> None:
+    freezer = LocusFreezer(ITEMS)
+
+    frozen = freezer.freeze(np.array([1.0, 0.5, 0.0, 0.25, 1.0, 0.5]))
+
+    assert frozen == 3
+    np.testing.assert_array_equal(freezer.reduction.free, [1, 3, 5])
+    np.testing.assert_array_equal(freezer.frozen, [0, 2, 4])
+    assert freezer.reduction.value_offset == 16
+    assert freezer.reduction.weight_offset == 7
+    genome = np.array([1, 0, 1], dtype=np.uint8)
+    np.testing.assert_array_equal(freezer.reduction.expand(genome), [1, 1, 0, 0, 1, 1])
+
+
+def test_freeze_keeps_minimum_working_loci_and_base_reduction() -> None:
+    base = ProblemReduction(
+        genome_length=6,
+        free=np.array([0, 1, 2, 3, 4]),
+        fixed_one=np.array([], dtype=np.int64),
+        fixed_zero=np.array([5]),
+        value_offset=0,
+        weight_offset=0,
+    )
+    freezer = LocusFreezer(ITEMS, base)
+
+    assert freezer.freeze(np.zeros(5)) == 5 - MIN_WORKING_LOCI
+    assert len(freezer.reduction.free) == MIN_WORKING_LOCI
+    np.testing.assert_array_equal(freezer.reduction.fixed_zero, [0, 1, 5])
+
+    freezer.thaw(np.array([1]))
+    np.testing.assert_array_equal(freezer.reduction.free, [1, 2, 3, 4])
+    np.testing.assert_array_equal(freezer.frozen, [0])
+
+
+def test_sparse_flips_match_per_gene_mutation_rate() -> None:
+    freezer = LocusFreezer(np.ones((200, 2), dtype=np.int64))
+    freezer.freeze(np.r_[np.ones(100), np.full(100, 0.5)])
+    rng = np.random.default_rng(5)
+
+    rows, loci = freezer.sample_flips(1000, 0.01, rng)
+
+    assert np.isin(loci, freezer.frozen).all()
+    assert len(set(zip(rows.tolist(), loci.tolist()))) == len(rows)
+    assert abs(len(rows) - 1000) < 120
+
+
+def test_state_round_trip() -> None:
+    freezer = LocusFreezer(ITEMS)
+    freezer.freeze(np.array([1.0, 0.5, 0.0, 0.25, 1.0, 0.5]))
+    restored = LocusFreezer(ITEMS)
+
+    restored.load_state(freezer.state())
+
+    assert restored.reduction.value_offset == freezer.reduction.value_offset
+    np.testing.assert_array_equal(restored.reduction.free, freezer.reduction.free)
+
+
+def test_exception_cells_follow_parents_and_correct_fitness() -> None:
+    freezer = LocusFreezer(ITEMS)
+    freezer.freeze(np.array([1.0, 0.5, 0.0, 0.25, 1.0, 0.5]))
+    freezer.exceptions = np.array([0 * 6 + 0, 1 * 6 + 2, 1 * 6 + 4])
+
+    freezer.inherit(np.array([1, 1, 0]))
+
+    rows, loci = freezer.exception_cells()
+    assert rows.tolist() == [0, 0, 1, 1, 2]
+    assert loci.tolist() == [2, 4, 2, 4, 0]
+    corrections = freezer.corrections(4)
+    assert corrections.tolist() == [[-3, 1], [-3, 1], [-10, -5], [0, 0]]
+    genomes = np.zeros((2, 3), dtype=np.uint8)
+    np.testing.assert_array_equal(
+        freezer.expand(genomes, np.array([2, 1])),
+        [[0, 0, 0, 0, 1, 0], [1, 0, 1, 0, 0, 0]],
+    )
+
+    freezer.discard(np.array([0]))
+    assert freezer.exception_cells()[0].tolist() == [1, 1, 2]
+
+
+def test_only_spread_loci_are_thawed() -> None:
+    freezer = LocusFreezer(ITEMS, thaw_frequency=0.2)
+    freezer.freeze(np.array([1.0, 0.5, 0.0, 0.25, 1.0, 0.5]))
+    freezer.exceptions = np.array([0 * 6 + 2, 3 * 6 + 2, 5 * 6 + 4])
+
+    rows, loci = freezer.thaw_spread(8)
+
+    assert rows.tolist() == [0, 3]
+    assert loci.tolist() == [2, 2]
+    np.testing.assert_array_equal(freezer.frozen, [0, 4])
+    assert freezer.exception_cells()[1].tolist() == [4]
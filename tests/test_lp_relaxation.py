@@ -0,0 +1,26 @@
+"""Tests for the LP relaxation of the knapsack problem."""
+
+import numpy as np
+import pytest
+from src.methods.lp_relaxation import efficiency_order, lp_relaxation
+
+
+def test_efficiency_order_puts_weightless_items_first() -> None:
+    order = efficiency_order(np.array([4, 9, 1, 6]), np.array([2, 3, 0, 6]))
+    np.testing.assert_array_equal(order, [2, 1, 0, 3])
+
+
+def test_lp_relaxation_takes_critical_item_fractionally() -> None:
+    values = np.array([60, 100, 120])
+    weights = np.array([10, 20, 30])
+
+    solution, bound = lp_relaxation(values, weights, capacity=50)
+
+    np.testing.assert_allclose(solution, [1.0, 1.0, 2 / 3])
+    assert bound == pytest.approx(240.0)
+
+
+def test_lp_relaxation_with_room_for_everything() -> None:
+    solution, bound = lp_relaxation(np.array([3, 4]), np.array([1, 1]), capacity=5)
+    np.testing.assert_array_equal(solution, [1.0, 1.0])
+    assert bound == 7.0
@@ -13,7 +13,12 @@ import numpy as np
 import pytest
 import yaml
 from pydantic import ValidationError
-from src.methods.data_loader import load_data, load_yaml_config
+from src.methods.data_loader import (
+    load_capacity,
+    load_data,
+    load_optimum,
+    load_yaml_config,
+)
 from src.methods.memmap_operations import create_memmap_config_json, load_memmap
 
 
@@ -342,3 +347,71 @@ def test_load_yaml_config_missing_data_section(tmp_path: Path) -> None:
         yaml.safe_dump(yaml_content, f)
     with pytest.raises(ValidationError):
         load_yaml_config(config_path)
+
+
+def test_load_yaml_config_includes_optional_stopping_section(tmp_path: Path) -> None:
+    yaml_content = {
+        "data": {"filename": "items.csv", "max_weight": 100},
+        "population": {"size": 50, "generations": 200, "stream_batch_size": 10},
+        "selection": {"type": "tournament", "selection_pressure": 1},
+        "genetic_operators": {
+            "crossover_type": "one",
+            "crossover_probability": 0.9,
+            "mutation_probability": 0.05,
+            "penalty_multiplier": 2.0,
+        },
+        "experiment": {"seed": 42, "identifier": 1, "log_level": "INFO"},
+        "stopping": {"stop_at_optimum": True, "stagnation_window": 300},
+    }
+    config_path = tmp_path / "config.yaml"
+    with open(config_path, "w") as f:
+        yaml.safe_dump(yaml_content, f)
+
+    result = load_yaml_config(config_path)
+
+    assert result["stop_at_optimum"] is True
+    assert result["stagnation_window"] == 300
+    assert result["diversity_floor"] is None
+
+
+def test_load_yaml_config_includes_parameterless_section(tmp_path: Path) -> None:
+    yaml_content = {
+        "data": {"filename": "items.csv", "max_weight": 100},
+        "population": {"size": 50, "generations": 200, "stream_batch_size": 10},
+        "selection": {"type": "tournament", "selection_pressure": 1},
+        "genetic_operators": {
+            "crossover_type": "one",
+            "crossover_probability": 0.9,
+            "mutation_probability": 0.05,
+            "penalty_multiplier": 2.0,
+        },
+        "experiment": {"seed": 42, "identifier": 1, "log_level": "INFO"},
+        "parameterless": {"counter_base": 2},
+    }
+    config_path = tmp_path / "config.yaml"
+    with open(config_path, "w") as f:
+        yaml.safe_dump(yaml_content, f)
+
+    result = load_yaml_config(config_path)
+
+    assert result["counter_base"] == 2
+    assert result["max_populations"] == 12
+
+
+def test_load_optimum_reads_first_token(tmp_path: Path) -> None:
+    optimum = tmp_path / "optimum"
+    optimum.write_text("481.0694\n")
+    assert load_optimum(optimum) == 481.0694
+    optimum.write_text("")
+    with pytest.raises(ValueError, match="File is empty"):
+        load_optimum(optimum)
+
+
+def test_load_capacity_reads_header_line(root_path: Path, tmp_path: Path) -> None:
+    large_scale = root_path / "dane AG 2" / "large_scale"
+    assert load_capacity(large_scale / "knapPI_1_100_1000_1") == 995
+    assert load_capacity(large_scale / "knapPI_1_10000_1000_1") == 49877
+    instance = tmp_path / "instance"
+    instance.write_text("3 7\n1 2\n3 4\n")
+    with pytest.raises(ValueError, match="header line"):
+        load_capacity(instance)
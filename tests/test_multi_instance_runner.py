@@ -0,0 +1,51 @@
+"""Tests for running one configuration over many instances at once."""
+
+import pytest
+from src.classes.MultiInstanceRunner import MultiInstanceRunner, group_by_genome_length
+
+
+@pytest.fixture
+def multi_config(dataset_factory, run_config_factory, tmp_path) -> dict:
+    dataset_factory("f_a_kp_4_9", [(10, 5), (8, 4), (3, 3), (4, 2)])
+    small = dataset_factory("f_b_kp_5_12", [(i, i) for i in range(1, 6)]).parent
+    (small / ".DS_Store").write_text("")
+    large = tmp_path / "dane AG 2" / "large_scale"
+    large.mkdir(parents=True, exist_ok=True)
+    items = "\n".join(f"{i} {i}" for i in range(1, 11))
+    (large / "knap_c").write_text(f"10 30\n{items}")
+    return run_config_factory("f_a_kp_4_9")
+
+
+def test_group_by_genome_length_respects_padding_ratio() -> None:
+    assert group_by_genome_length([10, 4, 5, 100, 12], 1.25) == [[1, 2], [0, 4], [3]]
+    assert group_by_genome_length([4, 4, 5], 1.0) == [[0, 1], [2]]
+
+
+def test_multi_instance_runner_keeps_padding_empty(multi_config) -> None:
+    runner = MultiInstanceRunner(multi_config, max_padding=2.0)
+    assert runner.instances == ["f_a_kp_4_9", "f_b_kp_5_12", "knap_c"]
+    assert [c.max_weight for c in runner.instance_configs] == [9, 12, 30]
+    assert runner.groups == [[0, 1], [2]]
+
+    runner.evolve()
+
+    padded_group = runner.engines[0]
+    assert padded_group.population.shape[2] == 5
+    assert not padded_group.population[0, :, 4].any()
+    results = runner.results()
+    assert len(results["f_a_kp_4_9"][2]) == 4
+    assert results["f_b_kp_5_12"][1] <= 12
+    tables = sorted(runner.paths.get_output_path().glob("*.csv"))
+    assert len(tables) == 3
+
+
+def test_multi_instance_runner_rejects_instance_without_capacity(
+    multi_config, tmp_path
+) -> None:
+    knap_c = tmp_path / "dane AG 2" / "large_scale" / "knap_c"
+    knap_c.write_text("\n".join(f"{i} {i}" for i in range(1, 11)))
+    with pytest.raises(ValueError, match="No capacity for instance knap_c"):
+        MultiInstanceRunner(multi_config)
+
+    runner = MultiInstanceRunner(multi_config, capacities={"knap_c": 25})
+    assert runner.instance_configs[2].max_weight == 25
@@ -0,0 +1,75 @@
+"""Tests for the parameter-less population race."""
+
+import pytest
+from src.classes.ParameterlessRunner import ParameterlessRunner
+
+
+@pytest.fixture
+def race_config(dataset_factory, run_config_factory) -> dict:
+    dataset_factory(
+        "f_race", [(10, 5), (8, 4), (3, 3), (7, 6), (2, 1), (9, 7), (4, 4), (6, 2)]
+    )
+    return run_config_factory(
+        "f_race",
+        population_size=4,
+        generations=1000,
+        seed=11,
+        evaluation_budget=3000,
+    )
+
+
+def test_race_interleaves_doubling_populations(race_config) -> None:
+    runner = ParameterlessRunner(race_config, counter_base=2)
+    winner = runner.evolve()
+
+    sizes = [population.size for population in runner.populations]
+    assert sizes == [4 * 2**index for index in range(len(sizes))]
+    assert len(sizes) > 2
+    assert runner.evaluations <= 3000
+    assert winner.best_fitness == max(p.best_fitness for p in runner.populations)
+    assert winner in runner.populations
+    generations = [p.engine.iteration for p in runner.populations]
+    assert generations[0] >= generations[1] >= generations[-1]
+    assert {p.status for p in runner.populations[:-1]} <= {
+        "active",
+        "overtaken",
+        "converged",
+        "superseded",
+    }
+    tables = sorted(runner.paths.get_output_path().glob("*.csv"))
+    assert len(tables) == len(sizes)
+    assert (
+        "# winner,True"
+        in (
+            runner.paths.get_output_path()
+            / f"{runner.paths.filename_constant}_pop{winner.size}.csv"
+        ).read_text()
+    )
+
+
+def test_race_requires_an_evaluation_budget(race_config) -> None:
+    with pytest.raises(ValueError, match="requires an evaluation budget"):
+        ParameterlessRunner({**race_config, "evaluation_budget": None})
+    with pytest.raises(ValueError, match="cover the first population"):
+        ParameterlessRunner({**race_config, "evaluation_budget": 2})
+    with pytest.raises(ValueError, match="not supported by stacked evolution"):
+        ParameterlessRunner({**race_config, "selection_type": "pareto"})
+
+
+def test_race_settings_come_from_the_config(race_config) -> None:
+    runner = ParameterlessRunner(
+        {**race_config, "counter_base": 3, "max_populations": 2}
+    )
+    assert (runner.counter_base, runner.max_populations) == (3, 2)
+    assert ParameterlessRunner(race_config, counter_base=5).counter_base == 5
+
+
+def test_converged_population_supersedes_smaller_ones(race_config) -> None:
+    runner = ParameterlessRunner(race_config)
+    runner._spawn()
+    smaller, larger = runner.populations
+    larger.status = "converged"
+
+    runner._eliminate(larger)
+
+    assert smaller.status == "superseded"
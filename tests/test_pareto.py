@@ -0,0 +1,80 @@
+"""Tests for bi-objective ranking and the Pareto front export."""
+
+import numpy as np
+from src.classes.ParetoFrontRecorder import ParetoFrontRecorder
+from src.classes.PathResolver import PathResolver
+from src.methods.pareto import crowding_distance, non_dominated_ranks, pareto_front
+
+
+def _reference_ranks(fitness: np.ndarray) -> np.ndarray:
+    """Quadratic peeling of fronts used as a reference."""
+    ranks = np.full(len(fitness), -1)
+    rank = 0
+    while np.any(ranks < 0):
+        left = np.flatnonzero(ranks < 0)
+        for row in left:
+            others = fitness[left]
+            dominated = np.any(
+                (others[:, 0] >= fitness[row, 0])
+                & (others[:, 1] <= fitness[row, 1])
+                & np.any(others != fitness[row], axis=1)
+            )
+            if not dominated:
+                ranks[row] = rank
+        rank += 1
+    return ranks
+
+
+def test_ranks_match_quadratic_reference() -> None:
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        fitness = rng.integers(0, 15, size=(60, 2))
+        np.testing.assert_array_equal(
+            non_dominated_ranks(fitness), _reference_ranks(fitness)
+        )
+
+
+def test_crowding_distance_marks_boundaries_and_normalizes_gaps() -> None:
+    fitness = np.array([[10, 10], [6, 4], [8, 7], [0, 0], [5, 9]])
+    ranks = non_dominated_ranks(fitness)
+    np.testing.assert_array_equal(ranks, [0, 0, 0, 0, 1])
+
+    distance = crowding_distance(fitness, ranks)
+
+    assert np.isinf(distance[[0, 3, 4]]).all()
+    np.testing.assert_allclose(distance[1], (8 - 0) / 10 + (7 - 0) / 10)
+    np.testing.assert_allclose(distance[2], (10 - 6) / 10 + (10 - 4) / 10)
+
+
+def test_front_lists_each_point_once_best_first() -> None:
+    fitness = np.array([[4, 2], [9, 8], [4, 2], [3, 5], [9, 8]])
+
+    rows = pareto_front(fitness, non_dominated_ranks(fitness))
+
+    np.testing.assert_array_equal(fitness[rows], [[9, 8], [4, 2]])
+
+
+def test_recorder_round_trip_and_resume(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PathResolver, "PROJECT_ROOT", tmp_path)
+    paths = PathResolver()
+    paths.initialize(filename_constant="pareto_run")
+    genomes = np.eye(3, 11, dtype=np.uint8)
+    recorder = ParetoFrontRecorder(paths, genome_length=11)
+    recorder.open()
+    for iteration in range(3):
+        fitness = np.array([[10 + iteration, 5], [4, 1]][: iteration + 1])
+        recorder.record(iteration, fitness, genomes[: len(fitness)])
+    recorder.close()
+
+    recorder.open(resume_iteration=1)
+    recorder.record(2, np.array([[7, 3]]), genomes[2:])
+    recorder.close()
+
+    header, fronts = ParetoFrontRecorder.load(recorder.path)
+    assert header["genome_length"] == 11
+    assert sorted(fronts) == [0, 1, 2]
+    np.testing.assert_array_equal(fronts[1]["fitness"], [11, 4])
+    np.testing.assert_array_equal(fronts[2]["weight"], [3])
+    np.testing.assert_array_equal(
+        np.unpackbits(fronts[1]["genome"], axis=1, count=11), genomes[:2]
+    )
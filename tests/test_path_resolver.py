@@ -131,3 +131,33 @@ def test_get_optimum_path_invalid_prefix_raises(
     test_only_pathresolver.filename_constant = "invalid"
     with pytest.raises(Exception, match="Invalid file name"):
         test_only_pathresolver.get_optimum_path()
+
+
+def test_reserve_run_never_hands_out_a_claimed_name(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PathResolver, "PROJECT_ROOT", tmp_path)
+    paths = PathResolver()
+    names = [paths.reserve_run("run-T0405") for _ in range(3)]
+    assert names == ["run-T0405", "run-T0405-2", "run-T0405-3"]
+    assert all((tmp_path / "run_output" / name).is_dir() for name in names)
+
+
+def test_get_project_path_resolves_relative_paths_against_the_root(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(PathResolver, "PROJECT_ROOT", tmp_path)
+    paths = PathResolver()
+    assert paths.get_project_path("run_output/a.npy") == tmp_path / "run_output/a.npy"
+    assert paths.get_project_path(tmp_path / "b.npy") == tmp_path / "b.npy"
+
+
+def test_initialize_claims_a_separate_directory_for_every_run(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(PathResolver, "PROJECT_ROOT", tmp_path)
+    first, second, reused = PathResolver(), PathResolver(), PathResolver()
+    first.initialize("run-T0405")
+    second.initialize("run-T0405")
+    reused.initialize("run-T0405", reserve=False)
+    assert first.filename_constant == "run-T0405"
+    assert second.filename_constant == "run-T0405-2"
+    assert reused.get_output_path() == first.get_output_path()
@@ -45,3 +45,38 @@ def test_correct_population_creation(
     population_manager.open_pop()
     population_manager.open_pop()
     assert population_manager.get_pop_handle() is not None
+
+
+def test_remap_rewrites_population_with_new_genome_length(
+    test_only_pathresolver: PathResolver,
+    experiment_config_factory: Callable[..., ExperimentConfig],
+):
+    config = experiment_config_factory(
+        population_size=6,
+        generations=2,
+        max_weight=10,
+        selection_type="roulette",
+        crossover_type="one",
+        crossover_probability=0.5,
+        mutation_probability=0.0,
+        penalty_multiplier=1.0,
+    )
+    population_manager = PopulationHandler(
+        config=config,
+        paths=test_only_pathresolver,
+        genome_length=10,
+        filename_constant=test_only_pathresolver.filename_constant,
+        weight_sum=100,
+    )
+    pop_handle = population_manager.get_pop_handle()
+    assert pop_handle is not None
+    expected = pop_handle[:, ::2] ^ 1
+
+    population_manager.remap(5, lambda genomes, start: genomes[:, ::2] ^ 1)
+
+    assert population_manager.genome_length == 5
+    assert population_manager.get_pop_config()["genome_length"] == 5
+    assert_array_equal(population_manager.get_pop_handle(), expected)
+    population_manager.close()
+    population_manager.open_pop()
+    assert_array_equal(population_manager.get_pop_handle(), expected)
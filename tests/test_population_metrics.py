@@ -0,0 +1,75 @@
+"""Tests for streamed population metrics."""
+
+import numpy as np
+import pytest
+from src.methods.population_metrics import (
+    allele_frequencies,
+    duplicate_rows,
+    genotype_diversity,
+    row_hashes,
+)
+
+
+def test_allele_frequencies_are_batch_independent() -> None:
+    population = np.array([[1, 0, 1], [1, 1, 0], [1, 0, 0], [1, 1, 1]], np.uint8)
+
+    small = allele_frequencies(population, batch=1)
+    large = allele_frequencies(population, batch=10)
+
+    np.testing.assert_array_equal(small, [1.0, 0.5, 0.5])
+    np.testing.assert_array_equal(small, large)
+
+
+def test_genotype_diversity_bounds() -> None:
+    assert genotype_diversity(np.array([0.0, 1.0])) == 0.0
+    assert genotype_diversity(np.array([0.5, 0.5])) == 1.0
+    assert genotype_diversity(np.array([1.0, 0.5])) == pytest.approx(0.5)
+
+
+def test_duplicate_rows_point_to_first_copy() -> None:
+    population = np.array(
+        [[1, 0, 1], [0, 0, 0], [1, 0, 1], [0, 0, 0], [1, 0, 1], [1, 1, 1]], np.uint8
+    )
+
+    for batch in (1, 2, 10):
+        duplicates, originals = duplicate_rows(population, batch)
+        np.testing.assert_array_equal(duplicates, [2, 3, 4])
+        np.testing.assert_array_equal(originals, [0, 1, 0])
+
+
+def test_hash_collisions_are_not_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    population = np.array([[1, 0], [0, 1], [1, 0]], np.uint8)
+    monkeypatch.setattr(
+        "src.methods.population_metrics.row_hashes",
+        lambda population, batch: np.zeros(len(population), dtype=np.uint64),
+    )
+
+    duplicates, originals = duplicate_rows(population, batch=2)
+
+    np.testing.assert_array_equal(duplicates, [2])
+    np.testing.assert_array_equal(originals, [0])
+
+
+def test_repeats_within_a_hash_collision_are_found(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    population = np.array([[1, 0], [0, 1], [0, 1], [1, 1], [0, 1]], np.uint8)
+    monkeypatch.setattr(
+        "src.methods.population_metrics.row_hashes",
+        lambda population, batch: np.array([7, 7, 7, 3, 7], dtype=np.uint64),
+    )
+
+    duplicates, originals = duplicate_rows(population, batch=2)
+
+    np.testing.assert_array_equal(duplicates, [2, 4])
+    np.testing.assert_array_equal(originals, [1, 1])
+
+
+def test_row_hashes_cover_genomes_longer_than_one_word() -> None:
+    population = np.zeros((2, 130), np.uint8)
+    population[1, 129] = 1
+
+    hashes = row_hashes(population, batch=1)
+
+    assert hashes.dtype == np.uint64
+    assert hashes[0] != hashes[1]
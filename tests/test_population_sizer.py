@@ -0,0 +1,94 @@
+"""Tests for adaptive population sizing."""
+
+import csv
+from dataclasses import replace
+
+import pytest
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.GenerationStats import GenerationStats
+from src.classes.PopulationSizer import PopulationSizer
+
+
+def _stats(identical: int) -> GenerationStats:
+    return GenerationStats(
+        iteration=1,
+        best_idx=0,
+        best_fitness=10,
+        best_weight=5,
+        avg_fitness=5.0,
+        worst_fitness=0,
+        worst_weight=0,
+        identical_best_count=identical,
+        genome="1",
+    )
+
+
+def test_sizer_shrinks_converged_and_grows_stalled(experiment_config_factory) -> None:
+    sizer = PopulationSizer(
+        experiment_config_factory(
+            population_size=16,
+            adaptive_population=True,
+            min_population_size=6,
+            max_population_size=32,
+            growth_window=3,
+        )
+    )
+
+    assert sizer.next_size(16, _stats(identical=3), 0) == 16
+    assert sizer.next_size(16, _stats(identical=7), 1) == 12
+    assert sizer.next_size(8, _stats(identical=7), 2) == 6
+    assert sizer.next_size(6, _stats(identical=5), 2) == 6
+    assert sizer.next_size(6, _stats(identical=5), 3) == 12
+    assert sizer.next_size(24, _stats(identical=0), 6) == 32
+
+
+def test_sizer_disabled_and_bounds_validation(experiment_config_factory) -> None:
+    config = experiment_config_factory(population_size=16)
+    assert PopulationSizer(config).next_size(16, _stats(identical=15), 20) == 16
+
+    adaptive = replace(config, adaptive_population=True)
+    assert (adaptive.min_population_size, adaptive.max_population_size) == (4, 16)
+    with pytest.raises(ValueError, match="adaptive bounds"):
+        replace(config, adaptive_population=True, max_population_size=8)
+    with pytest.raises(ValueError, match="at least 6"):
+        replace(
+            config,
+            adaptive_population=True,
+            selection_type="tournament",
+            min_population_size=4,
+        )
+
+
+def test_runner_resizes_population_without_restarting(
+    dataset_factory, run_config_factory
+) -> None:
+    dataset_factory("f_dummy.txt", [(10, 5), (8, 4), (3, 3)])
+
+    runner = EvolutionRunner(
+        run_config_factory(
+            "f_dummy.txt",
+            population_size=16,
+            generations=12,
+            mutation_probability=0.0,
+            adaptive_population=True,
+            min_population_size=6,
+            growth_window=4,
+            convergence_threshold=0.3,
+        ),
+        report=False,
+    )
+    with runner:
+        sizes = [stats.population_size for stats in runner.steps()]
+        population = runner.population_manager.get_pop_handle()
+        assert population is not None
+        assert population.shape == (sizes[-1], 3)
+        assert runner.fitness.shape == (sizes[-1], 2)
+
+    assert min(sizes) == 6
+    assert any(later > earlier for earlier, later in zip(sizes, sizes[1:]))
+    assert runner.evaluations == 16 + sum(sizes)
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    with open(csv_path, newline="") as f:
+        rows = [row for row in csv.reader(f) if row and not row[0].startswith("#")]
+    assert rows[0][-1] == "population_size"
+    assert [int(row[-1]) for row in rows[2:]] == sizes
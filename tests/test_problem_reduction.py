@@ -0,0 +1,54 @@
+"""Tests for fixing knapsack items before evolution."""
+
+import itertools
+
+import numpy as np
+from src.methods.problem_reduction import greedy_lower_bound, reduce_problem
+
+
+def _optimum(values: np.ndarray, weights: np.ndarray, capacity: int) -> int:
+    genomes = np.array(list(itertools.product((0, 1), repeat=len(values))))
+    feasible = genomes @ weights <= capacity
+    return int((genomes @ values)[feasible].max())
+
+
+def test_reduction_preserves_the_optimum() -> None:
+    rng = np.random.default_rng(0)
+    fixed = 0
+    for _ in range(100):
+        values = rng.integers(1, 30, 10)
+        weights = rng.integers(1, 30, 10)
+        capacity = int(weights.sum() // 2)
+        reduction = reduce_problem(values, weights, capacity)
+        free = reduction.free
+
+        reduced = _optimum(
+            values[free], weights[free], reduction.free_capacity(capacity)
+        )
+
+        assert reduced + reduction.value_offset == _optimum(values, weights, capacity)
+        fixed += len(values) - len(free)
+    assert fixed > 0
+
+
+def test_dominance_rules_and_expansion() -> None:
+    values = np.array([5, 4, 3, 9])
+    weights = np.array([0, 3, 3, 20])
+
+    reduction = reduce_problem(values, weights, capacity=4)
+
+    assert 0 in reduction.fixed_one
+    assert 3 in reduction.fixed_zero
+    assert len(reduction.free) >= 1
+    genome = np.zeros(len(reduction.free), dtype=np.uint8)
+    full = reduction.expand(genome)
+    assert full.shape == (4,)
+    assert full[0] == 1 and full[3] == 0
+    assert reduction.expand(np.ones((2, len(reduction.free)), np.uint8)).shape == (2, 4)
+
+
+def test_greedy_lower_bound_skips_items_that_do_not_fit() -> None:
+    values = np.array([10, 9, 2])
+    weights = np.array([5, 6, 1])
+
+    assert greedy_lower_bound(values, weights, capacity=6) == 12
@@ -0,0 +1,101 @@
+"""Tests for the random-key decoder, its operators and runner."""
+
+import csv
+import itertools
+
+import numpy as np
+import pytest
+from src.classes.RandomKeyRunner import RandomKeyRunner
+from src.methods.random_keys import decode_keys, key_crossover, key_mutation
+
+ITEMS = [(10, 5), (8, 4), (3, 3), (7, 6), (2, 1), (9, 7), (4, 4), (6, 2)]
+
+
+def _greedy(keys: np.ndarray, weights: np.ndarray, capacity: int) -> np.ndarray:
+    genome = np.zeros(len(keys), dtype=np.uint8)
+    for item in np.argsort(-keys, kind="stable"):
+        if weights[item] <= capacity:
+            genome[item] = 1
+            capacity -= weights[item]
+    return genome
+
+
+def test_decoder_matches_first_fit_greedy() -> None:
+    rng = np.random.default_rng(3)
+    weights = rng.integers(0, 30, size=40)
+    keys = rng.random((200, 40), dtype=np.float32)
+    genomes = decode_keys(keys, weights, 100)
+    expected = np.array([_greedy(row, weights, 100) for row in keys])
+    assert np.array_equal(genomes, expected)
+    assert (genomes @ weights).max() <= 100
+
+
+def test_decoder_skips_items_that_do_not_fit() -> None:
+    keys = np.array([[0.9, 0.8, 0.7, 0.1]])
+    genomes = decode_keys(keys, np.array([6, 5, 4, 0]), 10)
+    assert genomes.tolist() == [[1, 0, 1, 1]]
+
+
+@pytest.mark.parametrize("crossover_type", ["one", "two"])
+def test_key_crossover_swaps_one_segment(crossover_type) -> None:
+    rng = np.random.default_rng(0)
+    p1 = np.zeros((50, 10), dtype=np.float32)
+    p2 = np.ones((50, 10), dtype=np.float32)
+    c1, c2 = key_crossover(p1, p2, crossover_type, 1.0, rng)
+    assert np.array_equal(c1 + c2, np.ones_like(c1))
+    assert c1.any(axis=1).all()
+    segments = (np.diff(c1, axis=1) != 0).sum(axis=1)
+    assert segments.max() == (1 if crossover_type == "one" else 2)
+    untouched, _ = key_crossover(p1, p2, crossover_type, 0.0, rng)
+    assert not untouched.any()
+
+
+def test_key_mutation_redraws_keys_at_rate() -> None:
+    keys = np.full((100, 100), 2.0, dtype=np.float32)
+    key_mutation(keys, 0.1, np.random.default_rng(1))
+    mutated = keys != 2.0
+    assert 0.08 < mutated.mean() < 0.12
+    assert ((keys[mutated] >= 0) & (keys[mutated] < 1)).all()
+
+
+@pytest.fixture
+def dummy_dataset(dataset_factory):
+    dataset_factory("f_keys", ITEMS)
+
+
+def test_runner_evolves_feasible_keys(dummy_dataset) -> None:
+    config = {
+        "data_filename": "f_keys",
+        "population_size": 20,
+        "generations": 30,
+        "max_weight": 15,
+        "seed": 5,
+        "selection_type": "tournament",
+        "crossover_type": "two",
+        "crossover_probability": 0.9,
+        "mutation_probability": 0.05,
+        "penalty": 0,
+        "experiment_identifier": 7,
+        "log_level": "INFO",
+        "stream_batch_size": 6,
+    }
+    runner = RandomKeyRunner(config)
+    stats = runner.evolve()
+
+    optimum = 0
+    for genome in itertools.product((0, 1), repeat=len(ITEMS)):
+        weight = sum(g * w for g, (_, w) in zip(genome, ITEMS))
+        if weight <= 15:
+            optimum = max(optimum, sum(g * v for g, (v, _) in zip(genome, ITEMS)))
+    assert runner.best_fitness == optimum
+    assert stats.iteration == 30
+    assert not list(runner.paths.get_output_path().parent.rglob("*.dat"))
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    with open(csv_path, newline="") as f:
+        rows = list(csv.reader(f))
+    meta = {row[0]: row[1] for row in rows if row and row[0].startswith("#")}
+    table = [row for row in rows if row and row[0].isdigit()]
+    assert meta["# representation"] == "random_keys"
+    assert meta["# evaluations"] == str(20 * 31)
+    assert len(table) == 31
+    assert all(int(row[2]) <= 15 for row in table)
@@ -0,0 +1,104 @@
+"""Tests for recorded RNG states and replaying past generations."""
+
+import numpy as np
+import pytest
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.RngStateRecorder import RECORD, pack_state, unpack_state
+from src.methods.replay import find_rng_file, replay_population
+
+
+@pytest.fixture
+def recorded_run(dataset_factory):
+    dataset_factory("f_dummy.txt", [(10, 5), (8, 4), (3, 3), (7, 6), (2, 1)])
+
+    runner = EvolutionRunner(
+        {
+            "data_filename": "f_dummy.txt",
+            "population_size": 4,
+            "generations": 6,
+            "max_weight": 12,
+            "seed": None,
+            "selection_type": "rank",
+            "crossover_type": "one",
+            "crossover_probability": 0.7,
+            "mutation_probability": 0.2,
+            "penalty": 0.5,
+            "experiment_identifier": 8,
+            "log_level": "INFO",
+            "checkpoint_interval": 4,
+            "record_rng_states": True,
+        },
+        report=False,
+    )
+    populations = {0: np.array(runner.population_manager.get_pop_handle())}
+    with runner:
+        for stats in runner.steps():
+            populations[stats.iteration] = np.array(
+                runner.population_manager.get_pop_handle()
+            )
+    return runner, populations
+
+
+def test_pack_state_round_trip() -> None:
+    state = np.random.default_rng(5).bit_generator.state
+    iteration, unpacked = unpack_state(pack_state(17, state))
+    assert iteration == 17
+    assert unpacked == state
+    assert RECORD.size == 41
+
+
+@pytest.mark.parametrize("generation", [0, 2, 4, 6])
+def test_replay_rebuilds_recorded_generations(recorded_run, generation) -> None:
+    runner, populations = recorded_run
+    run_directory = runner.paths.get_checkpoint_path().parent
+    rng_file = find_rng_file(run_directory)
+    header_size = len(rng_file.read_bytes().split(b"\n", 1)[0]) + 1
+    assert rng_file.stat().st_size == header_size + 7 * RECORD.size
+
+    population, fitness = replay_population(run_directory, generation)
+
+    np.testing.assert_array_equal(population, populations[generation])
+    assert fitness.shape == (4, 2)
+    assert not (
+        run_directory.parent / f"{run_directory.name}-replay-g{generation}"
+    ).exists()
+
+
+def test_replay_rejects_unrecorded_generation(recorded_run) -> None:
+    runner, _ = recorded_run
+    with pytest.raises(ValueError, match="was not recorded"):
+        replay_population(runner.paths.get_checkpoint_path(), 7)
+
+
+def test_replay_expands_frozen_runs_to_full_width(dataset_factory) -> None:
+    rng = np.random.default_rng(2)
+    items = np.stack((rng.integers(1, 30, 12), rng.integers(1, 20, 12)), axis=1)
+    dataset_factory("f_frozen.txt", items)
+    runner = EvolutionRunner(
+        {
+            "data_filename": "f_frozen.txt",
+            "population_size": 6,
+            "generations": 6,
+            "max_weight": 60,
+            "seed": 4,
+            "selection_type": "tournament",
+            "crossover_type": "one",
+            "crossover_probability": 0.7,
+            "mutation_probability": 0.01,
+            "penalty": 0.0,
+            "experiment_identifier": 9,
+            "log_level": "WARNING",
+            "freeze_interval": 2,
+            "record_rng_states": True,
+        },
+        report=False,
+    )
+    with runner:
+        for stats in runner.steps():
+            population = runner.full_population()
+    assert stats.working_loci < len(items)
+
+    replayed, fitness = replay_population(runner.paths.get_checkpoint_path(), 6)
+
+    np.testing.assert_array_equal(replayed, population)
+    np.testing.assert_array_equal(replayed @ items[:, 1], fitness[:, 1])
@@ -0,0 +1,42 @@
+"""Tests for stacked multi-replica execution."""
+
+import csv
+
+import pytest
+from src.classes.ReplicaRunner import ReplicaRunner
+
+
+@pytest.fixture
+def replica_config(dataset_factory, run_config_factory) -> dict:
+    dataset_factory("f_dummy.txt", [(10, 5), (8, 4), (3, 3)])
+    return run_config_factory("f_dummy.txt", generations=2)
+
+
+def test_replica_runner_writes_one_table_per_replica(replica_config) -> None:
+    runner = ReplicaRunner(
+        replica_config, replicas=3, mutation_probabilities=[0.0, 0.1, 0.2]
+    )
+    runner.evolve()
+
+    tables = sorted(runner.paths.get_output_path().glob("*_replica*.csv"))
+    assert len(tables) == 3
+    with open(tables[2], newline="") as f:
+        rows = list(csv.reader(f))
+    assert ["# mutation_probability", "0.2"] in rows
+    assert ["# replica", "2"] in rows
+    iteration_rows = [row for row in rows if row and row[0].isdigit()]
+    assert [row[0] for row in iteration_rows] == ["0", "1", "2"]
+
+
+def test_replica_runner_validates_per_replica_lists(replica_config) -> None:
+    with pytest.raises(ValueError, match="one crossover probability per replica"):
+        ReplicaRunner(replica_config, replicas=2, crossover_probabilities=[0.5])
+
+
+def test_replica_runner_rejects_pareto_before_creating_files(
+    replica_config, tmp_path
+) -> None:
+    before = sorted(tmp_path.iterdir())
+    with pytest.raises(ValueError, match="not supported by stacked evolution"):
+        ReplicaRunner({**replica_config, "selection_type": "pareto"}, replicas=2)
+    assert sorted(tmp_path.iterdir()) == before
@@ -0,0 +1,49 @@
+"""Tests for the reusable runner session."""
+
+import pytest
+from src.classes.RunnerSession import RunnerSession
+
+
+@pytest.fixture
+def session(dataset_factory):
+    dataset_factory("f_dummy.txt", [(10, 5), (8, 4), (3, 3)])
+    return RunnerSession(
+        {
+            "data_filename": "f_dummy.txt",
+            "population_size": 4,
+            "generations": 2,
+            "max_weight": 10,
+            "seed": 1,
+            "selection_type": "roulette",
+            "crossover_type": "one",
+            "crossover_probability": 0.5,
+            "mutation_probability": 0.1,
+            "penalty": 1.0,
+            "experiment_identifier": 6,
+            "log_level": "INFO",
+        }
+    )
+
+
+def test_session_reuses_instance_and_directories(session, monkeypatch) -> None:
+    def _fail(*args, **kwargs):
+        raise AssertionError("instance must not be reloaded")
+
+    monkeypatch.setattr("src.classes.EvolutionRunner.load_data", _fail)
+    monkeypatch.setattr("src.classes.PathResolver.PathResolver.initialize", _fail)
+
+    runners = session.run_many([1, 2])
+    third = session.run(seed=3, mutation_probability=0.0)
+    session.close()
+
+    assert third.config.mutation_probability == 0.0
+    assert [runner.config.seed for runner in runners] == [1, 2]
+    tables = sorted(session.paths.get_output_path().glob("*.csv"))
+    assert len(tables) == 3
+    assert all(runner.paths is session.paths for runner in runners)
+    assert not session.paths.get_temp_path().exists()
+
+
+def test_session_rejects_switching_instance(session) -> None:
+    with pytest.raises(ValueError, match="single instance"):
+        session.run(data_filename="f_other.txt")
@@ -13,6 +13,7 @@ import pytest
 from src.classes.ExperimentConfig import ExperimentConfig
 from src.methods.selection_methods import (
     linear_rank_selection,
+    pareto_selection,
     roulette_selection,
     tournament_selection,
 )
@@ -185,3 +186,24 @@ def test_tournament_selection_fails_when_population_smaller_than_tournament(
     )
     with pytest.raises(ValueError):
         tournament_selection(ARRAY_WITH_NULL_FITNESS[:4], config)
+
+
+def test_pareto_selection_prefers_non_dominated_individuals(
+    experiment_config_factory: Callable[..., ExperimentConfig],
+) -> None:
+    config = experiment_config_factory(
+        population_size=10,
+        generations=5,
+        max_weight=100,
+        selection_type="pareto",
+        crossover_type="one",
+        crossover_probability=0.8,
+        mutation_probability=0.05,
+        penalty_multiplier=10.0,
+    )
+    # Only the last individual is dominated by every other one.
+    fitness = np.vstack((CORRECT_ARRAY[:9], [[0, 2.0]]))
+    parents = pareto_selection(fitness, config)
+    assert len(parents) == config.population_size
+    assert all(0 <= p < config.population_size for p in parents)
+    assert 9 not in parents
@@ -0,0 +1,50 @@
+"""Tests for the in-process solve API."""
+
+import numpy as np
+import pytest
+from src.classes.PathResolver import PathResolver
+from src.methods.solver import STAT_FIELDS, solve
+
+VALUES = np.array([10, 8, 3, 7, 2, 9, 4])
+WEIGHTS = np.array([5, 4, 3, 6, 1, 7, 2])
+
+
+def test_solve_finds_optimum_without_touching_disk(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PathResolver, "PROJECT_ROOT", tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = solve(VALUES, WEIGHTS, 15, population_size=20, generations=30, seed=1)
+
+    assert list(tmp_path.iterdir()) == []
+    assert result.fitness == 27
+    assert result.genome @ VALUES == result.fitness
+    assert result.genome @ WEIGHTS == result.weight <= 15
+    assert set(result.stats) == {"iteration", *STAT_FIELDS}
+    assert all(len(column) == 31 for column in result.stats.values())
+    assert result.fitness == result.stats["best_fitness"].max()
+
+
+def test_solve_is_reproducible_and_saves_on_request(tmp_path) -> None:
+    first = solve(VALUES, WEIGHTS, 12, population_size=8, generations=5, seed=3)
+    second = solve(
+        VALUES,
+        WEIGHTS,
+        12,
+        population_size=8,
+        generations=5,
+        seed=3,
+        output=tmp_path / "result.npz",
+    )
+
+    np.testing.assert_array_equal(first.genome, second.genome)
+    np.testing.assert_array_equal(
+        first.stats["avg_fitness"], second.stats["avg_fitness"]
+    )
+    archive = np.load(tmp_path / "result.npz")
+    assert archive["fitness"] == second.fitness
+    np.testing.assert_array_equal(archive["best_weight"], second.stats["best_weight"])
+
+
+def test_solve_rejects_mismatched_items() -> None:
+    with pytest.raises(ValueError, match="equal length"):
+        solve(VALUES, WEIGHTS[:-1], 10)
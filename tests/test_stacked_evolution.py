@@ -0,0 +1,148 @@
+"""Tests for stacked operators and the StackedEvolution engine."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from src.classes.StackedEvolution import StackedEvolution
+from src.methods.fitness_score import fitness_calculation
+from src.methods.stacked_operators import (
+    stacked_crossover,
+    stacked_fitness,
+    stacked_generation_stats,
+    stacked_selection,
+)
+
+
+def _stack_configs(experiment_config_factory, count, **overrides):
+    kwargs = {
+        "population_size": 10,
+        "generations": 3,
+        "max_weight": 10,
+        "selection_type": "tournament",
+        "crossover_type": "two",
+        "crossover_probability": 0.8,
+        "mutation_probability": 0.1,
+        "penalty_multiplier": 1.0,
+    }
+    kwargs.update(overrides)
+    base = experiment_config_factory(**kwargs)
+    return [replace(base, rng=np.random.default_rng(seed)) for seed in range(count)]
+
+
+def test_stacked_fitness_matches_single_population_calculation() -> None:
+    rng = np.random.default_rng(0)
+    population = rng.integers(0, 2, size=(3, 6, 5), dtype=np.uint8)
+    values = rng.integers(1, 20, size=(3, 5))
+    weights = rng.integers(1, 20, size=(3, 5))
+    max_weights = np.array([10, 25, 40])
+
+    result = stacked_fitness(population, values, weights, max_weights, 2.0)
+
+    for b in range(3):
+        expected = fitness_calculation(
+            max_weight=int(max_weights[b]),
+            penalty_factor=2.0,
+            population=population[b],
+            batch=4,
+            value_arr=values[b],
+            weight_arr=weights[b],
+        )
+        np.testing.assert_array_equal(result[b], expected)
+
+
+@pytest.mark.parametrize("selection_type", ["roulette", "tournament", "rank"])
+def test_stacked_selection_returns_valid_parent_indices(selection_type) -> None:
+    rngs = [np.random.default_rng(seed) for seed in range(4)]
+    fitness = np.zeros((4, 8, 2), dtype=np.int64)
+    fitness[1:, :, 0] = np.arange(8)
+    fitness[:, :, 1] = np.arange(8)[::-1]
+
+    parents = stacked_selection(selection_type, fitness, rngs, 2.0)
+
+    assert parents.shape == (4, 8)
+    assert parents.min() >= 0 and parents.max() < 8
+
+
+def test_stacked_crossover_preserves_gene_counts_of_pairs() -> None:
+    rngs = [np.random.default_rng(seed) for seed in range(2)]
+    population = np.random.default_rng(5).integers(0, 2, (2, 6, 7), dtype=np.uint8)
+    parents = np.tile(np.arange(6), (2, 1))
+
+    children = stacked_crossover(population, parents, "one", np.ones(2), rngs)
+
+    assert children.shape == population.shape
+    np.testing.assert_array_equal(children.sum(axis=1), population.sum(axis=1))
+
+
+def test_stacked_generation_stats_reports_best_and_worst() -> None:
+    fitness = np.array([[[5, 3], [7, 4], [7, 2], [1, 1]]])
+
+    best_idx, best, best_w, avg, worst, worst_w, identical = stacked_generation_stats(
+        fitness
+    )
+
+    assert best_idx[0] == 2 and best[0] == 7 and best_w[0] == 2
+    assert worst[0] == 1 and worst_w[0] == 1
+    assert avg[0] == pytest.approx(5.0)
+    assert identical[0] == 0
+
+
+def test_stacked_evolution_is_reproducible_per_member(
+    experiment_config_factory,
+) -> None:
+    values = np.tile(np.arange(1, 9), (3, 1))
+    weights = np.tile(np.arange(8, 0, -1), (3, 1))
+
+    first = StackedEvolution(
+        _stack_configs(experiment_config_factory, 3), values, weights
+    )
+    second = StackedEvolution(
+        _stack_configs(experiment_config_factory, 3), values, weights
+    )
+    for _ in range(3):
+        first.step()
+        second.step()
+
+    assert first.iteration == 3
+    assert first.population.shape == (3, 10, 8)
+    np.testing.assert_array_equal(first.population, second.population)
+    assert not np.array_equal(first.population[0], first.population[1])
+
+
+def test_stacked_evolution_breeds_into_given_buffer(experiment_config_factory) -> None:
+    values = np.tile(np.arange(1, 9), (2, 1))
+    weights = np.tile(np.arange(8, 0, -1), (2, 1))
+    first = StackedEvolution(
+        _stack_configs(experiment_config_factory, 2), values, weights
+    )
+    second = StackedEvolution(
+        _stack_configs(experiment_config_factory, 2), values, weights
+    )
+    buffer = np.zeros_like(first.population)
+
+    first.step(out=buffer)
+    second.step()
+
+    assert first.population is buffer
+    np.testing.assert_array_equal(buffer, second.population)
+
+
+def test_stacked_evolution_rejects_mixed_shared_fields(
+    experiment_config_factory,
+) -> None:
+    configs = _stack_configs(experiment_config_factory, 2)
+    configs[1] = replace(configs[1], selection_type="rank")
+    with pytest.raises(ValueError, match="selection_type"):
+        StackedEvolution(configs, np.ones((2, 4)), np.ones((2, 4)))
+
+
+def test_stacked_evolution_rejects_pareto_selection(
+    experiment_config_factory,
+) -> None:
+    configs = [
+        replace(config, selection_type="pareto")
+        for config in _stack_configs(experiment_config_factory, 2)
+    ]
+    with pytest.raises(ValueError, match="not supported by stacked evolution"):
+        StackedEvolution(configs, np.ones((2, 4)), np.ones((2, 4)))
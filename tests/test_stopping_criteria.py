@@ -0,0 +1,78 @@
+"""Tests for early stopping criteria and their use by EvolutionRunner."""
+
+import csv
+import logging
+from dataclasses import replace
+
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.GenerationStats import GenerationStats
+from src.classes.StoppingCriteria import StoppingCriteria
+
+LOGGER = logging.LoggerAdapter(logging.getLogger("stopping tests"), {})
+
+
+def _stats(iteration: int, best: int) -> GenerationStats:
+    return GenerationStats(
+        iteration=iteration,
+        best_idx=0,
+        best_fitness=best,
+        best_weight=1,
+        avg_fitness=best / 2,
+        worst_fitness=0,
+        worst_weight=0,
+        identical_best_count=0,
+        genome="1",
+    )
+
+
+def test_optimum_criterion_requires_flag(experiment_config_factory) -> None:
+    disabled = StoppingCriteria(experiment_config_factory(), LOGGER, 50)
+    enabled = StoppingCriteria(
+        experiment_config_factory(stop_at_optimum=True), LOGGER, 50
+    )
+
+    assert disabled.check(_stats(0, 50)) is None
+    assert enabled.check(_stats(0, 49)) is None
+    assert enabled.check(_stats(1, 50)) == "optimum_reached"
+
+
+def test_lp_bound_stagnation_and_diversity(experiment_config_factory) -> None:
+    config = experiment_config_factory()
+    lp = StoppingCriteria(replace(config, lp_bound_tolerance=0.1), LOGGER, None, 100.7)
+    stagnation = StoppingCriteria(replace(config, stagnation_window=2), LOGGER)
+    diversity = StoppingCriteria(replace(config, diversity_floor=0.2), LOGGER)
+
+    assert lp.check(_stats(0, 89)) is None
+    assert lp.check(_stats(1, 90)) == "lp_bound_reached"
+    assert [stagnation.check(_stats(i, b)) for i, b in enumerate([5, 6, 6])] == [
+        None,
+        None,
+        None,
+    ]
+    assert stagnation.check(_stats(3, 6)) == "stagnation"
+    assert diversity.needs_diversity
+    assert diversity.check(_stats(0, 1), 0.5) is None
+    assert diversity.check(_stats(1, 1), 0.1) == "diversity_collapse"
+
+
+def test_runner_stops_on_stagnation_and_records_reason(
+    dataset_factory, run_config_factory
+) -> None:
+    dataset_factory("f_dummy.txt", [(10, 5), (8, 4)])
+
+    runner = EvolutionRunner(
+        run_config_factory(
+            "f_dummy.txt",
+            generations=50,
+            mutation_probability=0.0,
+            stagnation_window=3,
+        ),
+        report=False,
+    )
+    runner.evolve()
+
+    csv_path = runner.paths.get_output_path() / f"{runner.paths.filename_constant}.csv"
+    with open(csv_path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert ["# stop_reason", "stagnation"] in rows
+    assert runner.last_stats.iteration < 50
@@ -0,0 +1,103 @@
+"""Tests for running configuration sweeps on a process pool."""
+
+import csv
+from multiprocessing import shared_memory
+
+import pytest
+from src.classes.EvolutionRunner import EvolutionRunner
+from src.classes.SweepExecutor import SweepExecutor, expand_grid
+
+
+@pytest.fixture
+def base_config(dataset_factory) -> dict:
+    dataset_factory("f_sweep", [(10, 5), (8, 4), (3, 3), (7, 6), (2, 1), (9, 7)])
+    return {
+        "data_filename": "f_sweep",
+        "population_size": 6,
+        "generations": 4,
+        "max_weight": 15,
+        "seed": 1,
+        "selection_type": "tournament",
+        "crossover_type": "one",
+        "crossover_probability": 0.8,
+        "mutation_probability": 0.1,
+        "penalty": 0.5,
+        "experiment_identifier": 9,
+        "log_level": "WARNING",
+    }
+
+
+def test_expand_grid_builds_every_combination() -> None:
+    configs = expand_grid({"a": 0, "b": 0}, {"a": [1, 2], "b": [3, 4, 5]})
+    assert [(c["a"], c["b"]) for c in configs] == [
+        (1, 3),
+        (1, 4),
+        (1, 5),
+        (2, 3),
+        (2, 4),
+        (2, 5),
+    ]
+
+
+def test_sweep_runs_jobs_in_separate_run_directories(base_config, tmp_path) -> None:
+    sweep = SweepExecutor.from_grid(
+        base_config,
+        {"mutation_probability": [0.05, 0.2]},
+        seeds=[1, 2],
+        max_workers=2,
+    )
+    rows = sweep.run()
+
+    assert [row["job"] for row in rows] == [0, 1, 2, 3]
+    assert [(row["mutation_probability"], row["seed"]) for row in rows] == [
+        (0.05, 1),
+        (0.05, 2),
+        (0.2, 1),
+        (0.2, 2),
+    ]
+    # Same configuration and seed in every job: names differ only by job index.
+    assert len({row["run"] for row in rows}) == 4
+    for row in rows:
+        output = tmp_path / "run_output" / row["run"] / "output"
+        assert (output / f"{row['run']}.csv").exists()
+        assert row["stop_reason"] == "generations_completed"
+        assert row["evaluations"] == 6 * 5
+
+    reference = EvolutionRunner(
+        {**base_config, "mutation_probability": 0.2, "seed": 2}, report=False
+    )
+    with reference:
+        list(reference.steps())
+    assert rows[3]["best_fitness"] == reference.last_stats.best_fitness
+
+    assert sweep.summary_path is not None
+    with open(sweep.summary_path, newline="") as file:
+        summary = list(csv.DictReader(file))
+    assert [row["run"] for row in summary] == [row["run"] for row in rows]
+    assert summary[0]["mutation_probability"] == "0.05"
+
+
+def test_shared_instance_is_released(base_config, monkeypatch) -> None:
+    created = []
+    original = shared_memory.SharedMemory
+
+    def tracking(*args, **kwargs):
+        memory = original(*args, **kwargs)
+        if kwargs.get("create"):
+            created.append(memory.name)
+        return memory
+
+    monkeypatch.setattr(
+        "src.classes.SweepExecutor.shared_memory.SharedMemory", tracking
+    )
+    SweepExecutor([base_config], max_workers=1).run()
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        original(name=created[0])
+
+
+def test_invalid_configuration_fails_before_any_job(base_config) -> None:
+    with pytest.raises(ValueError, match="Population has to be even!"):
+        SweepExecutor.from_grid(base_config, {"population_size": [6, 7]})
+    with pytest.raises(ValueError, match="at least one configuration"):
+        SweepExecutor([])